@@ -0,0 +1,60 @@
+"""
+Benchmark of JSON decoders on an LPDB-sized response body.
+
+The body is a `match` response made of `tests/data/sample_match_data.json` repeated 1000 times,
+which matches the size of a full page of matches with their games.
+
+Usage: `python benchmarks/bench_json_decode.py [--repeat N]`
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+from typing import Any, Callable
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_body(rows: int) -> bytes:
+    with open(os.path.join(ROOT_DIR, "tests/data/sample_match_data.json")) as f:
+        match = json.load(f)
+    return json.dumps({"result": [match] * rows}).encode()
+
+
+def get_decoders() -> dict[str, Callable[[bytes], Any]]:
+    decoders: dict[str, Callable[[bytes], Any]] = {"json": json.loads}
+    try:
+        import orjson
+
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoders["msgspec"] = msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+    return decoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = load_body(args.rows)
+    print(f"Body: {len(body) / 1024 / 1024:.2f} MiB, {args.rows} rows")
+
+    baseline = None
+    for name, decode in get_decoders().items():
+        elapsed = min(timeit.repeat(lambda: decode(body), number=1, repeat=args.repeat))
+        baseline = baseline or elapsed
+        print(f"{name:>8}: {elapsed * 1000:8.2f} ms/page  ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
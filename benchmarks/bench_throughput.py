@@ -0,0 +1,100 @@
+"""
+Benchmark of the throughput of fetching a large query, against the in-memory fake LPDB backend.
+
+Fetches `--rows` results through a backend answering each request after `--latency` seconds, with:
+
+- `iter_pages`: one page at a time with offsets
+- `keyset`: one page at a time with `keyset`
+- `fetch_many`: all pages at once from `--workers` threads
+- `async`: all pages at once with `AsyncLpdbSession.make_bulk_request`
+
+Usage: `python benchmarks/bench_throughput.py [--rows N] [--latency SECONDS] [--workers N]`
+"""
+
+import argparse
+import asyncio
+import time
+
+from typing import Any, Callable
+
+import lpdb_python as lpdb
+from lpdb_python.async_session import AsyncLpdbSession
+from lpdb_python.testing import AsyncFakeTransport, FakeLpdbBackend, FakeTransport
+
+
+def make_backend(rows: int, latency: float) -> FakeLpdbBackend:
+    backend = FakeLpdbBackend(latency=latency)
+    backend.add_results(
+        "match",
+        "leagueoflegends",
+        (
+            {
+                "objectname": f"match_{i:07d}",
+                "date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 12:00:00",
+                "bestof": i % 5 + 1,
+            }
+            for i in range(rows)
+        ),
+    )
+    return backend
+
+
+def measure(fetch: Callable[[], list[Any]]) -> tuple[float, int]:
+    start = time.perf_counter()
+    rows = len(fetch())
+    return time.perf_counter() - start, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    backend = make_backend(args.rows, args.latency)
+    session = lpdb.LpdbSession("", transport=FakeTransport(backend))
+    page_size = lpdb.LpdbSession.MAX_LIMIT
+    pages = [
+        lpdb.LpdbRequest(
+            "match",
+            "leagueoflegends",
+            limit=page_size,
+            offset=offset,
+            order="objectname asc",
+        )
+        for offset in range(0, args.rows, page_size)
+    ]
+
+    async def fetch_async() -> list[Any]:
+        async with AsyncLpdbSession(
+            "", transport=AsyncFakeTransport(backend)
+        ) as async_session:
+            return await async_session.make_bulk_request(
+                "match",
+                "leagueoflegends",
+                order="objectname asc",
+                max_concurrency=args.workers,
+            )
+
+    print(f"{args.rows} rows, {args.latency * 1000:.0f} ms per request")
+    for name, fetch in {
+        "iter_pages": lambda: list(
+            session.iter_request("match", "leagueoflegends", order="objectname asc")
+        ),
+        "keyset": lambda: list(
+            session.iter_request("match", "leagueoflegends", keyset="objectname")
+        ),
+        "fetch_many": lambda: [
+            result
+            for page in session.fetch_many(pages, max_workers=args.workers)
+            for result in page
+        ],
+        "async": lambda: asyncio.run(fetch_async()),
+    }.items():
+        elapsed, rows = measure(fetch)
+        print(f"{name:>10}: {elapsed:6.2f} s, {rows / elapsed:9.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of the memory used by data type wrappers.
+
+Wraps `--rows` copies of a `placement`-like row and reports the memory allocated for the wrappers, measured both by
+`tracemalloc` and by the growth of the resident set size (RSS, Linux only), for:
+
+- `dict`: wrappers with a `__dict__` that copy the raw row, as the wrappers were before using `__slots__`
+- `copy`: the default wrappers, which copy the raw row
+- `borrow`: wrappers created with `copy=False`, which share the raw row
+
+Usage: `python benchmarks/bench_wrapper_memory.py [--rows N]`
+"""
+
+import argparse
+import gc
+import os
+import tracemalloc
+
+from typing import Any, Callable, Optional
+
+import lpdb_python as lpdb
+
+
+class DictPlacement:
+    """
+    Placement wrapper as it was before using `__slots__`.
+    """
+
+    def __init__(self, raw: dict[str, Any]):
+        self.__raw = raw.copy()
+
+
+def make_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "pageid": i,
+            "pagename": f"Tournament/{i // 16}",
+            "namespace": 0,
+            "objectname": f"ranking_{i}",
+            "tournament": f"Tournament {i // 16}",
+            "placement": str(i % 16 + 1),
+            "prizemoney": i * 10,
+            "opponentname": f"Team {i % 500}",
+            "opponenttype": "team",
+            "date": "2025-01-01 00:00:00",
+            "extradata": {},
+            "wiki": "leagueoflegends",
+        }
+        for i in range(rows)
+    ]
+
+
+def get_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def measure(wrap: Callable[[dict[str, Any]], Any], rows: list[dict[str, Any]]):
+    # RSS is measured without tracemalloc, which allocates memory of its own
+    gc.collect()
+    rss_before = get_rss()
+    wrapped = [wrap(row) for row in rows]
+    rss_after = get_rss()
+    del wrapped
+    gc.collect()
+    tracemalloc.start()
+    wrapped = [wrap(row) for row in rows]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del wrapped
+    rss = None if rss_before is None else rss_after - rss_before
+    return allocated, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"{args.rows} rows, memory per 100k wrapped rows")
+    for name, wrap in {
+        "dict": DictPlacement,
+        "copy": lpdb.Placement,
+        "borrow": lambda row: lpdb.Placement(row, copy=False),
+    }.items():
+        allocated, rss = measure(wrap, rows)
+        scale = 100_000 / args.rows / 1024 / 1024
+        rss_text = "n/a" if rss is None else f"{rss * scale:7.2f} MiB"
+        print(
+            f"{name:>8}: allocated {allocated * scale:7.2f} MiB, RSS growth {rss_text}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Python interface for Liquipedia Database (LPDB) API
 
 import importlib.metadata as _metadata
 
+from .cache import LpdbCache, MemoryCache, SqliteCache
 from .defs import (
     OpponentType,
     Broadcasters,
@@ -23,8 +24,20 @@ from .defs import (
     Tournament,
     Transfer,
     TeamTemplate,
+    LpdbResults,
+)
+from .rate_limit import LpdbRateLimiter
+from .teamtemplate import TeamTemplateIndex, TeamTemplateResolver
+from .transport import TransportConfig
+from .session import (
+    LpdbError,
+    LpdbHttpError,
+    LpdbRateLimitError,
+    LpdbRequest,
+    LpdbWarning,
+    LpdbSession,
+    RetryPolicy,
 )
-from .session import LpdbError, LpdbWarning, LpdbSession
 
 __all__ = [
     "OpponentType",
@@ -32,15 +45,24 @@ __all__ = [
     "Company",
     "Datapoint",
     "ExternalMediaLink",
+    "LpdbCache",
     "LpdbError",
+    "LpdbHttpError",
+    "LpdbRateLimitError",
+    "LpdbRateLimiter",
+    "LpdbRequest",
+    "LpdbResults",
     "LpdbWarning",
     "LpdbSession",
     "Match",
+    "MemoryCache",
     "MatchGame",
     "MatchOpponent",
     "Placement",
     "Player",
+    "RetryPolicy",
     "Series",
+    "SqliteCache",
     "SquadPlayer",
     "StandingsEntry",
     "StandingsTable",
@@ -48,6 +70,9 @@ __all__ = [
     "Tournament",
     "Transfer",
     "TeamTemplate",
+    "TeamTemplateIndex",
+    "TeamTemplateResolver",
+    "TransportConfig",
 ]
 
 try:
@@ -1,3 +1,5 @@
 from .async_session import AsyncLpdbSession
+from .teamtemplate import AsyncTeamTemplateResolver
+from .transport import AiohttpTransport
 
-__all__ = ["AsyncLpdbSession"]
+__all__ = ["AiohttpTransport", "AsyncLpdbSession", "AsyncTeamTemplateResolver"]
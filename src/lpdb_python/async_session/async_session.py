@@ -1,11 +1,36 @@
 from contextlib import AbstractAsyncContextManager
+import asyncio
+import os
 from datetime import date
+from http import HTTPStatus
 from types import TracebackType
-from typing import Any, Literal, Optional, override
+from typing import Any, AsyncIterator, Iterable, Literal, Optional, override
 
-import aiohttp
-
-from ..session import AbstractLpdbSession, LpdbDataType
+from ..cache import LpdbCache
+from ..defs import DATA_TYPE_WRAPPERS, LpdbBaseResponseData, LpdbResults
+from ..rate_limit import LpdbRateLimiter
+from ..streaming import ResultStreamParser
+from ..teamtemplate import TeamTemplateIndex
+from ..transport import AsyncTransport, TransportConfig, TransportResponse
+from .transport import AiohttpTransport
+from ..session import (
+    _Acquire,
+    _CacheLookup,
+    _CacheStore,
+    _Coalesce,
+    _Open,
+    _PageCursor,
+    _Request,
+    _Revalidate,
+    _Send,
+    _Sleep,
+    _Steps,
+    AbstractLpdbSession,
+    JsonLoads,
+    LpdbDataType,
+    LpdbRequest,
+    RetryPolicy,
+)
 
 __all__ = ["AsyncLpdbSession"]
 
@@ -15,19 +40,55 @@ class AsyncLpdbSession(AbstractLpdbSession, AbstractAsyncContextManager):
     Asynchronous implementation of a LPDB session
     """
 
-    __session: aiohttp.ClientSession
-
-    def __init__(self, api_key: str, base_url=AbstractLpdbSession.BASE_URL):
+    def __init__(
+        self,
+        api_key: str,
+        base_url=AbstractLpdbSession.BASE_URL,
+        rate_limiter: Optional[LpdbRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[LpdbCache] = None,
+        coalesce_requests: bool = False,
+        team_template_index: Optional[TeamTemplateIndex] = None,
+        wikis_ttl: float = 24 * 60 * 60,
+        wikis_cache_path: Optional[str | os.PathLike[str]] = None,
+        json_loads: Optional[JsonLoads] = None,
+        transport_config: Optional[TransportConfig] = None,
+        transport: Optional[AsyncTransport] = None,
+    ):
         """
         Creates a new AsyncLpdbSession with the specified API key.
 
         :param api_key: API key for LPDB
         :param base_url: Base URL of LPDB API endpoint
+        :param rate_limiter: rate limiter to wait on before each request, requests are not limited if not supplied
+        :param retry_policy: policy for retrying failed requests, failed requests are not retried if not supplied
+        :param cache: cache to serve repeated requests from, responses are not cached if not supplied
+        :param coalesce_requests: whether identical requests made concurrently share a single HTTP request,
+            in which case they also share the returned result
+        :param team_template_index: index to look up and record team templates requested with a date
+        :param wikis_ttl: time in seconds for which the set of wikis fetched by `get_wikis` is reused
+        :param wikis_cache_path: file to persist the set of wikis fetched by `get_wikis` to
+        :param json_loads: function decoding response bodies, raising `ValueError` on invalid JSON; if not supplied,
+            orjson or msgspec is used when installed, and the standard `json` module otherwise
+        :param transport_config: configuration of the connection pool, the default configuration is used if not
+            supplied
+        :param transport: transport to send requests with, an `AiohttpTransport` configured by `transport_config` if
+            not supplied
         """
-        super().__init__(api_key, base_url=base_url)
-        self.__session = aiohttp.ClientSession(
-            self._base_url, headers=self._get_header()
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            team_template_index=team_template_index,
+            wikis_ttl=wikis_ttl,
+            wikis_cache_path=wikis_cache_path,
+            json_loads=json_loads,
         )
+        self.__transport = transport or AiohttpTransport(transport_config)
+        self.__background: set[asyncio.Task] = set()
 
     def __enter__(self) -> None:
         raise TypeError("Use async with instead")
@@ -48,23 +109,83 @@ class AsyncLpdbSession(AbstractLpdbSession, AbstractAsyncContextManager):
     ) -> None:
         await self.close()
 
-    @staticmethod
-    async def get_wikis() -> set[str]:
-        async with aiohttp.ClientSession("https://liquipedia.net/") as session:
-            async with session.get(
-                "api.php",
-                headers={"accept": "application/json", "accept-encoding": "gzip"},
-            ) as response:
-                wikis = await response.json()
-                return set(wikis["allwikis"].keys())
+    @override
+    async def warmup(self, connections: int = 1) -> None:
+        await self.__transport.warmup(self._base_url, connections, self._get_header())
+
+    @override
+    async def get_wikis(self) -> set[str]:
+        return await self.__run(self._wikis_steps())
 
     @staticmethod
-    async def __handle_response(
-        response: aiohttp.ClientResponse,
-    ) -> list[dict[str, Any]]:
-        return AbstractLpdbSession._parse_results(
-            response.status, await response.json()
+    async def fetch_wikis() -> set[str]:
+        """
+        Fetches the set of all available wikis without creating a session first. The set is not cached.
+
+        :return: set of all available wiki names
+        """
+        async with AsyncLpdbSession("") as session:
+            return await session.get_wikis()
+
+    async def __run[T](self, steps: _Steps[T]) -> T:
+        result = None
+        error = None
+        while True:
+            try:
+                step = steps.send(result) if error is None else steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = await self.__perform(step), None
+            except BaseException as step_error:
+                result, error = None, step_error
+
+    async def __perform(self, step: Any) -> Any:
+        if isinstance(step, _Send):
+            return await self.__transport.get(
+                step.url, params=step.params, headers=step.headers
+            )
+        elif isinstance(step, _Acquire):
+            await self._rate_limiter.acquire_async(step.wiki, step.table)
+        elif isinstance(step, _Sleep):
+            await asyncio.sleep(step.delay)
+        elif isinstance(step, _CacheLookup):
+            return await self._cache.lookup_async(step.endpoint, step.key)
+        elif isinstance(step, _CacheStore):
+            await self._cache.set_async(
+                step.endpoint, step.key, step.value, size=step.size
+            )
+        elif isinstance(step, _Coalesce):
+            return await self.__coalesce(step.request)
+        elif isinstance(step, _Revalidate):
+            task = asyncio.create_task(self.__run(self._refresh_steps(step.request)))
+            self.__background.add(task)
+            task.add_done_callback(self.__background.discard)
+        elif isinstance(step, _Open):
+            response = await self.__transport.stream(
+                step.url,
+                params=step.params,
+                headers=step.headers,
+                chunk_size=step.chunk_size,
+            )
+            if response.status == HTTPStatus.OK:
+                return response
+            async with response:
+                return TransportResponse(
+                    response.status, response.headers, await response.read()
+                )
+        else:
+            raise TypeError(f"Unknown step: {step!r}")
+
+    async def __coalesce(self, request: _Request) -> list[dict[str, Any]]:
+        in_flight, is_owner = self._start_in_flight(
+            request,
+            lambda: asyncio.ensure_future(self.__run(self._load_steps(request))),
         )
+        if is_owner:
+            in_flight.add_done_callback(lambda _: self._end_in_flight(request))
+        # Shielded so that a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(in_flight)
 
     @override
     async def make_request(
@@ -79,22 +200,308 @@ class AsyncLpdbSession(AbstractLpdbSession, AbstractAsyncContextManager):
         groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
         **kwargs,
     ) -> list[dict[str, Any]]:
-        if not AbstractLpdbSession._validate_datatype_name(lpdb_datatype):
-            raise ValueError(f'Invalid LPDB data type: "{lpdb_datatype}"')
-        async with self.__session.get(
+        request = self._get_query_request(
             lpdb_datatype,
-            params=AbstractLpdbSession._parse_params(
-                wiki=wiki,
-                limit=limit,
-                offset=offset,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        return await self.__run(self._get_steps(request))
+
+    @override
+    async def make_typed_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> LpdbResults[LpdbBaseResponseData]:
+        results = await self.make_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        return LpdbResults(DATA_TYPE_WRAPPERS[lpdb_datatype], results)
+
+    @override
+    async def fetch_many(
+        self,
+        lpdb_requests: Iterable[LpdbRequest],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[list[dict[str, Any]] | Exception]:
+        lpdb_requests = list(lpdb_requests)
+        semaphore = asyncio.Semaphore(max_workers or max(len(lpdb_requests), 1))
+
+        async def request(lpdb_request: LpdbRequest) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.__run(
+                    self._get_steps(self._get_batch_request(lpdb_request))
+                )
+
+        tasks = [
+            asyncio.ensure_future(request(lpdb_request))
+            for lpdb_request in lpdb_requests
+        ]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    @override
+    async def make_fanout_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wikis: list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        lpdb_requests, order, added_fields = AbstractLpdbSession._get_fanout_requests(
+            lpdb_datatype,
+            wikis,
+            limit,
+            offset,
+            conditions,
+            query,
+            order,
+            groupby,
+            kwargs,
+        )
+        results = await self.fetch_many(lpdb_requests, max_workers=concurrency)
+        return AbstractLpdbSession._remove_fields(
+            AbstractLpdbSession._merge_results(results, order, limit, offset),
+            added_fields,
+        )
+
+    @override
+    async def iter_pages(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        cursor = _PageCursor(page_size, offset, conditions, query, order, keyset)
+        while not cursor.done:
+            page = await self.make_request(
+                lpdb_datatype, wiki, groupby=groupby, **cursor.params, **kwargs
+            )
+            page = cursor.advance(page)
+            if len(page) != 0:
+                yield page
+
+    @override
+    async def iter_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> AsyncIterator[dict[str, Any]]:
+        async for page in self.iter_pages(
+            lpdb_datatype,
+            wiki,
+            page_size=page_size,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            keyset=keyset,
+            **kwargs,
+        ):
+            for result in page:
+                yield result
+
+    @override
+    async def stream_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> AsyncIterator[dict[str, Any]]:
+        request = self._get_query_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        async with await self.__run(self._stream_steps(request)) as response:
+            parser = ResultStreamParser()
+            async for chunk in response.chunks:
+                for row in AbstractLpdbSession._parse_stream_chunk(
+                    parser, response.status, chunk
+                ):
+                    yield row
+            for row in AbstractLpdbSession._parse_results(
+                response.status, parser.close()
+            ):
+                yield row
+
+    async def make_bulk_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        max_concurrency: int = 4,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetches all results of an LPDB query, requesting multiple pages concurrently.
+
+        The total number of results is queried first with `make_count_request`, and the pages covering them are
+        then requested with at most `max_concurrency` requests in flight at a time.
+        An `order` should be supplied so that the results are split into pages consistently.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki to query
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param page_size: the amount of results requested per page, capped at `MAX_LIMIT`
+        :param max_concurrency: the maximum number of requests in flight at a time
+
+        :return: result of the query, in the same order as the pages
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied, or if `max_concurrency` is not positive
+        :raises LpdbError: if something went wrong with the request
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        page_size = min(page_size, AbstractLpdbSession.MAX_LIMIT)
+        total = await self.make_count_request(
+            lpdb_datatype, wiki, conditions=conditions
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_page(offset: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.make_request(
+                    lpdb_datatype,
+                    wiki,
+                    limit=page_size,
+                    offset=offset,
+                    conditions=conditions,
+                    query=query,
+                    order=order,
+                    **kwargs,
+                )
+
+        tasks = [
+            asyncio.ensure_future(fetch_page(offset))
+            for offset in range(0, total, page_size)
+        ]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [result for page in pages for result in page]
+
+    @override
+    async def make_raw_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> bytes:
+        request = self._get_query_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        return await self.__run(self._raw_steps(request))
+
+    @override
+    async def iter_raw_pages(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str,
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        page_size = min(page_size, AbstractLpdbSession.MAX_LIMIT)
+        count = await self.make_count_request(
+            lpdb_datatype, wiki, conditions=conditions
+        )
+        for page_offset in range(offset, count, page_size):
+            yield await self.make_raw_request(
+                lpdb_datatype,
+                wiki,
+                limit=page_size,
+                offset=page_offset,
                 conditions=conditions,
                 query=query,
                 order=order,
-                groupby=groupby,
                 **kwargs,
-            ),
-        ) as response:
-            return await AsyncLpdbSession.__handle_response(response)
+            )
 
     @override
     async def make_count_request(
@@ -112,30 +519,18 @@ class AsyncLpdbSession(AbstractLpdbSession, AbstractAsyncContextManager):
     async def get_team_template(
         self, wiki: str, template: str, date: Optional[date] = None
     ) -> Optional[dict[str, Any]]:
-        params = {
-            "wiki": wiki,
-            "template": template,
-        }
-        if date is not None:
-            params["date"] = date.isoformat()
-        async with self.__session.get("teamtemplate", params=params) as response:
-            parsed_response = await AsyncLpdbSession.__handle_response(response)
-            if parsed_response[0] is None:
-                return None
-            return parsed_response[0]
+        return await self.__run(self._team_template_steps(wiki, template, date))
 
     @override
     async def get_team_template_list(
         self, wiki: str, pagination: int = 1
     ) -> list[dict[str, Any]]:
-        async with self.__session.get(
-            "teamtemplatelist",
-            params={"wiki": wiki, "pagination": pagination},
-        ) as response:
-            return await AsyncLpdbSession.__handle_response(response)
+        return await self.__run(self._team_template_list_steps(wiki, pagination))
 
     async def close(self):
         """
         Closes this AsyncLpdbSession.
         """
-        await self.__session.close()
+        for task in list(self.__background):
+            task.cancel()
+        await self.__transport.close()
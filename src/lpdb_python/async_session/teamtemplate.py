@@ -0,0 +1,63 @@
+import asyncio
+
+from datetime import date
+from typing import Any, Iterable, Optional, override
+
+from ..teamtemplate import AbstractTeamTemplateResolver, TeamTemplateQuery
+from .async_session import AsyncLpdbSession
+
+__all__ = ["AsyncTeamTemplateResolver"]
+
+
+class AsyncTeamTemplateResolver(AbstractTeamTemplateResolver):
+    """
+    Asynchronous resolver of team templates for a single wiki.
+    """
+
+    def __init__(self, session: AsyncLpdbSession, wiki: str):
+        """
+        Creates a new AsyncTeamTemplateResolver.
+
+        :param session: the session to make requests with
+        :param wiki: the wiki to resolve team templates for
+        """
+        super().__init__(wiki)
+        self.__session = session
+        self.__lock = asyncio.Lock()
+
+    async def __get_team_template_pages(self) -> list[list[dict[str, Any]]]:
+        pages = []
+        while True:
+            page = await self.__session.get_team_template_list(
+                self.wiki, pagination=len(pages) + 1
+            )
+            if len(page) == 0:
+                return pages
+            pages.append(page)
+
+    @override
+    async def resolve(
+        self, queries: Iterable[TeamTemplateQuery]
+    ) -> dict[TeamTemplateQuery, Optional[dict[str, Any]]]:
+        queries = list(queries)
+        async with self.__lock:
+            if self._index is None and AbstractTeamTemplateResolver._needs_index(
+                queries
+            ):
+                self._build_index(await self.__get_team_template_pages())
+            missing = self._missing_dated(queries)
+            team_templates = await asyncio.gather(
+                *[
+                    self.__session.get_team_template(self.wiki, template, template_date)
+                    for template, template_date in missing
+                ]
+            )
+            self._dated.update(zip(missing, team_templates))
+            return self._collect(queries)
+
+    @override
+    async def get(
+        self, template: str, date: Optional[date] = None
+    ) -> Optional[dict[str, Any]]:
+        query = template if date is None else (template, date)
+        return (await self.resolve([query]))[query]
@@ -0,0 +1,105 @@
+import asyncio
+
+from typing import Any, Mapping, Optional, override
+
+import aiohttp
+
+from ..transport import (
+    AsyncStreamedResponse,
+    AsyncTransport,
+    TransportConfig,
+    TransportResponse,
+)
+
+__all__ = ["AiohttpTransport"]
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Transport sending requests with `aiohttp`, the default transport of `AsyncLpdbSession`.
+    """
+
+    def __init__(self, transport_config: Optional[TransportConfig] = None):
+        """
+        Creates a new AiohttpTransport. It must be created while an event loop is running.
+
+        :param transport_config: configuration of the connection pool, the default configuration is used if not
+            supplied
+        """
+        self.__session = aiohttp.ClientSession(
+            connector=AiohttpTransport.__create_connector(
+                transport_config or TransportConfig()
+            )
+        )
+
+    @staticmethod
+    def __create_connector(transport_config: TransportConfig) -> aiohttp.TCPConnector:
+        options: dict[str, Any] = {
+            "limit_per_host": transport_config.pool_maxsize_per_host or 0,
+            "use_dns_cache": transport_config.dns_cache_ttl is not None,
+            "ttl_dns_cache": transport_config.dns_cache_ttl,
+            "force_close": not transport_config.keepalive,
+        }
+        if transport_config.pool_maxsize is not None:
+            options["limit"] = transport_config.pool_maxsize
+        if (
+            transport_config.keepalive
+            and transport_config.keepalive_timeout is not None
+        ):
+            options["keepalive_timeout"] = transport_config.keepalive_timeout
+        return aiohttp.TCPConnector(**options)
+
+    @override
+    async def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        async with self.__session.get(url, params=params, headers=headers) as response:
+            return TransportResponse(
+                response.status, response.headers, await response.read()
+            )
+
+    @override
+    async def stream(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncStreamedResponse:
+        response = await self.__session.get(url, params=params, headers=headers)
+        return AsyncStreamedResponse(
+            response.status,
+            response.headers,
+            response.content.iter_chunked(chunk_size),
+            close=response.release,
+        )
+
+    @override
+    async def warmup(
+        self,
+        url: str,
+        connections: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        if connections <= 0:
+            return
+        # The responses are only released once every connection is opened, so that none of them is reused
+        responses = await asyncio.gather(
+            *(self.__session.head(url, headers=headers) for _ in range(connections)),
+            return_exceptions=True,
+        )
+        errors = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                errors.append(response)
+            else:
+                response.release()
+        if len(errors) != 0:
+            raise errors[0]
+
+    @override
+    async def close(self) -> None:
+        await self.__session.close()
@@ -0,0 +1,482 @@
+"""
+Response caches for LPDB sessions.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from os import PathLike
+from typing import Any, Final, Mapping, NamedTuple, Optional, override
+
+__all__ = ["CachedResponse", "LpdbCache", "MemoryCache", "SqliteCache"]
+
+
+class CachedResponse(NamedTuple):
+    """
+    A response found in a cache.
+    """
+
+    value: list[dict[str, Any]]
+    """
+    The cached result
+    """
+    stale: bool
+    """
+    Whether the entry has expired, and should be refreshed after being served
+    """
+
+
+class LpdbCache(ABC):
+    """
+    Base class of response caches that can be supplied to an LPDB session.
+
+    Entries are identified by the endpoint that was requested (the data type, or a team template endpoint)
+    and a key built from the base URL of the session and the normalized request parameters.
+    """
+
+    DEFAULT_TTLS: Final[Mapping[str, float]] = {
+        "broadcasters": 60 * 60,
+        "company": 7 * 24 * 60 * 60,
+        "datapoint": 60 * 60,
+        "externalmedialink": 24 * 60 * 60,
+        "match": 5 * 60,
+        "placement": 60 * 60,
+        "player": 24 * 60 * 60,
+        "series": 7 * 24 * 60 * 60,
+        "squadplayer": 24 * 60 * 60,
+        "standingsentry": 5 * 60,
+        "standingstable": 5 * 60,
+        "team": 24 * 60 * 60,
+        "tournament": 60 * 60,
+        "transfer": 60 * 60,
+        "teamtemplate": 24 * 60 * 60,
+        "teamtemplatelist": 24 * 60 * 60,
+    }
+    """
+    Default time-to-live in seconds for each endpoint
+    """
+
+    @abstractmethod
+    def get(self, endpoint: str, key: str) -> Optional[list[dict[str, Any]]]:
+        """
+        Looks up a cached response.
+
+        :param endpoint: the requested endpoint
+        :param key: the key of the request
+
+        :return: the cached result, or `None` if there is no valid entry for the request
+        """
+        pass
+
+    @abstractmethod
+    def set(
+        self,
+        endpoint: str,
+        key: str,
+        value: list[dict[str, Any]],
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Stores a response.
+
+        :param endpoint: the requested endpoint
+        :param key: the key of the request
+        :param value: the result of the request
+        :param size: the size in bytes of the response body, if known
+        """
+        pass
+
+    async def get_async(
+        self, endpoint: str, key: str
+    ) -> Optional[list[dict[str, Any]]]:
+        """
+        Looks up a cached response from an asynchronous session.
+
+        :param endpoint: the requested endpoint
+        :param key: the key of the request
+
+        :return: the cached result, or `None` if there is no valid entry for the request
+        """
+        return self.get(endpoint, key)
+
+    async def set_async(
+        self,
+        endpoint: str,
+        key: str,
+        value: list[dict[str, Any]],
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Stores a response from an asynchronous session.
+
+        :param endpoint: the requested endpoint
+        :param key: the key of the request
+        :param value: the result of the request
+        :param size: the size in bytes of the response body, if known
+        """
+        self.set(endpoint, key, value, size=size)
+
+    def lookup(self, endpoint: str, key: str) -> Optional[CachedResponse]:
+        """
+        Looks up a cached response, including an expired one that may still be served while it is refreshed.
+
+        :param endpoint: the requested endpoint
+        :param key: the key of the request
+
+        :return: the cached response, or `None` if there is no servable entry for the request
+        """
+        value = self.get(endpoint, key)
+        if value is None:
+            return None
+        return CachedResponse(value, False)
+
+    async def lookup_async(self, endpoint: str, key: str) -> Optional[CachedResponse]:
+        """
+        Looks up a cached response from an asynchronous session, including an expired one that may still be served
+        while it is refreshed.
+
+        :param endpoint: the requested endpoint
+        :param key: the key of the request
+
+        :return: the cached response, or `None` if there is no servable entry for the request
+        """
+        value = await self.get_async(endpoint, key)
+        if value is None:
+            return None
+        return CachedResponse(value, False)
+
+
+class _MemoryEntry(NamedTuple):
+    value: list[dict[str, Any]]
+    size: int
+    expires: float
+
+
+class MemoryCache(LpdbCache):
+    """
+    In-process response cache with least recently used eviction.
+
+    The cache is bounded both by the number of entries and by the approximate size of the stored responses.
+    With `stale_while_revalidate`, an expired entry is still served for that many seconds while the session refreshes
+    it in the background.
+
+    Cached results are shared between callers, and should not be modified.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 60 * 60,
+        stale_while_revalidate: float = 0,
+    ):
+        """
+        Creates an empty in-memory response cache.
+
+        :param max_entries: the maximum number of stored responses
+        :param max_bytes: the maximum total size in bytes of the stored responses, measured by the size of their
+            response bodies, or of their JSON encoding when it is not supplied
+        :param ttls: time-to-live in seconds for each endpoint, overriding `DEFAULT_TTLS`
+        :param default_ttl: time-to-live in seconds for endpoints without a specified time-to-live
+        :param stale_while_revalidate: seconds after expiry during which an entry is served while being refreshed
+        """
+        self.ttls = dict(LpdbCache.DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.__entries: OrderedDict[tuple[str, str], _MemoryEntry] = OrderedDict()
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @override
+    def lookup(self, endpoint: str, key: str) -> Optional[CachedResponse]:
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get((endpoint, key))
+            if entry is None:
+                return None
+            elif now >= entry.expires + self.stale_while_revalidate:
+                self.__remove((endpoint, key))
+                return None
+            self.__entries.move_to_end((endpoint, key))
+        return CachedResponse(entry.value, now >= entry.expires)
+
+    @override
+    async def lookup_async(self, endpoint: str, key: str) -> Optional[CachedResponse]:
+        return self.lookup(endpoint, key)
+
+    @override
+    def get(self, endpoint: str, key: str) -> Optional[list[dict[str, Any]]]:
+        cached = self.lookup(endpoint, key)
+        if cached is None or cached.stale:
+            return None
+        return cached.value
+
+    @override
+    def set(
+        self,
+        endpoint: str,
+        key: str,
+        value: list[dict[str, Any]],
+        size: Optional[int] = None,
+    ) -> None:
+        if size is None:
+            size = len(json.dumps(value, separators=(",", ":")))
+        expires = time.monotonic() + self.ttls.get(endpoint, self.default_ttl)
+        with self.__lock:
+            self.__remove((endpoint, key))
+            if size > self.max_bytes:
+                return
+            self.__entries[(endpoint, key)] = _MemoryEntry(value, size, expires)
+            self.__size += size
+            while (
+                len(self.__entries) > self.max_entries or self.__size > self.max_bytes
+            ):
+                _, evicted = self.__entries.popitem(last=False)
+                self.__size -= evicted.size
+
+    def __remove(self, entry_key: tuple[str, str]) -> None:
+        entry = self.__entries.pop(entry_key, None)
+        if entry is not None:
+            self.__size -= entry.size
+
+    def clear(self) -> None:
+        """
+        Removes all entries from this cache.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+
+class SqliteCache(LpdbCache):
+    """
+    Persistent response cache stored in an SQLite database.
+
+    Each endpoint has its own time-to-live, and the least recently used entries are evicted once the total size
+    of the stored responses exceeds `max_size`. The database file can be shared by multiple processes.
+
+    The access times used for eviction are recorded in batches, on the next `set` or once `access_batch_size`
+    entries have been read, so reading an entry does not write to the database every time.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 60 * 60,
+        max_size: int = 256 * 1024 * 1024,
+        access_batch_size: int = 256,
+    ):
+        """
+        Opens an SQLite response cache, creating the database if it does not exist.
+
+        :param path: path to the database file
+        :param ttls: time-to-live in seconds for each endpoint, overriding `DEFAULT_TTLS`
+        :param default_ttl: time-to-live in seconds for endpoints without a specified time-to-live
+        :param max_size: the maximum total size in bytes of the stored responses
+        :param access_batch_size: the number of read entries whose access times are recorded at once
+        """
+        self.ttls = dict(LpdbCache.DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.access_batch_size = access_batch_size
+        self.__accessed: dict[str, float] = {}
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.__connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """
+            )
+            self.__connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            # The total size is kept up to date by triggers, so that it is shared by every process using the file
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS total_size (size INTEGER NOT NULL)"
+            )
+            self.__connection.execute(
+                """
+                INSERT INTO total_size
+                SELECT COALESCE(SUM(size), 0) FROM responses
+                WHERE NOT EXISTS (SELECT 1 FROM total_size)
+                """
+            )
+            self.__connection.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses
+                BEGIN UPDATE total_size SET size = size + NEW.size; END
+                """
+            )
+            self.__connection.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses
+                BEGIN UPDATE total_size SET size = size + NEW.size - OLD.size; END
+                """
+            )
+            self.__connection.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses
+                BEGIN UPDATE total_size SET size = size - OLD.size; END
+                """
+            )
+            self.__connection.execute("COMMIT")
+        except BaseException:
+            self.__connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def __row_key(endpoint: str, key: str) -> str:
+        return f"{endpoint}\n{key}"
+
+    @override
+    def get(self, endpoint: str, key: str) -> Optional[list[dict[str, Any]]]:
+        row_key = SqliteCache.__row_key(endpoint, key)
+        now = time.time()
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires > ?",
+                (row_key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self.__accessed[row_key] = now
+            if len(self.__accessed) >= self.access_batch_size:
+                self.__flush_accesses()
+        return json.loads(row[0])
+
+    @override
+    def set(
+        self,
+        endpoint: str,
+        key: str,
+        value: list[dict[str, Any]],
+        size: Optional[int] = None,
+    ) -> None:
+        encoded = json.dumps(value, separators=(",", ":")).encode()
+        now = time.time()
+        expires = now + self.ttls.get(endpoint, self.default_ttl)
+        with self.__lock:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.__record_accesses()
+                self.__connection.execute(
+                    """
+                    INSERT INTO responses VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        value = excluded.value,
+                        size = excluded.size,
+                        expires = excluded.expires,
+                        accessed = excluded.accessed
+                    """,
+                    (
+                        SqliteCache.__row_key(endpoint, key),
+                        encoded,
+                        len(encoded),
+                        expires,
+                        now,
+                    ),
+                )
+                if self.__get_total_size() > self.max_size:
+                    self.__evict(now)
+                self.__connection.execute("COMMIT")
+            except BaseException:
+                self.__connection.execute("ROLLBACK")
+                raise
+
+    def __flush_accesses(self) -> None:
+        self.__connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.__record_accesses()
+            self.__connection.execute("COMMIT")
+        except BaseException:
+            self.__connection.execute("ROLLBACK")
+            raise
+
+    def __record_accesses(self) -> None:
+        if len(self.__accessed) == 0:
+            return
+        self.__connection.executemany(
+            "UPDATE responses SET accessed = MAX(accessed, ?) WHERE key = ?",
+            [(accessed, row_key) for row_key, accessed in self.__accessed.items()],
+        )
+        self.__accessed.clear()
+
+    def __get_total_size(self) -> int:
+        return self.__connection.execute("SELECT size FROM total_size").fetchone()[0]
+
+    def __evict(self, now: float) -> None:
+        self.__connection.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        if self.__get_total_size() <= self.max_size:
+            return
+        self.__connection.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS total
+                    FROM responses
+                )
+                WHERE total > ?
+            )
+            """,
+            (self.max_size,),
+        )
+
+    @override
+    async def get_async(
+        self, endpoint: str, key: str
+    ) -> Optional[list[dict[str, Any]]]:
+        return await asyncio.to_thread(self.get, endpoint, key)
+
+    @override
+    async def set_async(
+        self,
+        endpoint: str,
+        key: str,
+        value: list[dict[str, Any]],
+        size: Optional[int] = None,
+    ) -> None:
+        await asyncio.to_thread(self.set, endpoint, key, value, size)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from this cache.
+        """
+        with self.__lock:
+            self.__accessed.clear()
+            self.__connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Records the pending access times and closes the database connection of this cache.
+        """
+        with self.__lock:
+            if len(self.__accessed) != 0:
+                self.__flush_accesses()
+            self.__connection.close()
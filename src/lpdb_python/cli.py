@@ -0,0 +1,469 @@
+"""
+Command-line interface for dumping LPDB data.
+
+Usage: `lpdb dump <data type> <wiki> -o <output> [options]`, see `lpdb dump --help` for the options.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Optional, Sequence
+
+from .rate_limit import LpdbRateLimiter
+from .session import AbstractLpdbSession, LpdbError, RetryPolicy
+from .transport import AsyncTransport
+
+__all__ = ["main"]
+
+_FORMATS = ("ndjson", "csv", "parquet")
+
+
+def _get_format(args: argparse.Namespace) -> str:
+    if args.format is not None:
+        return args.format
+    extension = os.path.splitext(args.output)[1].lstrip(".").lower()
+    if extension in ("jsonl", "ndjson"):
+        return "ndjson"
+    elif extension in _FORMATS:
+        return extension
+    raise ValueError(
+        f'Cannot infer the format of "{args.output}", supply one with --format'
+    )
+
+
+def _get_query_fields(query: Optional[str]) -> Optional[list[str]]:
+    if query is None:
+        return None
+    return [field.strip() for field in query.split(",")]
+
+
+class _Checkpoint:
+    """
+    Progress of a dump, stored next to its output so that an interrupted dump can be resumed.
+    """
+
+    def __init__(self, path: str, dump: dict[str, Any]):
+        self.path = path
+        self.dump = dump
+        self.offset: int = dump["offset"]
+        self.rows = 0
+        self.writer: Optional[dict[str, Any]] = None
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as checkpoint_file:
+            stored = json.load(checkpoint_file)
+        if stored["dump"] != self.dump:
+            raise ValueError(
+                f'Checkpoint "{self.path}" belongs to a different dump, use --restart to discard it'
+            )
+        self.offset = stored["offset"]
+        self.rows = stored["rows"]
+        self.writer = stored["writer"]
+        return True
+
+    def save(self, offset: int, rows: int, writer: dict[str, Any]) -> None:
+        self.offset = offset
+        self.rows = rows
+        self.writer = writer
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(
+                {
+                    "dump": self.dump,
+                    "offset": offset,
+                    "rows": rows,
+                    "writer": writer,
+                },
+                checkpoint_file,
+            )
+        os.replace(temporary_path, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _Writer(ABC):
+    """
+    Writer of dumped results, which can resume from the state it had at a checkpoint.
+    """
+
+    def __init__(self, path: str, fields: Optional[list[str]]):
+        self.path = path
+        self.fields = fields
+
+    @abstractmethod
+    def open(self, state: Optional[dict[str, Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def write(self, page: list[dict[str, Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self) -> Optional[dict[str, Any]]:
+        """
+        Makes the written results durable, if possible.
+
+        :return: the state to resume from, or `None` if the written results are not durable yet
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class _TextWriter(_Writer):
+    def open(self, state: Optional[dict[str, Any]]) -> None:
+        if state is None:
+            self.file = open(self.path, "w", encoding="utf-8", newline="")
+            return
+        self.fields = state["fields"]
+        self.file = open(self.path, "r+", encoding="utf-8", newline="")
+        # Drops whatever was written after the checkpoint
+        self.file.truncate(state["size"])
+        self.file.seek(state["size"])
+
+    def commit(self) -> Optional[dict[str, Any]]:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return {"size": self.file.tell(), "fields": self.fields}
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _NdjsonWriter(_TextWriter):
+    def write(self, page: list[dict[str, Any]]) -> None:
+        for row in page:
+            if self.fields is not None:
+                row = {field: row.get(field) for field in self.fields}
+            self.file.write(json.dumps(row, ensure_ascii=False))
+            self.file.write("\n")
+
+
+class _CsvWriter(_TextWriter):
+    def write(self, page: list[dict[str, Any]]) -> None:
+        if len(page) == 0:
+            return
+        writer = csv.writer(self.file)
+        if self.fields is None:
+            self.fields = list(page[0].keys())
+        if self.file.tell() == 0:
+            writer.writerow(self.fields)
+        for row in page:
+            writer.writerow([_to_csv_value(row.get(field)) for field in self.fields])
+
+
+def _to_csv_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class _ParquetWriter(_Writer):
+    """
+    Writer of a Parquet dataset, a directory of Parquet files.
+
+    A Parquet file can only be read once it has been closed, so the results are durable only once the file they are
+    written to is closed, which happens every `rows_per_file` results.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fields: Optional[list[str]],
+        lpdb_datatype: str,
+        rows_per_file: int,
+    ):
+        super().__init__(path, fields)
+        self.lpdb_datatype = lpdb_datatype
+        self.rows_per_file = rows_per_file
+        self.parts = 0
+        self.exporter = None
+
+    def open(self, state: Optional[dict[str, Any]]) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        if state is not None:
+            self.parts = state["parts"]
+            self.fields = state["fields"]
+        # Removes the file that was being written when the dump was interrupted
+        for name in os.listdir(self.path):
+            if name.startswith("part-") and name.endswith(".parquet"):
+                if int(name[len("part-") : -len(".parquet")]) >= self.parts:
+                    os.remove(os.path.join(self.path, name))
+
+    def write(self, page: list[dict[str, Any]]) -> None:
+        from .export import _ParquetExporter
+
+        if self.exporter is None:
+            self.exporter = _ParquetExporter(
+                os.path.join(self.path, f"part-{self.parts:05d}.parquet"),
+                self.lpdb_datatype,
+                self.fields,
+                "zstd",
+            )
+        self.exporter.write(page)
+        self.fields = self.exporter.fields
+
+    def commit(self) -> Optional[dict[str, Any]]:
+        if self.exporter is not None and self.exporter.rows < self.rows_per_file:
+            return None
+        self.close()
+        return {"parts": self.parts, "fields": self.fields}
+
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
+            self.parts += 1
+
+
+def _get_writer(args: argparse.Namespace, output_format: str) -> _Writer:
+    fields = _get_query_fields(args.query)
+    if output_format == "ndjson":
+        return _NdjsonWriter(args.output, fields)
+    elif output_format == "csv":
+        return _CsvWriter(args.output, fields)
+    return _ParquetWriter(args.output, fields, args.datatype, args.rows_per_file)
+
+
+async def _dump(
+    args: argparse.Namespace, transport: Optional[AsyncTransport] = None
+) -> int:
+    from .async_session import AsyncLpdbSession
+
+    output_format = _get_format(args)
+    checkpoint = _Checkpoint(
+        args.checkpoint or f"{args.output.rstrip(os.sep)}.checkpoint",
+        {
+            "datatype": args.datatype,
+            "wiki": args.wiki,
+            "conditions": args.conditions,
+            "query": args.query,
+            "order": args.order,
+            "format": output_format,
+            "page_size": args.page_size,
+            "offset": args.offset,
+        },
+    )
+    if args.restart:
+        checkpoint.remove()
+    resumed = checkpoint.load()
+    writer = _get_writer(args, output_format)
+    writer.open(checkpoint.writer)
+    if resumed:
+        print(
+            f"Resuming from offset {checkpoint.offset} with {checkpoint.rows} results written",
+            file=sys.stderr,
+        )
+
+    rate_limiter = None if args.rate is None else LpdbRateLimiter(args.rate)
+    page_size = min(args.page_size, AbstractLpdbSession.MAX_LIMIT)
+    resumed_rows = checkpoint.rows
+    rows = resumed_rows
+    pages = 0
+    start = time.monotonic()
+    async with AsyncLpdbSession(
+        args.api_key,
+        base_url=args.base_url,
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(max_attempts=args.max_attempts),
+        transport=transport,
+    ) as session:
+
+        async def fetch_page(offset: int) -> list[dict[str, Any]]:
+            return await session.make_request(
+                args.datatype,
+                args.wiki,
+                limit=page_size,
+                offset=offset,
+                conditions=args.conditions,
+                query=args.query,
+                order=args.order,
+            )
+
+        total = await session.make_count_request(
+            args.datatype, args.wiki, conditions=args.conditions
+        )
+        # Pages are fetched concurrently but written in order
+        next_offset = checkpoint.offset
+        pending: deque[tuple[int, asyncio.Task]] = deque()
+        try:
+            while True:
+                while len(pending) < args.concurrency and next_offset < total:
+                    pending.append(
+                        (next_offset, asyncio.create_task(fetch_page(next_offset)))
+                    )
+                    next_offset += page_size
+                if len(pending) == 0:
+                    break
+                offset, task = pending.popleft()
+                page = await task
+                writer.write(page)
+                rows += len(page)
+                pages += 1
+                if len(page) == page_size and next_offset >= total:
+                    # More results were added since they were counted
+                    total = next_offset + page_size
+                state = writer.commit()
+                if state is not None:
+                    checkpoint.save(offset + page_size, rows, state)
+                if args.progress:
+                    print(
+                        f"\r{rows}/{max(total, rows)} results", end="", file=sys.stderr
+                    )
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+            # Whatever was written after the checkpoint is dropped when resuming
+            writer.close()
+            if args.progress:
+                print(file=sys.stderr)
+        elapsed = time.monotonic() - start
+        checkpoint.remove()
+
+        elapsed = max(elapsed, 1e-9)
+        print(
+            f"Dumped {rows} results to {args.output} ({output_format}), "
+            f"{pages} pages in this run\n"
+            f"Elapsed: {elapsed:.1f} s, {(rows - resumed_rows) / elapsed:.1f} results/s, "
+            f"{pages / elapsed:.2f} pages/s\n"
+            f"Retried requests: {session.retry_count}, "
+            f"rate limit errors: {session.rate_limit_count}",
+            file=sys.stderr,
+        )
+        if rate_limiter is not None:
+            print(
+                f"Throttled requests: {rate_limiter.throttled_count}, "
+                f"waited {rate_limiter.throttled_seconds:.1f} s",
+                file=sys.stderr,
+            )
+    return 0
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lpdb", description="Command-line interface for LPDB"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    dump = subparsers.add_parser(
+        "dump",
+        help="dump the results of a query to a file",
+        description="Dumps the results of a query to an NDJSON or CSV file, or a Parquet dataset. "
+        "A checkpoint is written after each page, so that an interrupted dump resumes where it stopped "
+        "when run again with the same arguments.",
+    )
+    dump.add_argument("datatype", help="the data type to query")
+    dump.add_argument("wiki", help="the wiki to query")
+    dump.add_argument("-o", "--output", required=True, help="the file to write")
+    dump.add_argument(
+        "-f",
+        "--format",
+        choices=_FORMATS,
+        help="the output format, inferred from the extension of the output if not supplied",
+    )
+    dump.add_argument("-c", "--conditions", help="the conditions for the query")
+    dump.add_argument("-q", "--query", help="the comma-separated fields to dump")
+    dump.add_argument(
+        "--order",
+        default="pageid asc, objectname asc",
+        help='the order of the results, such as "date desc" (default: %(default)s)',
+    )
+    dump.add_argument(
+        "--page-size",
+        type=int,
+        default=AbstractLpdbSession.MAX_LIMIT,
+        help="the number of results per request (default: %(default)s)",
+    )
+    dump.add_argument(
+        "--offset", type=int, default=0, help="the number of results to skip"
+    )
+    dump.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="the number of pages fetched concurrently (default: %(default)s)",
+    )
+    dump.add_argument(
+        "--rate",
+        type=float,
+        help="the maximum number of requests per second, not limited if not supplied",
+    )
+    dump.add_argument(
+        "--max-attempts",
+        type=int,
+        default=5,
+        help="the number of attempts made for each request (default: %(default)s)",
+    )
+    dump.add_argument(
+        "--rows-per-file",
+        type=int,
+        default=100_000,
+        help="the number of results per Parquet file, which is also how often Parquet dumps "
+        "are checkpointed (default: %(default)s)",
+    )
+    dump.add_argument(
+        "--checkpoint",
+        help="the checkpoint file (default: the output followed by .checkpoint)",
+    )
+    dump.add_argument(
+        "--restart",
+        action="store_true",
+        help="discard an existing checkpoint and start over",
+    )
+    dump.add_argument(
+        "--progress", action="store_true", help="print the progress of the dump"
+    )
+    dump.add_argument(
+        "--api-key",
+        default=os.environ.get("LPDB_API_KEY"),
+        help="the LPDB API key (default: the LPDB_API_KEY environment variable)",
+    )
+    dump.add_argument(
+        "--base-url",
+        default=AbstractLpdbSession.BASE_URL,
+        help="the base URL of the LPDB API (default: %(default)s)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the command-line interface.
+
+    :param argv: the command-line arguments, `sys.argv[1:]` if not supplied
+
+    :return: the exit status
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    if args.api_key is None:
+        parser.error("an API key is required, supply it with --api-key or LPDB_API_KEY")
+    if not AbstractLpdbSession._validate_datatype_name(args.datatype):
+        parser.error(f'invalid LPDB data type: "{args.datatype}"')
+    try:
+        return asyncio.run(_dump(args))
+    except (LpdbError, OSError, ValueError) as error:
+        print(f"lpdb: error: {error}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("lpdb: interrupted, run again to resume", file=sys.stderr)
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Columnar containers of LPDB query results, backed by NumPy arrays.
+
+This module requires NumPy, which can be installed with `pip install lpdb_python[columnar]`.
+"""
+
+import datetime
+
+from typing import Any, Final, Iterable, Optional
+
+import numpy as np
+
+from .dates import to_datetime64
+from .defs import _get_field_types, _NUMERIC_FIELDS, DATA_TYPE_WRAPPERS
+
+__all__ = ["ColumnarResults"]
+
+
+def _to_float(value: Any) -> float:
+    if value is None or value == "":
+        return np.nan
+    elif isinstance(value, str):
+        # Placements may be ranges such as "3-4"
+        try:
+            return float(value.split("-", 1)[0] if value[0] != "-" else value)
+        except ValueError:
+            return np.nan
+    return float(value)
+
+
+class ColumnarResults:
+    """
+    Results of LPDB queries stored as one array per field.
+
+    The type of each array is derived from the property of the same name in the wrapper of the data type:
+
+    - numeric fields are stored as `float64`, with missing values as `NaN`
+    - boolean fields are stored as `bool`
+    - date fields are stored as `datetime64[D]`, and datetime fields as `datetime64[s]` in UTC, with missing values
+      as `NaT`
+    - other fields are stored as `object` arrays of the raw values
+
+    Results are appended page by page, and the pages of a field are only concatenated when the field is accessed.
+    """
+
+    NUMERIC_FIELDS: Final[frozenset[str]] = _NUMERIC_FIELDS
+    """
+    Fields that are stored as numeric arrays in every data type
+    """
+
+    def __init__(self, lpdb_datatype: str, fields: Optional[Iterable[str]] = None):
+        """
+        Creates an empty columnar container.
+
+        :param lpdb_datatype: the data type of the results
+        :param fields: the fields to store, the fields of the first appended page if `None`
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        """
+        if lpdb_datatype not in DATA_TYPE_WRAPPERS:
+            raise ValueError(f'Invalid LPDB data type: "{lpdb_datatype}"')
+        self.lpdb_datatype = lpdb_datatype
+        self.fields: Optional[list[str]] = None if fields is None else list(fields)
+        self.__field_types = _get_field_types(DATA_TYPE_WRAPPERS[lpdb_datatype])
+        self.__chunks: dict[str, list[np.ndarray]] = dict()
+        self.__length = 0
+
+    @classmethod
+    def from_pages(
+        cls,
+        lpdb_datatype: str,
+        pages: Iterable[list[dict[str, Any]]],
+        fields: Optional[Iterable[str]] = None,
+    ) -> "ColumnarResults":
+        """
+        Creates a columnar container from pages of results, e.g. from `iter_pages`.
+
+        :param lpdb_datatype: the data type of the results
+        :param pages: the pages of results
+        :param fields: the fields to store, the fields of the first page if `None`
+
+        :return: the columnar container of all the results
+        """
+        results = cls(lpdb_datatype, fields)
+        for page in pages:
+            results.append(page)
+        return results
+
+    def __convert(self, field: str, values: list[Any]) -> np.ndarray:
+        field_type = self.__field_types.get(field)
+        if field in ColumnarResults.NUMERIC_FIELDS or field_type in (int, float):
+            try:
+                return np.array(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                return np.fromiter(map(_to_float, values), np.float64, len(values))
+        elif field_type is bool:
+            return np.fromiter(map(bool, values), np.bool_, len(values))
+        elif field_type is datetime.datetime:
+            return to_datetime64(values, "s")
+        elif field_type is datetime.date:
+            return to_datetime64(values, "D")
+        return np.fromiter(values, object, len(values))
+
+    def append(self, page: list[dict[str, Any]]) -> None:
+        """
+        Appends a page of results.
+
+        :param page: the results to append
+        """
+        if len(page) == 0:
+            return
+        if self.fields is None:
+            self.fields = list(page[0].keys())
+        for field in self.fields:
+            values = [row.get(field) for row in page]
+            self.__chunks.setdefault(field, []).append(self.__convert(field, values))
+        self.__length += len(page)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __contains__(self, field: str) -> bool:
+        return self.fields is not None and field in self.fields
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        if field not in self:
+            raise KeyError(field)
+        chunks = self.__chunks.get(field)
+        if not chunks:
+            return self.__convert(field, [])
+        if len(chunks) > 1:
+            chunks[:] = [np.concatenate(chunks)]
+        return chunks[0]
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        The array of each field
+        """
+        return {field: self[field] for field in self.fields or []}
+
+    def __repr__(self):
+        return f"ColumnarResults({self.lpdb_datatype}, {self.__length} results, fields={self.fields})"
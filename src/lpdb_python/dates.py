@@ -0,0 +1,123 @@
+"""
+Bulk parsing of LPDB dates and datetimes.
+
+LPDB returns dates as `YYYY-MM-DD` and datetimes as `YYYY-MM-DD hh:mm:ss` in UTC, and stores missing dates as dates
+in year 0, such as `0000-01-01` or `0000-00-00 00:00:00`. These, empty strings and invalid dates are parsed as
+missing values.
+"""
+
+import datetime
+
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "parse_date",
+    "parse_dates",
+    "parse_datetime",
+    "parse_datetimes",
+    "to_datetime64",
+]
+
+
+def _is_missing(value: Any) -> bool:
+    return not value or not isinstance(value, str) or value.startswith("0000")
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime.date]:
+    """
+    Parses an LPDB date. The time of a datetime is ignored.
+
+    :param value: the date
+
+    :return: the parsed date, or `None` if the date is missing or invalid
+    """
+    if _is_missing(value):
+        return None
+    try:
+        return datetime.date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime.datetime]:
+    """
+    Parses an LPDB datetime.
+
+    :param value: the datetime
+
+    :return: the parsed datetime in UTC, or `None` if the datetime is missing or invalid
+    """
+    if _is_missing(value):
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value).replace(tzinfo=datetime.UTC)
+    except ValueError:
+        return None
+
+
+def parse_dates(values: Iterable[Optional[str]]) -> list[Optional[datetime.date]]:
+    """
+    Parses a column of LPDB dates.
+
+    :param values: the dates
+
+    :return: the parsed dates, with `None` for missing or invalid dates
+    """
+    return [parse_date(value) for value in values]
+
+
+def parse_datetimes(
+    values: Iterable[Optional[str]],
+) -> list[Optional[datetime.datetime]]:
+    """
+    Parses a column of LPDB datetimes.
+
+    :param values: the datetimes
+
+    :return: the parsed datetimes in UTC, with `None` for missing or invalid datetimes
+    """
+    fromisoformat = datetime.datetime.fromisoformat
+    parsed = []
+    for value in values:
+        if _is_missing(value):
+            parsed.append(None)
+            continue
+        try:
+            parsed.append(fromisoformat(value).replace(tzinfo=datetime.UTC))
+        except ValueError:
+            parsed.append(None)
+    return parsed
+
+
+def to_datetime64(values: Iterable[Optional[str]], unit: str = "s") -> "np.ndarray":
+    """
+    Parses a column of LPDB dates or datetimes into a NumPy `datetime64` array in a single vectorized conversion.
+
+    This function requires NumPy.
+
+    :param values: the dates or datetimes
+    :param unit: the unit of the array, such as `D` for dates or `s` for datetimes
+
+    :return: the parsed array in UTC, with `NaT` for missing or invalid values
+    """
+    import numpy as np
+
+    strings = ["NaT" if _is_missing(value) else value for value in values]
+    dtype = np.dtype(f"datetime64[{unit}]")
+    try:
+        return np.array(strings, dtype=dtype)
+    except ValueError:
+        # At least one of the values is invalid, so they are converted one by one
+        return np.array([_to_datetime64(value, unit) for value in strings], dtype)
+
+
+def _to_datetime64(value: str, unit: str) -> "np.datetime64":
+    import numpy as np
+
+    try:
+        return np.datetime64(value, unit)
+    except ValueError:
+        return np.datetime64("NaT", unit)
@@ -5,9 +5,22 @@ Data type wrappers for data from LPDB queries.
 import datetime
 import json
 
+from collections.abc import Sequence
 from enum import StrEnum
-from functools import lru_cache
-from typing import Any, Optional, Union
+from functools import cache, lru_cache
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    get_args,
+    get_origin,
+    get_type_hints,
+    Iterator,
+    Optional,
+    overload,
+    Union,
+)
+
+from .dates import parse_date, parse_datetime
 
 __all__ = [
     "OpponentType",
@@ -28,25 +41,18 @@ __all__ = [
     "Tournament",
     "Transfer",
     "TeamTemplate",
+    "LpdbResults",
+    "DATA_TYPE_WRAPPERS",
 ]
 
 
 @lru_cache
-def _parseIsoDate(date_str: str) -> Optional[datetime.date]:
-    try:
-        return datetime.date.fromisoformat(date_str)
-    except ValueError:
-        return None
-
-
-@lru_cache
-def _parseIsoDateTime(datetime_str: str) -> Optional[datetime.datetime]:
-    try:
-        return datetime.datetime.fromisoformat(datetime_str).replace(
-            tzinfo=datetime.UTC
-        )
-    except ValueError:
-        return None
+def _parseTimezone(offset: str, name: Optional[str]) -> datetime.timezone:
+    sliced_offset = offset.split(":")
+    offset_delta = datetime.timedelta(
+        hours=int(sliced_offset[0]), minutes=int(sliced_offset[1])
+    )
+    return datetime.timezone(offset_delta, name=name)
 
 
 class OpponentType(StrEnum):
@@ -67,13 +73,22 @@ class LpdbBaseData:
     Base class of all LPDB data
     """
 
+    __slots__ = ("__raw",)
+
     __raw: dict[str, Any]
     """
     Raw data from LPDB in Python dict form
     """
 
-    def __init__(self, raw: dict[str, Any]):
-        self.__raw = raw.copy()
+    def __init__(self, raw: dict[str, Any], copy: bool = True):
+        """
+        Wraps LPDB data.
+
+        :param raw: the raw data
+        :param copy: whether to copy the raw data; if `False`, the wrapper shares the raw data with the caller,
+            which must not modify it while the wrapper is in use
+        """
+        self.__raw = raw.copy() if copy else raw
 
     def _rawGet(self, key: str):
         """
@@ -97,6 +112,8 @@ class LpdbBaseResponseData(LpdbBaseData):
     Base class of all LPDB response data
     """
 
+    __slots__ = ()
+
     @property
     def pageid(self) -> int:
         return self._rawGet("pageid")
@@ -127,6 +144,8 @@ class Broadcasters(LpdbBaseResponseData):
     Broadcaster data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return self._rawGet("id")
@@ -157,7 +176,7 @@ class Broadcasters(LpdbBaseResponseData):
 
     @property
     def date(self) -> Optional[datetime.date]:
-        return _parseIsoDate(self._rawGet("date"))
+        return parse_date(self._rawGet("date"))
 
     @property
     def parent(self) -> str:
@@ -169,6 +188,8 @@ class Company(LpdbBaseResponseData):
     Company data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self._rawGet("name")
@@ -207,11 +228,11 @@ class Company(LpdbBaseResponseData):
 
     @property
     def foundeddate(self) -> Optional[datetime.datetime]:
-        return _parseIsoDateTime(self._rawGet("foundeddate"))
+        return parse_datetime(self._rawGet("foundeddate"))
 
     @property
     def defunctdate(self) -> Optional[datetime.datetime]:
-        return _parseIsoDateTime(self._rawGet("defunctdate"))
+        return parse_datetime(self._rawGet("defunctdate"))
 
     @property
     def defunctfate(self) -> str:
@@ -227,6 +248,8 @@ class Datapoint(LpdbBaseResponseData):
     Generic datapoint from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def type(self) -> str:
         return self._rawGet("type")
@@ -253,7 +276,7 @@ class Datapoint(LpdbBaseResponseData):
 
     @property
     def date(self) -> Optional[datetime.datetime]:
-        return _parseIsoDateTime(self._rawGet("date"))
+        return parse_datetime(self._rawGet("date"))
 
 
 class ExternalMediaLink(LpdbBaseResponseData):
@@ -261,6 +284,8 @@ class ExternalMediaLink(LpdbBaseResponseData):
     External media link from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def title(self) -> str:
         return self._rawGet("title")
@@ -275,7 +300,7 @@ class ExternalMediaLink(LpdbBaseResponseData):
 
     @property
     def date(self) -> Optional[datetime.date]:
-        return _parseIsoDate(self._rawGet("date"))
+        return parse_date(self._rawGet("date"))
 
     @property
     def authors(self) -> dict[str, str]:
@@ -297,8 +322,12 @@ class ExternalMediaLink(LpdbBaseResponseData):
 class Match(LpdbBaseResponseData):
     """
     Match data from LPDB.
+
+    Derived properties, such as `date` and `match2games`, are computed once on first access.
     """
 
+    __slots__ = ("__date", "__timezone", "__match2games", "__match2opponents")
+
     @property
     def match2id(self) -> str:
         return self._rawGet("match2id")
@@ -357,11 +386,14 @@ class Match(LpdbBaseResponseData):
 
     @property
     def date(self) -> Optional[datetime.datetime]:
-        parsed = _parseIsoDateTime(self._rawGet("date"))
-        if not self.dateexact:
-            return parsed
-        elif self.timezone is not None:
-            return parsed.astimezone(tz=self.timezone)
+        try:
+            return self.__date
+        except AttributeError:
+            pass
+        parsed = parse_datetime(self._rawGet("date"))
+        if self.dateexact and self.timezone is not None:
+            parsed = parsed.astimezone(tz=self.timezone)
+        self.__date = parsed
         return parsed
 
     @property
@@ -375,18 +407,17 @@ class Match(LpdbBaseResponseData):
 
         The `timezone` property from this property does not support IANA time zones.
         """
-        if not self.dateexact:
-            return None
-        elif self.extradata is None:
-            return None
-        offset: str = self.extradata.get("timezoneoffset")
-        if offset is None:
-            return None
-        sliced_offset = offset.split(":")
-        offset_delta = datetime.timedelta(
-            hours=int(sliced_offset[0]), minutes=int(sliced_offset[1])
-        )
-        return datetime.timezone(offset_delta, name=self.extradata.get("timezoneid"))
+        try:
+            return self.__timezone
+        except AttributeError:
+            pass
+        timezone = None
+        if self.dateexact and self.extradata is not None:
+            offset: str = self.extradata.get("timezoneoffset")
+            if offset is not None:
+                timezone = _parseTimezone(offset, self.extradata.get("timezoneid"))
+        self.__timezone = timezone
+        return timezone
 
     @property
     def stream(self) -> dict[str, Any]:
@@ -450,16 +481,27 @@ class Match(LpdbBaseResponseData):
 
     @property
     def match2games(self) -> list["MatchGame"]:
-        return [
-            MatchGame(self, match2game) for match2game in self._rawGet("match2games")
+        try:
+            return self.__match2games
+        except AttributeError:
+            pass
+        self.__match2games = [
+            MatchGame(self, match2game, copy=False)
+            for match2game in self._rawGet("match2games")
         ]
+        return self.__match2games
 
     @property
     def match2opponents(self) -> list["MatchOpponent"]:
-        return [
-            MatchOpponent(match2opponent)
+        try:
+            return self.__match2opponents
+        except AttributeError:
+            pass
+        self.__match2opponents = [
+            MatchOpponent(match2opponent, copy=False)
             for match2opponent in self._rawGet("match2opponents")
         ]
+        return self.__match2opponents
 
 
 class MatchGame(LpdbBaseData):
@@ -467,10 +509,12 @@ class MatchGame(LpdbBaseData):
     Game data stored in a match.
     """
 
+    __slots__ = ("_parent", "__date")
+
     _parent: "Match"
 
-    def __init__(self, parent: "Match", raw: dict[str, Any]):
-        super().__init__(raw)
+    def __init__(self, parent: "Match", raw: dict[str, Any], copy: bool = True):
+        super().__init__(raw, copy)
         self._parent = parent
 
     @property
@@ -511,12 +555,15 @@ class MatchGame(LpdbBaseData):
 
     @property
     def date(self) -> datetime.datetime:
-        parsed = _parseIsoDateTime(self._rawGet("date"))
-        if not self.dateexact:
-            return parsed
-        elif self._parent.timezone is None:
-            return parsed
-        return parsed.astimezone(self._parent.timezone)
+        try:
+            return self.__date
+        except AttributeError:
+            pass
+        parsed = parse_datetime(self._rawGet("date"))
+        if self.dateexact and self._parent.timezone is not None:
+            parsed = parsed.astimezone(self._parent.timezone)
+        self.__date = parsed
+        return parsed
 
     @property
     def dateexact(self) -> bool:
@@ -556,6 +603,8 @@ class MatchOpponent(LpdbBaseData):
     Opponent data stored in a match.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         return self._rawGet("id")
@@ -596,7 +645,7 @@ class MatchOpponent(LpdbBaseData):
     def teamtemplate(self) -> Optional["TeamTemplate"]:
         if self.template is None:
             return None
-        return TeamTemplate(self._rawGet("teamtemplate"))
+        return TeamTemplate(self._rawGet("teamtemplate"), copy=False)
 
     @property
     def extradata(self) -> Optional[dict[str, Any]]:
@@ -608,6 +657,8 @@ class Placement(LpdbBaseResponseData):
     Placement data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def tournament(self) -> str:
         return self._rawGet("tournament")
@@ -630,11 +681,11 @@ class Placement(LpdbBaseResponseData):
 
     @property
     def startdate(self) -> Optional[datetime.datetime]:
-        return _parseIsoDateTime(self._rawGet("startdate"))
+        return parse_datetime(self._rawGet("startdate"))
 
     @property
     def date(self) -> Optional[datetime.datetime]:
-        return _parseIsoDateTime(self._rawGet("date"))
+        return parse_datetime(self._rawGet("date"))
 
     @property
     def prizemoney(self) -> Union[int, float]:
@@ -722,6 +773,8 @@ class Player(LpdbBaseResponseData):
     Player data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return self._rawGet("id")
@@ -760,11 +813,11 @@ class Player(LpdbBaseResponseData):
 
     @property
     def birthdate(self) -> Optional[datetime.date]:
-        return _parseIsoDate(self._rawGet("birthdate"))
+        return parse_date(self._rawGet("birthdate"))
 
     @property
     def deathdate(self) -> Optional[datetime.date]:
-        return _parseIsoDate(self._rawGet("deathdate"))
+        return parse_date(self._rawGet("deathdate"))
 
     @property
     def teampagename(self) -> str:
@@ -796,6 +849,8 @@ class Series(LpdbBaseResponseData):
     Tournament series data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self._rawGet("name")
@@ -870,11 +925,11 @@ class Series(LpdbBaseResponseData):
 
     @property
     def launcheddate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("launcheddate"))
+        return parse_date(self._rawGet("launcheddate"))
 
     @property
     def defunctdate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("defunctdate"))
+        return parse_date(self._rawGet("defunctdate"))
 
     @property
     def defunctfate(self) -> str:
@@ -890,6 +945,8 @@ class SquadPlayer(LpdbBaseResponseData):
     Squad player data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return self._rawGet("id")
@@ -936,7 +993,7 @@ class SquadPlayer(LpdbBaseResponseData):
 
     @property
     def joindate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("joindate"))
+        return parse_date(self._rawGet("joindate"))
 
     @property
     def joindateref(self) -> dict:
@@ -944,7 +1001,7 @@ class SquadPlayer(LpdbBaseResponseData):
 
     @property
     def leavedate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("leavedate"))
+        return parse_date(self._rawGet("leavedate"))
 
     @property
     def leavedateref(self) -> dict:
@@ -952,7 +1009,7 @@ class SquadPlayer(LpdbBaseResponseData):
 
     @property
     def inactivedate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("inactivedate"))
+        return parse_date(self._rawGet("inactivedate"))
 
     @property
     def inactivedateref(self) -> dict:
@@ -964,6 +1021,8 @@ class StandingsEntry(LpdbBaseResponseData):
     Standings entry from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def parent(self) -> str:
         return self._rawGet("parent")
@@ -1022,6 +1081,8 @@ class StandingsTable(LpdbBaseResponseData):
     Standings table from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def parent(self) -> str:
         return self._rawGet("parent")
@@ -1060,6 +1121,8 @@ class Team(LpdbBaseResponseData):
     Team data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self._rawGet("name")
@@ -1102,11 +1165,11 @@ class Team(LpdbBaseResponseData):
 
     @property
     def createdate(self) -> Optional[datetime.date]:
-        return _parseIsoDate(self._rawGet("createdate"))
+        return parse_date(self._rawGet("createdate"))
 
     @property
     def disbanddate(self) -> Optional[datetime.date]:
-        return _parseIsoDate(self._rawGet("disbanddate"))
+        return parse_date(self._rawGet("disbanddate"))
 
     @property
     def earnings(self) -> Union[int, float]:
@@ -1130,6 +1193,8 @@ class Tournament(LpdbBaseResponseData):
     Tournament data from LPDB.
     """
 
+    __slots__ = ("__sponsors",)
+
     @property
     def name(self) -> str:
         return self._rawGet("name")
@@ -1224,15 +1289,15 @@ class Tournament(LpdbBaseResponseData):
 
     @property
     def startdate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("startdate"))
+        return parse_date(self._rawGet("startdate"))
 
     @property
     def enddate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("enddate"))
+        return parse_date(self._rawGet("enddate"))
 
     @property
     def sortdate(self) -> datetime.date:
-        return _parseIsoDate(self._rawGet("sortdate"))
+        return parse_date(self._rawGet("sortdate"))
 
     @property
     def locations(self) -> dict:
@@ -1275,7 +1340,12 @@ class Tournament(LpdbBaseResponseData):
 
     @property
     def sponsors(self) -> dict:
-        return json.loads(self._rawGet("sponsors"))
+        try:
+            return self.__sponsors
+        except AttributeError:
+            pass
+        self.__sponsors = json.loads(self._rawGet("sponsors"))
+        return self.__sponsors
 
 
 class Transfer(LpdbBaseResponseData):
@@ -1283,6 +1353,8 @@ class Transfer(LpdbBaseResponseData):
     Transfer data from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def player(self) -> str:
         return self._rawGet("player")
@@ -1321,7 +1393,7 @@ class Transfer(LpdbBaseResponseData):
 
     @property
     def date(self) -> Optional[datetime.datetime]:
-        return _parseIsoDateTime(self._rawGet("date"))
+        return parse_datetime(self._rawGet("date"))
 
     @property
     def wholeteam(self) -> bool:
@@ -1333,6 +1405,8 @@ class TeamTemplate(LpdbBaseData):
     Team template from LPDB.
     """
 
+    __slots__ = ()
+
     @property
     def template(self) -> str:
         return self._rawGet("template")
@@ -1384,3 +1458,101 @@ class TeamTemplate(LpdbBaseData):
     @property
     def legacyimagedarkurl(self) -> str:
         return self._rawGet("legacyimagedarkurl")
+
+
+DATA_TYPE_WRAPPERS: dict[str, type[LpdbBaseResponseData]] = {
+    "broadcasters": Broadcasters,
+    "company": Company,
+    "datapoint": Datapoint,
+    "externalmedialink": ExternalMediaLink,
+    "match": Match,
+    "placement": Placement,
+    "player": Player,
+    "series": Series,
+    "squadplayer": SquadPlayer,
+    "standingsentry": StandingsEntry,
+    "standingstable": StandingsTable,
+    "team": Team,
+    "tournament": Tournament,
+    "transfer": Transfer,
+}
+"""
+The wrapper class of each LPDB data type
+"""
+
+
+_NUMERIC_FIELDS: frozenset[str] = frozenset(
+    {"bestof", "placement", "prizemoney", "weight"}
+)
+"""
+Fields that are numeric in every data type, including data types whose wrapper does not have a property for them
+"""
+
+
+@cache
+def _get_field_types(wrapper: type[LpdbBaseData]) -> dict[str, Any]:
+    """
+    Gets the types of the properties of a wrapper, with `Optional` removed and numeric unions collapsed to `float`.
+
+    :param wrapper: the wrapper class
+
+    :return: the type of each property of the wrapper, by the name of the property
+    """
+    field_types = dict()
+    for cls in reversed(wrapper.__mro__):
+        for name, member in vars(cls).items():
+            if not isinstance(member, property) or name.startswith("_"):
+                continue
+            field_type = get_type_hints(member.fget).get("return", Any)
+            if get_origin(field_type) in (Union, UnionType):
+                members = [arg for arg in get_args(field_type) if arg is not NoneType]
+                if set(members) == {int, float}:
+                    field_type = float
+                elif len(members) == 1:
+                    field_type = members[0]
+            field_types[name] = field_type
+    return field_types
+
+
+class LpdbResults[T: LpdbBaseData](Sequence[T]):
+    """
+    Lazy sequence of wrapped LPDB query results.
+
+    Each result is wrapped only when it is first accessed, and the wrapper shares the raw result instead of copying it.
+    """
+
+    def __init__(self, wrapper: type[T], raw: list[dict[str, Any]]):
+        """
+        Creates a lazy sequence of wrapped results.
+
+        :param wrapper: the wrapper class of the results
+        :param raw: the raw results, which must not be modified while the sequence is in use
+        """
+        self.wrapper = wrapper
+        self.raw = raw
+        self.__wrapped: list[Optional[T]] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LpdbResults[T]": ...
+
+    def __getitem__(self, index: int | slice) -> Union[T, "LpdbResults[T]"]:
+        if isinstance(index, slice):
+            return LpdbResults(self.wrapper, self.raw[index])
+        wrapped = self.__wrapped[index]
+        if wrapped is None:
+            wrapped = self.wrapper(self.raw[index], copy=False)
+            self.__wrapped[index] = wrapped
+        return wrapped
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"LpdbResults({self.wrapper.__name__}, {len(self.raw)} results)"
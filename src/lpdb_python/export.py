@@ -0,0 +1,272 @@
+"""
+Export of LPDB query results to Parquet files.
+
+This module requires PyArrow, which can be installed with `pip install lpdb_python[export]`.
+"""
+
+import datetime
+import json
+
+from os import PathLike
+from typing import Any, Iterable, Literal, Optional, TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .dates import _is_missing, parse_dates, parse_datetimes
+from .defs import _get_field_types, _NUMERIC_FIELDS, DATA_TYPE_WRAPPERS
+from .session import AbstractLpdbSession, LpdbDataType
+
+if TYPE_CHECKING:
+    from .async_session import AsyncLpdbSession
+    from .session import LpdbSession
+
+__all__ = ["export_parquet", "export_parquet_async", "get_schema"]
+
+_ARROW_TYPES: dict[Any, pa.DataType] = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    datetime.date: pa.date32(),
+    datetime.datetime: pa.timestamp("s", tz="UTC"),
+}
+
+
+def get_schema(lpdb_datatype: LpdbDataType, fields: Iterable[str]) -> pa.Schema:
+    """
+    Derives the Arrow schema of results of a data type from the property types of its wrapper.
+
+    Fields without a scalar type in the wrapper, such as `extradata` or `match2opponents`, are stored as JSON strings.
+    Numeric fields without a property in the wrapper, such as `prizemoney` of matches, are stored as floats.
+
+    :param lpdb_datatype: the data type of the results
+    :param fields: the fields of the results
+
+    :return: the schema of the results
+
+    :raises ValueError: if an invalid `lpdb_datatype` is supplied
+    """
+    if lpdb_datatype not in DATA_TYPE_WRAPPERS:
+        raise ValueError(f'Invalid LPDB data type: "{lpdb_datatype}"')
+    field_types = _get_field_types(DATA_TYPE_WRAPPERS[lpdb_datatype])
+    schema_fields = []
+    for field in fields:
+        field_type = field_types.get(field)
+        if field_type is None and field in _NUMERIC_FIELDS:
+            field_type = float
+        schema_fields.append(pa.field(field, _ARROW_TYPES.get(field_type, pa.string())))
+    return pa.schema(schema_fields)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _to_number(value: Any, number_type: type) -> Any:
+    try:
+        return number_type(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_array(values: list[Any], arrow_type: pa.DataType) -> pa.Array:
+    values = [None if value == "" else value for value in values]
+    if arrow_type == pa.string():
+        try:
+            return pa.array(values, pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array(list(map(_to_json, values)), pa.string())
+    elif arrow_type == pa.bool_():
+        return pa.array(
+            [None if value is None else bool(value) for value in values], arrow_type
+        )
+    elif pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+        try:
+            return pa.array(values, arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            number_type = int if pa.types.is_integer(arrow_type) else float
+            return pa.array(
+                [_to_number(value, number_type) for value in values], arrow_type
+            )
+    elif arrow_type == pa.date32():
+        dates = [None if _is_missing(value) else value[:10] for value in values]
+        try:
+            return pa.array(dates, pa.string()).cast(arrow_type)
+        except pa.ArrowInvalid:
+            return pa.array(parse_dates(values), arrow_type)
+    elif pa.types.is_timestamp(arrow_type):
+        dates = [None if _is_missing(value) else value for value in values]
+        try:
+            return pa.array(dates, pa.string()).cast(pa.timestamp("s")).cast(arrow_type)
+        except pa.ArrowInvalid:
+            return pa.array(parse_datetimes(values), arrow_type)
+    return pa.array(values, arrow_type)
+
+
+class _ParquetExporter:
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        lpdb_datatype: LpdbDataType,
+        fields: Optional[list[str]],
+        compression: str,
+    ):
+        self.path = path
+        self.lpdb_datatype = lpdb_datatype
+        self.fields = fields
+        self.compression = compression
+        self.schema: Optional[pa.Schema] = None
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.rows = 0
+
+    def write(self, page: list[dict[str, Any]]) -> None:
+        if len(page) == 0:
+            return
+        if self.writer is None:
+            if self.fields is None:
+                self.fields = list(page[0].keys())
+            self.schema = get_schema(self.lpdb_datatype, self.fields)
+            self.writer = pq.ParquetWriter(
+                self.path, self.schema, compression=self.compression
+            )
+        batch = pa.record_batch(
+            [
+                _to_array([row.get(field.name) for row in page], field.type)
+                for field in self.schema
+            ],
+            schema=self.schema,
+        )
+        self.writer.write_batch(batch)
+        self.rows += len(page)
+
+    def close(self) -> int:
+        if self.writer is None:
+            # Nothing was written, so an empty file is written with the schema of the requested fields
+            self.schema = get_schema(self.lpdb_datatype, self.fields or [])
+            self.writer = pq.ParquetWriter(
+                self.path, self.schema, compression=self.compression
+            )
+        self.writer.close()
+        return self.rows
+
+
+def _get_query_fields(query: Optional[str | list[str]]) -> Optional[list[str]]:
+    if query is None:
+        return None
+    elif isinstance(query, str):
+        query = query.split(",")
+    return [field.strip() for field in query]
+
+
+def export_parquet(
+    session: "LpdbSession",
+    path: str | PathLike[str],
+    lpdb_datatype: LpdbDataType,
+    wiki: str | list[str],
+    batch_size: int = AbstractLpdbSession.MAX_LIMIT,
+    offset: int = 0,
+    conditions: Optional[str] = None,
+    query: Optional[str | list[str]] = None,
+    order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+    compression: str = "zstd",
+    **kwargs,
+) -> int:
+    """
+    Exports the results of an LPDB query to a Parquet file.
+
+    The results are requested page by page with `iter_pages`, and each page is written as a record batch, so that
+    only one page of results is held in memory at a time.
+    The columns are the fields in `query`, or the fields of the first page if `query` is not supplied.
+    See `get_schema` for the types of the columns.
+
+    :param session: the session to make requests with
+    :param path: the Parquet file to write
+    :param lpdb_datatype: the data type to query
+    :param wiki: the wiki(s) to query
+    :param batch_size: the amount of results requested per page, capped at `MAX_LIMIT`
+    :param offset: the offset, the first `offset` results from the query will be dropped
+    :param conditions: the conditions for the query
+    :paran query: the data field(s) to fetch from query
+    :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+    :param compression: the compression codec of the Parquet file
+
+    :return: the number of exported results
+
+    :raises ValueError: if an invalid `lpdb_datatype` is supplied
+    :raises LpdbError: if something went wrong with the request
+    """
+    exporter = _ParquetExporter(
+        path, lpdb_datatype, _get_query_fields(query), compression
+    )
+    try:
+        for page in session.iter_pages(
+            lpdb_datatype,
+            wiki,
+            page_size=batch_size,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            **kwargs,
+        ):
+            exporter.write(page)
+    finally:
+        rows = exporter.close()
+    return rows
+
+
+async def export_parquet_async(
+    session: "AsyncLpdbSession",
+    path: str | PathLike[str],
+    lpdb_datatype: LpdbDataType,
+    wiki: str | list[str],
+    batch_size: int = AbstractLpdbSession.MAX_LIMIT,
+    offset: int = 0,
+    conditions: Optional[str] = None,
+    query: Optional[str | list[str]] = None,
+    order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+    compression: str = "zstd",
+    **kwargs,
+) -> int:
+    """
+    Exports the results of an LPDB query to a Parquet file with an asynchronous session.
+
+    See `export_parquet` for how the results are exported.
+
+    :param session: the session to make requests with
+    :param path: the Parquet file to write
+    :param lpdb_datatype: the data type to query
+    :param wiki: the wiki(s) to query
+    :param batch_size: the amount of results requested per page, capped at `MAX_LIMIT`
+    :param offset: the offset, the first `offset` results from the query will be dropped
+    :param conditions: the conditions for the query
+    :paran query: the data field(s) to fetch from query
+    :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+    :param compression: the compression codec of the Parquet file
+
+    :return: the number of exported results
+
+    :raises ValueError: if an invalid `lpdb_datatype` is supplied
+    :raises LpdbError: if something went wrong with the request
+    """
+    exporter = _ParquetExporter(
+        path, lpdb_datatype, _get_query_fields(query), compression
+    )
+    try:
+        async for page in session.iter_pages(
+            lpdb_datatype,
+            wiki,
+            page_size=batch_size,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            **kwargs,
+        ):
+            exporter.write(page)
+    finally:
+        rows = exporter.close()
+    return rows
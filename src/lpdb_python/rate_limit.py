@@ -0,0 +1,131 @@
+"""
+Client-side rate limiting for LPDB requests.
+"""
+
+import asyncio
+import threading
+import time
+
+from typing import Mapping, Optional
+
+__all__ = ["LpdbRateLimiter"]
+
+
+class _TokenBucket:
+    """
+    A token bucket that hands out reservations.
+
+    The amount of tokens may become negative, in which case it represents the requests that have been promised
+    a token in the future.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes a token from this bucket.
+
+        :param now: the current monotonic time
+
+        :return: the number of seconds to wait before the token can be used
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class LpdbRateLimiter:
+    """
+    Token bucket rate limiter for LPDB requests.
+
+    LPDB enforces its rate limits per wiki and per table, so a separate bucket is kept for each `(wiki, table)` pair.
+    Instead of failing, a request waits until a token is available.
+    A single limiter is safe to share between threads and between sessions.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        table_rates: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Creates a new LpdbRateLimiter.
+
+        :param rate: the number of requests allowed per second for each `(wiki, table)` pair
+        :param capacity: the number of requests that can be made in a burst
+        :param table_rates: overrides of `rate` for specific tables
+
+        :raises ValueError: if a rate or `capacity` is not positive
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate and capacity must be positive")
+        if table_rates is not None and any(r <= 0 for r in table_rates.values()):
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.table_rates = dict(table_rates or {})
+        self.throttled_count = 0
+        """
+        The number of requests that had to wait for a token
+        """
+        self.throttled_seconds = 0.0
+        """
+        The total time in seconds that requests had to wait for a token
+        """
+        self.__buckets: dict[tuple[str, str], _TokenBucket] = dict()
+        self.__lock = threading.Lock()
+
+    def _reserve(self, wiki: str | list[str], table: str) -> float:
+        """
+        Takes a token for each of the wikis being queried.
+
+        :return: the number of seconds to wait before the request can be made
+        """
+        wikis = [wiki] if isinstance(wiki, str) else wiki
+        with self.__lock:
+            now = time.monotonic()
+            delay = 0.0
+            for key in [(w, table) for w in wikis]:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    bucket = _TokenBucket(
+                        self.table_rates.get(table, self.rate), self.capacity, now
+                    )
+                    self.__buckets[key] = bucket
+                delay = max(delay, bucket.reserve(now))
+            if delay > 0:
+                self.throttled_count += 1
+                self.throttled_seconds += delay
+            return delay
+
+    def acquire(self, wiki: str | list[str], table: str) -> None:
+        """
+        Blocks until a request to the specified table is allowed.
+
+        :param wiki: the wiki(s) being queried
+        :param table: the table being queried
+        """
+        delay = self._reserve(wiki, table)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, wiki: str | list[str], table: str) -> None:
+        """
+        Waits until a request to the specified table is allowed.
+
+        :param wiki: the wiki(s) being queried
+        :param table: the table being queried
+        """
+        delay = self._reserve(wiki, table)
+        if delay > 0:
+            await asyncio.sleep(delay)
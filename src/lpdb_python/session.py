@@ -1,12 +1,20 @@
 from abc import abstractmethod, ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, datetime, UTC
+from email.utils import parsedate_to_datetime
 from functools import cache
 from http import HTTPStatus
 from types import TracebackType
+from urllib.parse import urlencode
 from typing import (
     Any,
+    Callable,
     Final,
+    Generator,
+    Iterable,
+    Iterator,
     Literal,
     NotRequired,
     Optional,
@@ -15,13 +23,40 @@ from typing import (
     TypedDict,
     TypeGuard,
 )
+import heapq
+import itertools
+import json
+import os
+import random
 import re
+import threading
+import time
 import warnings
 import importlib.metadata as metadata
 
-import requests
+from .cache import LpdbCache
+from .defs import DATA_TYPE_WRAPPERS, LpdbBaseResponseData, LpdbResults
+from .rate_limit import LpdbRateLimiter
+from .streaming import ResultStreamParser
+from .teamtemplate import TeamTemplateIndex
+from .transport import (
+    RequestsTransport,
+    Transport,
+    TransportConfig,
+    TransportResponse,
+)
 
-__all__ = ["LpdbDataType", "LpdbError", "LpdbWarning", "LpdbSession"]
+__all__ = [
+    "JsonLoads",
+    "LpdbDataType",
+    "LpdbError",
+    "LpdbHttpError",
+    "LpdbRateLimitError",
+    "LpdbRequest",
+    "LpdbWarning",
+    "LpdbSession",
+    "RetryPolicy",
+]
 
 _PACKAGE_NAME: Final[str] = "lpdb_python"
 
@@ -34,6 +69,36 @@ def _get_version() -> str:
         return "dev"
 
 
+type JsonLoads = Callable[[bytes], Any]
+"""
+Python type of a function that decodes a JSON document from bytes
+"""
+
+
+def _get_default_json_loads() -> JsonLoads:
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(data: bytes) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as error:
+                raise ValueError(str(error)) from error
+
+        return msgspec_loads
+    except ImportError:
+        pass
+    return json.loads
+
+
 type LpdbDataType = Literal[
     "broadcasters",
     "company",
@@ -93,6 +158,21 @@ class LpdbRateLimitError(LpdbError):
         self.table = table
 
 
+class LpdbHttpError(LpdbError):
+    """
+    Raised when LPDB responded with an unsuccessful HTTP status.
+    """
+
+    def __init__(self, status_code: int, *args):
+        try:
+            name = HTTPStatus(status_code).name
+        except ValueError:
+            # Statuses outside the standard set, such as those of the CDN in front of LPDB
+            name = "UNKNOWN"
+        super().__init__(f"HTTP {status_code}: {name}")
+        self.status_code = status_code
+
+
 class LpdbWarning(Warning):
     """
     Warnings about LPDB response.
@@ -101,6 +181,323 @@ class LpdbWarning(Warning):
     pass
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Policy for retrying failed LPDB requests with exponential backoff.
+
+    The delay before the `n`-th retry is `base_delay * 2 ** (n - 1)`, capped at `max_delay`, of which up to
+    a `jitter` fraction is randomly taken off so that concurrent clients do not retry in lockstep.
+    """
+
+    max_attempts: int = 3
+    """
+    The maximum number of attempts for a request, including the first one
+    """
+    base_delay: float = 1.0
+    """
+    The delay in seconds before the first retry
+    """
+    max_delay: float = 60.0
+    """
+    The upper bound in seconds for the computed delay
+    """
+    jitter: float = 1.0
+    """
+    The fraction of the delay that is randomized, from `0` (no jitter) to `1` (full jitter)
+    """
+    retry_on: tuple[type[BaseException], ...] = (LpdbRateLimitError,)
+    """
+    The exception types that are retried
+    """
+    retry_statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        }
+    )
+    """
+    The HTTP statuses for which `LpdbHttpError` is retried
+    """
+    respect_retry_after: bool = True
+    """
+    Whether to wait at least as long as the `Retry-After` header of the response asks for
+    """
+
+    def should_retry(self, error: BaseException) -> bool:
+        """
+        Checks whether a request that failed with the given error should be retried.
+
+        :param error: the error the request failed with
+
+        :return: `True` if the request should be retried
+        """
+        if (
+            isinstance(error, LpdbHttpError)
+            and error.status_code in self.retry_statuses
+        ):
+            return True
+        return isinstance(error, self.retry_on)
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Computes the delay before retrying a request.
+
+        :param attempt: the number of attempts made so far
+        :param retry_after: the `Retry-After` header of the failed response, if any
+
+        :return: the delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay -= delay * self.jitter * random.random()
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, RetryPolicy._parse_retry_after(retry_after))
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> float:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(frozen=True)
+class LpdbRequest:
+    """
+    An LPDB query request, made together with others by `fetch_many`.
+    """
+
+    lpdb_datatype: LpdbDataType
+    """
+    The data type to query
+    """
+    wiki: str | list[str]
+    """
+    The wiki(s) to query
+    """
+    limit: int = 20
+    """
+    The amount of results wanted
+    """
+    offset: int = 0
+    """
+    The offset, the first `offset` results from the query will be dropped
+    """
+    conditions: Optional[str] = None
+    """
+    The conditions for the query
+    """
+    query: Optional[str | list[str]] = None
+    """
+    The data field(s) to fetch from query
+    """
+    order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None
+    """
+    The order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+    """
+    groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None
+    """
+    The way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+    """
+    params: dict[str, Any] = field(default_factory=dict)
+    """
+    Additional parameters of the request
+    """
+
+
+class _OrderKey:
+    """
+    Sort key of a result following ordering rules that may mix ascending and descending fields
+    """
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values: list[Any], descending: list[bool]):
+        self.values = values
+        self.descending = descending
+
+    def __lt__(self, other: "_OrderKey") -> bool:
+        for value, other_value, descending in zip(
+            self.values, other.values, self.descending
+        ):
+            if value == other_value:
+                continue
+            try:
+                less = value < other_value
+            except TypeError:
+                # e.g. a missing value, which LPDB sorts as an empty string
+                less = str(value or "") < str(other_value or "")
+            return less != descending
+        return False
+
+
+@dataclass(frozen=True)
+class _Request:
+    """
+    A request prepared by a session, identified in caches by its endpoint and key
+    """
+
+    endpoint: str
+    wiki: str | list[str]
+    params: dict[str, Any]
+    cache_key: str
+
+
+# The logic of requests is shared by both sessions as generators, which yield the steps below whenever they need
+# something done by the session, and are sent back the result of the step. Each session performs the steps with its
+# transport, cache and rate limiter, by blocking or by awaiting.
+type _Steps[T] = Generator[Any, Any, T]
+
+
+@dataclass(frozen=True)
+class _Acquire:
+    """
+    Waits on the rate limiter of the session
+    """
+
+    wiki: str | list[str]
+    table: str
+
+
+@dataclass(frozen=True)
+class _Send:
+    """
+    Sends a request with the transport of the session, resulting in a `TransportResponse`
+    """
+
+    url: str
+    params: Optional[dict[str, Any]]
+    headers: dict[str, str]
+
+
+@dataclass(frozen=True)
+class _Open:
+    """
+    Sends a request with the transport of the session, resulting in a streamed response if it succeeded, and in a
+    `TransportResponse` read from it otherwise
+    """
+
+    url: str
+    params: dict[str, Any]
+    headers: dict[str, str]
+    chunk_size: int
+
+
+@dataclass(frozen=True)
+class _Sleep:
+    """
+    Waits before retrying a request
+    """
+
+    delay: float
+
+
+@dataclass(frozen=True)
+class _CacheLookup:
+    """
+    Looks up a response in the cache of the session, resulting in a `CachedResponse` or `None`
+    """
+
+    endpoint: str
+    key: str
+
+
+@dataclass(frozen=True)
+class _CacheStore:
+    """
+    Stores a response in the cache of the session
+    """
+
+    endpoint: str
+    key: str
+    value: list[dict[str, Any]]
+    size: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class _Coalesce:
+    """
+    Loads a request, sharing the load and its result with the identical requests made concurrently
+    """
+
+    request: _Request
+
+
+@dataclass(frozen=True)
+class _Revalidate:
+    """
+    Refreshes a stale cached response in the background, with the steps of `_refresh_steps`
+    """
+
+    request: _Request
+
+
+class _PageCursor:
+    """
+    Position of a series of requests walking through the pages of a query
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        offset: int,
+        conditions: Optional[str],
+        query: Optional[str | list[str]],
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]],
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]],
+    ):
+        self.page_size = min(page_size, AbstractLpdbSession.MAX_LIMIT)
+        self.__conditions = conditions
+        self.__keys = None
+        self.__added_fields: list[str] = []
+        if keyset is not None:
+            self.__keys, query, self.__added_fields = AbstractLpdbSession._parse_keyset(
+                keyset, order, query
+            )
+            order = self.__keys
+        self.params: dict[str, Any] = {
+            "limit": self.page_size,
+            "offset": offset,
+            "conditions": conditions,
+            "query": query,
+            "order": order,
+        }
+        """
+        The parameters of the request for the next page
+        """
+        self.done = False
+        """
+        Whether the last page has been received
+        """
+
+    def advance(self, page: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Moves past a received page.
+
+        :param page: the results of the page
+
+        :return: the results of the page, without the keys that were only added to the query to request the next page
+        """
+        if len(page) < self.page_size:
+            self.done = True
+        elif self.__keys is None:
+            self.params["offset"] += self.page_size
+        else:
+            self.params["conditions"] = AbstractLpdbSession._get_keyset_conditions(
+                self.__conditions, self.__keys, page[-1]
+            )
+        return AbstractLpdbSession._remove_fields(page, self.__added_fields)
+
+
 class AbstractLpdbSession(ABC):
     """
     An abstract LPDB session
@@ -108,6 +505,22 @@ class AbstractLpdbSession(ABC):
 
     BASE_URL: Final[str] = "https://api.liquipedia.net/api/v3/"
 
+    WIKIS_URL: Final[str] = "https://liquipedia.net/api.php"
+
+    MAX_LIMIT: Final[int] = 1000
+    """
+    The maximum number of results LPDB returns for a single request
+    """
+
+    STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+    """
+    The size in bytes of the chunks in which streamed responses are read
+    """
+
+    __RAW_MESSAGES: Final[re.Pattern[bytes]] = re.compile(
+        rb'"(?:error|warning)"\s*:\s*\[\s*[^\]\s]'
+    )
+
     __DATA_TYPES: Final[frozenset[str]] = frozenset(
         {
             "broadcasters",
@@ -129,9 +542,44 @@ class AbstractLpdbSession(ABC):
 
     __api_key: str
 
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        rate_limiter: Optional[LpdbRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[LpdbCache] = None,
+        coalesce_requests: bool = False,
+        team_template_index: Optional[TeamTemplateIndex] = None,
+        wikis_ttl: float = 24 * 60 * 60,
+        wikis_cache_path: Optional[str | os.PathLike[str]] = None,
+        json_loads: Optional[JsonLoads] = None,
+    ):
         self.__api_key = re.sub(r"^ApiKey ", "", api_key)
         self._base_url = base_url
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._coalesce_requests = coalesce_requests
+        self._team_template_index = team_template_index
+        self._wikis_ttl = wikis_ttl
+        self._wikis_cache_path = wikis_cache_path
+        self.__wikis: Optional[frozenset[str]] = None
+        self.__wikis_fetched = 0.0
+        self.__in_flight: dict[tuple[str, str], Any] = dict()
+        self.__revalidating: set[tuple[str, str]] = set()
+        self.__lock = threading.Lock()
+        self._json_loads = (
+            json_loads if json_loads is not None else _get_default_json_loads()
+        )
+        self.retry_count = 0
+        """
+        The number of failed requests that have been retried
+        """
+        self.rate_limit_count = 0
+        """
+        The number of requests that LPDB rejected for exceeding its rate limits
+        """
 
     @cache
     def _get_header(self) -> dict[str, str]:
@@ -142,46 +590,407 @@ class AbstractLpdbSession(ABC):
             "user-agent": f"{_PACKAGE_NAME}/{_get_version()}",
         }
 
+    @cache
+    def _get_public_header(self) -> dict[str, str]:
+        # The API key is only meant for LPDB
+        return {
+            key: value
+            for key, value in self._get_header().items()
+            if key != "authorization"
+        }
+
+    def _get_retry_delay(
+        self, attempt: int, error: BaseException, retry_after: Optional[str]
+    ) -> Optional[float]:
+        """
+        Decides whether a failed request should be retried.
+
+        :param attempt: the number of attempts made so far
+        :param error: the error the request failed with
+        :param retry_after: the `Retry-After` header of the failed response, if any
+
+        :return: the delay in seconds before retrying, or `None` if the error should be raised
+        """
+        policy = self._retry_policy
+        retry = (
+            policy is not None
+            and attempt < policy.max_attempts
+            and policy.should_retry(error)
+        )
+        # Requests of a session can fail in multiple threads at once
+        with self.__lock:
+            if isinstance(error, LpdbRateLimitError):
+                self.rate_limit_count += 1
+            if retry:
+                self.retry_count += 1
+        if not retry:
+            return None
+        return policy.get_delay(attempt, retry_after)
+
     @staticmethod
     def _validate_datatype_name(lpdb_datatype: str) -> TypeGuard[LpdbDataType]:
         return lpdb_datatype in AbstractLpdbSession.__DATA_TYPES
 
-    @staticmethod
     @abstractmethod
-    def get_wikis() -> set[str]:
+    def get_wikis(self) -> set[str]:
         """
         Fetches the set of all available wikis.
 
-        :return: set of all available wiki names
+        The set is cached for the `wikis_ttl` supplied to the session, and also stored in `wikis_cache_path` if one
+        was supplied.
+
+        :return: set of all available wiki names
+        """
+        pass
+
+    def _get_cached_wikis(self) -> Optional[set[str]]:
+        now = time.time()
+        with self.__lock:
+            if self.__wikis is None and self._wikis_cache_path is not None:
+                try:
+                    with open(self._wikis_cache_path, encoding="utf-8") as wikis_file:
+                        stored = json.load(wikis_file)
+                    self.__wikis = frozenset(stored["wikis"])
+                    self.__wikis_fetched = stored["fetched"]
+                except (OSError, ValueError, KeyError):
+                    return None
+            if self.__wikis is None or now - self.__wikis_fetched >= self._wikis_ttl:
+                return None
+            return set(self.__wikis)
+
+    def _store_wikis(self, wikis: set[str]) -> None:
+        with self.__lock:
+            self.__wikis = frozenset(wikis)
+            self.__wikis_fetched = time.time()
+            if self._wikis_cache_path is None:
+                return
+            temporary_path = f"{os.fspath(self._wikis_cache_path)}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as wikis_file:
+                json.dump(
+                    {"fetched": self.__wikis_fetched, "wikis": sorted(wikis)},
+                    wikis_file,
+                )
+            os.replace(temporary_path, self._wikis_cache_path)
+
+    @abstractmethod
+    def warmup(self, connections: int = 1) -> None:
+        """
+        Opens connections to LPDB ahead of the first requests, so that they do not wait for connections to be set up.
+
+        The connections are opened concurrently and returned to the pool, which keeps at most `pool_maxsize` of them.
+
+        :param connections: the number of connections to open, nothing is done if it is not positive
+        """
+        pass
+
+    @abstractmethod
+    def make_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """
+        Creates an LPDB query request.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki(s) to query
+        :param limit: the amount of results wanted
+        :param offset: the offset, the first `offset` results from the query will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+
+        :return: result of the query
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    @abstractmethod
+    def make_typed_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> LpdbResults[LpdbBaseResponseData]:
+        """
+        Creates an LPDB query request, returning the results wrapped in the data type wrapper of `lpdb_datatype`.
+
+        The results are wrapped lazily, only when they are accessed.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki(s) to query
+        :param limit: the amount of results wanted
+        :param offset: the offset, the first `offset` results from the query will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+
+        :return: lazy sequence of the wrapped results of the query
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    @abstractmethod
+    def fetch_many(
+        self,
+        lpdb_requests: Iterable[LpdbRequest],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[list[dict[str, Any]] | Exception]:
+        """
+        Makes LPDB query requests concurrently.
+
+        :param lpdb_requests: the requests to make
+        :param max_workers: the maximum number of requests made at once
+        :param return_exceptions: whether the errors of failed requests are returned in place of their results instead
+            of being raised
+
+        :return: the results of each request, in the order of `lpdb_requests`
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with any of the requests
+        """
+        pass
+
+    @abstractmethod
+    def make_fanout_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wikis: list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """
+        Creates an LPDB query request for each wiki, and makes them concurrently.
+
+        Each wiki is requested for its first `offset + limit` results, capped at `MAX_LIMIT`. If `order` is supplied,
+        the results of all wikis are merged in that order, otherwise they are concatenated in the order of `wikis`.
+        Ordered fields missing from `query` are requested to merge the results, but removed from the results.
+        The first `offset` merged results are then dropped, and at most `limit` are returned.
+
+        :param lpdb_datatype: the data type to query
+        :param wikis: the wikis to query
+        :param limit: the amount of results wanted across all wikis
+        :param offset: the offset, the first `offset` results across all wikis will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+        :param concurrency: the maximum number of requests made at once, all wikis are requested at once if not supplied
+
+        :return: result of the query across all wikis
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with any of the requests
+        """
+        pass
+
+    @abstractmethod
+    def iter_pages(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        page_size: int = MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Creates a series of LPDB query requests, walking through all results page by page.
+
+        Pages are requested one at a time, and the iteration stops once LPDB returns a page shorter than `page_size`.
+        An `order` should be supplied so that the results are split into pages consistently.
+
+        With `keyset`, the results are ordered by the keys, and each page after the first is requested with a
+        condition selecting the results after the last result of the previous page instead of an offset.
+        Unlike offsets, this keeps the cost of each request flat regardless of how deep the page is, and does not skip
+        or repeat results when results are added or removed during the iteration.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki(s) to query
+        :param page_size: the amount of results requested per page, capped at `MAX_LIMIT`
+        :param offset: the offset, the first `offset` results from the query will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+        :param keyset: the key(s) to page through the results with instead of offsets, in place of `order`;
+            each key can be specified as a `(datapoint, direction)` tuple, and the keys should identify a result uniquely;
+            keys missing from `query` are requested as well, but removed from the results
+
+        :return: iterator over pages of the query results
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied, or if both `order` and `keyset` are supplied
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    @abstractmethod
+    def iter_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        page_size: int = MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Creates a series of LPDB query requests, yielding each result as its page arrives.
+
+        Only one page of results is held in memory at a time. See `iter_pages` for how the pages are requested.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki(s) to query
+        :param page_size: the amount of results requested per page, capped at `MAX_LIMIT`
+        :param offset: the offset, the first `offset` results from the query will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+        :param keyset: the key(s) to page through the results with instead of offsets, in place of `order`;
+            each key can be specified as a `(datapoint, direction)` tuple, and the keys should identify a result uniquely;
+            keys missing from `query` are requested as well, but removed from the results
+
+        :return: iterator over the query results
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied, or if both `order` and `keyset` are supplied
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    @abstractmethod
+    def stream_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Creates an LPDB query request, yielding each result as soon as it has been received.
+
+        The response body is parsed incrementally, so the results are available before the whole response has arrived
+        and the full response is never held in memory.
+        Streamed requests bypass the cache, and are not retried once results have been yielded.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki(s) to query
+        :param limit: the amount of results wanted
+        :param offset: the offset, the first `offset` results from the query will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+
+        :return: iterator over the query results
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    @abstractmethod
+    def make_raw_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Creates an LPDB query request, returning the response body without decoding it.
+
+        The body is only scanned for errors and warnings, and is decoded only if it contains any.
+        Raw requests bypass the cache.
+
+        :param lpdb_datatype: the data type to query
+        :param wiki: the wiki(s) to query
+        :param limit: the amount of results wanted
+        :param offset: the offset, the first `offset` results from the query will be dropped
+        :param conditions: the conditions for the query
+        :paran query: the data field(s) to fetch from query
+        :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
+        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
+
+        :return: the JSON body of the response
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with the request
         """
         pass
 
     @abstractmethod
-    def make_request(
+    def iter_raw_pages(
         self,
         lpdb_datatype: LpdbDataType,
-        wiki: str | list[str],
-        limit: int = 20,
+        wiki: str,
+        page_size: int = MAX_LIMIT,
         offset: int = 0,
         conditions: Optional[str] = None,
         query: Optional[str | list[str]] = None,
         order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
-        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
         **kwargs,
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[bytes]:
         """
-        Creates an LPDB query request.
+        Creates a series of LPDB query requests, walking through all results page by page without decoding them.
+
+        Since the size of a page is not known without decoding it, the results are counted with `make_count_request`
+        first, and the pages covering them are requested one at a time.
+        An `order` should be supplied so that the results are split into pages consistently.
 
         :param lpdb_datatype: the data type to query
-        :param wiki: the wiki(s) to query
-        :param limit: the amount of results wanted
+        :param wiki: the wiki to query
+        :param page_size: the amount of results requested per page, capped at `MAX_LIMIT`
         :param offset: the offset, the first `offset` results from the query will be dropped
         :param conditions: the conditions for the query
         :paran query: the data field(s) to fetch from query
         :param order: the order of results to be sorted in; each ordering rule can specified as a `(datapoint, direction)` tuple
-        :param groupby: the way that the query results are grouped; each grouping rule can specified as a `(datapoint, direction)` tuple
 
-        :return: result of the query
+        :return: iterator over the JSON bodies of the pages
 
         :raises ValueError: if an invalid `lpdb_datatype` is supplied
         :raises LpdbError: if something went wrong with the request
@@ -265,7 +1074,7 @@ class AbstractLpdbSession(ABC):
             parameters["wiki"] = ", ".join(wiki)
         else:
             raise TypeError()
-        parameters["limit"] = min(limit, 1000)
+        parameters["limit"] = min(limit, AbstractLpdbSession.MAX_LIMIT)
         parameters["offset"] = offset
         if conditions is not None:
             parameters["conditions"] = conditions
@@ -293,6 +1102,135 @@ class AbstractLpdbSession(ABC):
                 )
         return parameters
 
+    @staticmethod
+    def _parse_keyset(
+        keyset: str | list[tuple[str, Literal["asc", "desc"]]],
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]],
+        query: Optional[str | list[str]],
+    ) -> tuple[
+        list[tuple[str, Literal["asc", "desc"]]], Optional[list[str]], list[str]
+    ]:
+        if order is not None:
+            raise ValueError("order cannot be supplied with keyset")
+        keys = AbstractLpdbSession._parse_order(keyset)
+        # The keys of the last result are needed to request the next page
+        query, added_fields = AbstractLpdbSession._add_query_fields(
+            query, [key for key, _ in keys]
+        )
+        return keys, query, added_fields
+
+    @staticmethod
+    def _add_query_fields(
+        query: Optional[str | list[str]], fields: list[str]
+    ) -> tuple[Optional[list[str]], list[str]]:
+        """
+        Adds fields to a query, unless it already fetches every field.
+
+        :return: the fields of the query, and the fields that were added to it
+        """
+        if query is None:
+            return None, []
+        query_fields = (
+            [field.strip() for field in query.split(",")]
+            if isinstance(query, str)
+            else list(query)
+        )
+        added_fields = [
+            field for field in dict.fromkeys(fields) if field not in query_fields
+        ]
+        return query_fields + added_fields, added_fields
+
+    @staticmethod
+    def _remove_fields(
+        results: list[dict[str, Any]], fields: list[str]
+    ) -> list[dict[str, Any]]:
+        if len(fields) == 0:
+            return results
+        # The results may be shared with the cache, so they are copied rather than modified
+        return [
+            {field: value for field, value in result.items() if field not in fields}
+            for result in results
+        ]
+
+    @staticmethod
+    def _parse_order(
+        order: str | list[tuple[str, Literal["asc", "desc"]]],
+    ) -> list[tuple[str, Literal["asc", "desc"]]]:
+        if not isinstance(order, str):
+            return list(order)
+        rules = []
+        for rule in order.split(","):
+            field, _, direction = rule.strip().partition(" ")
+            rules.append((field, "desc" if direction.strip() == "desc" else "asc"))
+        return rules
+
+    @staticmethod
+    def _merge_results(
+        results: list[list[dict[str, Any]]],
+        order: Optional[list[tuple[str, Literal["asc", "desc"]]]],
+        limit: int,
+        offset: int,
+    ) -> list[dict[str, Any]]:
+        if order is None:
+            merged = itertools.chain.from_iterable(results)
+        else:
+            fields = [field for field, _ in order]
+            descending = [direction == "desc" for _, direction in order]
+            merged = heapq.merge(
+                *results,
+                key=lambda result: _OrderKey(
+                    [result.get(field) for field in fields], descending
+                ),
+            )
+        return list(itertools.islice(merged, offset, offset + limit))
+
+    @staticmethod
+    def _get_keyset_conditions(
+        conditions: Optional[str],
+        keys: list[tuple[str, Literal["asc", "desc"]]],
+        last_result: dict[str, Any],
+    ) -> str:
+        # (k1, k2) > (v1, v2) is expressed as [[k1::>v1]] OR ([[k1::v1]] AND [[k2::>v2]])
+        missing = [key for key, _ in keys if key not in last_result]
+        if len(missing) != 0:
+            raise ValueError(f"Keyset field(s) missing from results: {missing}")
+        clauses = []
+        for i, (key, direction) in enumerate(keys):
+            terms = [
+                f"[[{previous}::{last_result[previous]}]]" for previous, _ in keys[:i]
+            ]
+            comparison = ">" if direction == "asc" else "<"
+            terms.append(f"[[{key}::{comparison}{last_result[key]}]]")
+            clauses.append(" AND ".join(terms))
+        seek = " OR ".join(
+            f"({clause})" if len(clauses) > 1 and " AND " in clause else clause
+            for clause in clauses
+        )
+        if conditions is None:
+            return seek
+        return f"({conditions}) AND ({seek})"
+
+    def _get_cache_key(self, params: dict[str, Any]) -> str:
+        return f"{self._base_url}?{urlencode(sorted(params.items()))}"
+
+    def _decode_response(self, status_code: int, body: bytes) -> list[dict[str, Any]]:
+        try:
+            lpdb_response = self._json_loads(body)
+        except ValueError:
+            if status_code != HTTPStatus.OK:
+                raise LpdbHttpError(status_code)
+            raise
+        return AbstractLpdbSession._parse_results(status_code, lpdb_response)
+
+    def _check_raw_response(self, status_code: int, body: bytes) -> bytes:
+        if (
+            status_code == HTTPStatus.OK
+            and AbstractLpdbSession.__RAW_MESSAGES.search(body) is None
+        ):
+            return body
+        self._decode_response(status_code, body)
+        return body
+
     @staticmethod
     def _parse_results(
         status_code: int, response: LpdbResponse
@@ -312,31 +1250,319 @@ class AbstractLpdbSession(ABC):
                 )
             raise LpdbError(re.sub(r"^Error: ?", "", lpdb_errors[0]))
         elif status_code != HTTPStatus.OK:
-            status = HTTPStatus(status_code)
-            raise LpdbError(f"HTTP {status_code}: {status.name}")
+            raise LpdbHttpError(status_code)
         if lpdb_warnings and len(lpdb_warnings) != 0:
             for lpdb_warning in lpdb_warnings:
                 warnings.warn(lpdb_warning, LpdbWarning)
         return result
 
+    @staticmethod
+    def _parse_stream_chunk(
+        parser: ResultStreamParser, status_code: int, chunk: bytes
+    ) -> list[dict[str, Any]]:
+        rows = parser.feed(chunk)
+        if parser.errors:
+            AbstractLpdbSession._parse_results(
+                status_code, {**parser.members, "result": []}
+            )
+        return rows
+
+    def _get_request(
+        self, endpoint: str, wiki: str | list[str], params: dict[str, Any]
+    ) -> _Request:
+        return _Request(endpoint, wiki, params, self._get_cache_key(params))
+
+    def _get_query_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> _Request:
+        if not AbstractLpdbSession._validate_datatype_name(lpdb_datatype):
+            raise ValueError(f'Invalid LPDB data type: "{lpdb_datatype}"')
+        return self._get_request(
+            lpdb_datatype,
+            wiki,
+            AbstractLpdbSession._parse_params(
+                wiki=wiki,
+                limit=limit,
+                offset=offset,
+                conditions=conditions,
+                query=query,
+                order=order,
+                groupby=groupby,
+                **kwargs,
+            ),
+        )
+
+    def _get_batch_request(self, lpdb_request: LpdbRequest) -> _Request:
+        return self._get_query_request(
+            lpdb_request.lpdb_datatype,
+            lpdb_request.wiki,
+            limit=lpdb_request.limit,
+            offset=lpdb_request.offset,
+            conditions=lpdb_request.conditions,
+            query=lpdb_request.query,
+            order=lpdb_request.order,
+            groupby=lpdb_request.groupby,
+            **lpdb_request.params,
+        )
+
+    @staticmethod
+    def _get_fanout_requests(
+        lpdb_datatype: LpdbDataType,
+        wikis: list[str],
+        limit: int,
+        offset: int,
+        conditions: Optional[str],
+        query: Optional[str | list[str]],
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]],
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]],
+        params: dict[str, Any],
+    ) -> tuple[
+        list[LpdbRequest],
+        Optional[list[tuple[str, Literal["asc", "desc"]]]],
+        list[str],
+    ]:
+        if not AbstractLpdbSession._validate_datatype_name(lpdb_datatype):
+            raise ValueError(f'Invalid LPDB data type: "{lpdb_datatype}"')
+        added_fields = []
+        if order is not None:
+            order = AbstractLpdbSession._parse_order(order)
+            # The ordered fields are needed to merge the results
+            query, added_fields = AbstractLpdbSession._add_query_fields(
+                query, [field for field, _ in order]
+            )
+        lpdb_requests = [
+            LpdbRequest(
+                lpdb_datatype,
+                wiki,
+                limit=offset + limit,
+                conditions=conditions,
+                query=query,
+                order=order,
+                groupby=groupby,
+                params=params,
+            )
+            for wiki in wikis
+        ]
+        return lpdb_requests, order, added_fields
+
+    def _start_in_flight[T](
+        self, request: _Request, start: Callable[[], T]
+    ) -> tuple[T, bool]:
+        """
+        Looks up the load of an identical request in flight, starting one if there is none.
+
+        :param request: the request to load
+        :param start: function starting the load, returning a handle to wait on its result
+
+        :return: the handle of the load, and whether it was started by this call
+        """
+        with self.__lock:
+            in_flight = self.__in_flight.get((request.endpoint, request.cache_key))
+            if in_flight is not None:
+                return in_flight, False
+            in_flight = start()
+            self.__in_flight[(request.endpoint, request.cache_key)] = in_flight
+        return in_flight, True
+
+    def _end_in_flight(self, request: _Request) -> None:
+        with self.__lock:
+            self.__in_flight.pop((request.endpoint, request.cache_key), None)
+
+    def _get_steps(self, request: _Request) -> _Steps[list[dict[str, Any]]]:
+        if self._cache is not None:
+            cached = yield _CacheLookup(request.endpoint, request.cache_key)
+            if cached is not None:
+                if cached.stale:
+                    with self.__lock:
+                        key = (request.endpoint, request.cache_key)
+                        revalidate = key not in self.__revalidating
+                        self.__revalidating.add(key)
+                    if revalidate:
+                        yield _Revalidate(request)
+                return cached.value
+        if self._coalesce_requests:
+            return (yield _Coalesce(request))
+        return (yield from self._load_steps(request))
+
+    def _load_steps(self, request: _Request) -> _Steps[list[dict[str, Any]]]:
+        result, size = yield from self._send_steps(
+            request,
+            lambda response: (
+                self._decode_response(response.status, response.body),
+                len(response.body),
+            ),
+        )
+        if self._cache is not None:
+            yield _CacheStore(request.endpoint, request.cache_key, result, size)
+        return result
+
+    def _refresh_steps(self, request: _Request) -> _Steps[None]:
+        try:
+            yield from self._load_steps(request)
+        except Exception as error:
+            warnings.warn(f"Failed to refresh cached response: {error}", LpdbWarning)
+        finally:
+            with self.__lock:
+                self.__revalidating.discard((request.endpoint, request.cache_key))
+
+    def _raw_steps(self, request: _Request) -> _Steps[bytes]:
+        return (
+            yield from self._send_steps(
+                request,
+                lambda response: self._check_raw_response(
+                    response.status, response.body
+                ),
+            )
+        )
+
+    def _stream_steps(self, request: _Request) -> _Steps[Any]:
+        def check(response: Any) -> Any:
+            if response.status != HTTPStatus.OK:
+                self._decode_response(response.status, response.body)
+            return response
+
+        return (yield from self._send_steps(request, check, stream=True))
+
+    def _send_steps[T](
+        self,
+        request: _Request,
+        decode: Callable[[Any], T],
+        stream: bool = False,
+    ) -> _Steps[T]:
+        url = self._base_url + request.endpoint
+        attempt = 0
+        while True:
+            attempt += 1
+            if self._rate_limiter is not None:
+                yield _Acquire(request.wiki, request.endpoint)
+            retry_after = None
+            try:
+                if stream:
+                    response = yield _Open(
+                        url,
+                        request.params,
+                        self._get_header(),
+                        AbstractLpdbSession.STREAM_CHUNK_SIZE,
+                    )
+                else:
+                    response = yield _Send(url, request.params, self._get_header())
+                retry_after = response.headers.get("retry-after")
+                return decode(response)
+            except Exception as error:
+                delay = self._get_retry_delay(attempt, error, retry_after)
+                if delay is None:
+                    raise
+            yield _Sleep(delay)
+
+    def _wikis_steps(self) -> _Steps[set[str]]:
+        wikis = self._get_cached_wikis()
+        if wikis is not None:
+            return wikis
+        response = yield _Send(
+            AbstractLpdbSession.WIKIS_URL, None, self._get_public_header()
+        )
+        wikis = set(self._json_loads(response.body)["allwikis"].keys())
+        self._store_wikis(wikis)
+        return wikis
+
+    def _team_template_steps(
+        self, wiki: str, template: str, date: Optional[date]
+    ) -> _Steps[Optional[dict[str, Any]]]:
+        params = {
+            "wiki": wiki,
+            "template": template,
+        }
+        if date is not None:
+            params["date"] = date.isoformat()
+            if self._team_template_index is not None:
+                found, team_template = self._team_template_index.lookup(
+                    wiki, template, date
+                )
+                if found:
+                    return team_template
+        team_template = (
+            yield from self._get_steps(self._get_request("teamtemplate", wiki, params))
+        )[0]
+        if date is not None and self._team_template_index is not None:
+            self._team_template_index.observe(wiki, template, date, team_template)
+        return team_template
+
+    def _team_template_list_steps(
+        self, wiki: str, pagination: int
+    ) -> _Steps[list[dict[str, Any]]]:
+        return (
+            yield from self._get_steps(
+                self._get_request(
+                    "teamtemplatelist", wiki, {"wiki": wiki, "pagination": pagination}
+                )
+            )
+        )
+
 
 class LpdbSession(AbstractLpdbSession, AbstractContextManager):
     """
     Implementation of a LPDB session
     """
 
-    __session: requests.Session
-
-    def __init__(self, api_key: str, base_url=AbstractLpdbSession.BASE_URL):
+    def __init__(
+        self,
+        api_key: str,
+        base_url=AbstractLpdbSession.BASE_URL,
+        rate_limiter: Optional[LpdbRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[LpdbCache] = None,
+        coalesce_requests: bool = False,
+        team_template_index: Optional[TeamTemplateIndex] = None,
+        wikis_ttl: float = 24 * 60 * 60,
+        wikis_cache_path: Optional[str | os.PathLike[str]] = None,
+        json_loads: Optional[JsonLoads] = None,
+        transport_config: Optional[TransportConfig] = None,
+        transport: Optional[Transport] = None,
+    ):
         """
         Creates a new LpdbSession with the specified API key.
 
+        The session can be shared between threads, which share its pool of connections.
+
         :param api_key: API key for LPDB
         :param base_url: Base URL of LPDB API endpoint
+        :param rate_limiter: rate limiter to wait on before each request, requests are not limited if not supplied
+        :param retry_policy: policy for retrying failed requests, failed requests are not retried if not supplied
+        :param cache: cache to serve repeated requests from, responses are not cached if not supplied
+        :param coalesce_requests: whether identical requests made concurrently from multiple threads share a single
+            HTTP request, in which case they also share the returned result
+        :param team_template_index: index to look up and record team templates requested with a date
+        :param wikis_ttl: time in seconds for which the set of wikis fetched by `get_wikis` is reused
+        :param wikis_cache_path: file to persist the set of wikis fetched by `get_wikis` to
+        :param json_loads: function decoding response bodies, raising `ValueError` on invalid JSON; if not supplied,
+            orjson or msgspec is used when installed, and the standard `json` module otherwise
+        :param transport_config: configuration of the connection pool, whose `pool_maxsize` should be at least the
+            number of threads making requests at once; the default configuration is used if not supplied
+        :param transport: transport to send requests with, a `RequestsTransport` configured by `transport_config` if
+            not supplied
         """
-        super().__init__(api_key, base_url=base_url)
-        self.__session = requests.Session()
-        self.__session.headers.update(self._get_header())
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            team_template_index=team_template_index,
+            wikis_ttl=wikis_ttl,
+            wikis_cache_path=wikis_cache_path,
+            json_loads=json_loads,
+        )
+        self.__transport = transport or RequestsTransport(transport_config)
 
     def __exit__(
         self,
@@ -346,19 +1572,88 @@ class LpdbSession(AbstractLpdbSession, AbstractContextManager):
     ) -> None:
         self.close()
 
-    @staticmethod
-    def get_wikis() -> set[str]:
-        response = requests.get(
-            "https://liquipedia.net/api.php",
-            headers={"accept": "application/json", "accept-encoding": "gzip"},
-        )
-        wikis = response.json()
-        return set(wikis["allwikis"].keys())
+    @override
+    def warmup(self, connections: int = 1) -> None:
+        self.__transport.warmup(self._base_url, connections, self._get_header())
+
+    @override
+    def get_wikis(self) -> set[str]:
+        return self.__run(self._wikis_steps())
 
     @staticmethod
-    def __handle_response(response: requests.Response) -> list[dict[str, Any]]:
-        status = HTTPStatus(response.status_code)
-        return AbstractLpdbSession._parse_results(status, response.json())
+    def fetch_wikis() -> set[str]:
+        """
+        Fetches the set of all available wikis without creating a session first. The set is not cached.
+
+        :return: set of all available wiki names
+        """
+        with LpdbSession("") as session:
+            return session.get_wikis()
+
+    def __run[T](self, steps: _Steps[T]) -> T:
+        result = None
+        error = None
+        while True:
+            try:
+                step = steps.send(result) if error is None else steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = self.__perform(step), None
+            except BaseException as step_error:
+                result, error = None, step_error
+
+    def __perform(self, step: Any) -> Any:
+        if isinstance(step, _Send):
+            return self.__transport.get(
+                step.url, params=step.params, headers=step.headers
+            )
+        elif isinstance(step, _Acquire):
+            self._rate_limiter.acquire(step.wiki, step.table)
+        elif isinstance(step, _Sleep):
+            time.sleep(step.delay)
+        elif isinstance(step, _CacheLookup):
+            return self._cache.lookup(step.endpoint, step.key)
+        elif isinstance(step, _CacheStore):
+            self._cache.set(step.endpoint, step.key, step.value, size=step.size)
+        elif isinstance(step, _Coalesce):
+            return self.__coalesce(step.request)
+        elif isinstance(step, _Revalidate):
+            threading.Thread(
+                target=self.__run,
+                args=(self._refresh_steps(step.request),),
+                daemon=True,
+            ).start()
+        elif isinstance(step, _Open):
+            response = self.__transport.stream(
+                step.url,
+                params=step.params,
+                headers=step.headers,
+                chunk_size=step.chunk_size,
+            )
+            if response.status == HTTPStatus.OK:
+                return response
+            with response:
+                return TransportResponse(
+                    response.status, response.headers, response.read()
+                )
+        else:
+            raise TypeError(f"Unknown step: {step!r}")
+
+    def __coalesce(self, request: _Request) -> list[dict[str, Any]]:
+        in_flight, is_owner = self._start_in_flight(request, Future)
+        if not is_owner:
+            return in_flight.result()
+        try:
+            result = self.__run(self._load_steps(request))
+        except BaseException as error:
+            in_flight.set_exception(error)
+            raise
+        else:
+            in_flight.set_result(result)
+            return result
+        finally:
+            self._end_in_flight(request)
 
     @override
     def make_request(
@@ -373,22 +1668,261 @@ class LpdbSession(AbstractLpdbSession, AbstractContextManager):
         groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
         **kwargs,
     ) -> list[dict[str, Any]]:
-        if not AbstractLpdbSession._validate_datatype_name(lpdb_datatype):
-            raise ValueError(f'Invalid LPDB data type: "{lpdb_datatype}"')
-        lpdb_response = self.__session.get(
-            self._base_url + lpdb_datatype,
-            params=AbstractLpdbSession._parse_params(
-                wiki=wiki,
-                limit=limit,
-                offset=offset,
+        request = self._get_query_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        return self.__run(self._get_steps(request))
+
+    @override
+    def make_typed_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> LpdbResults[LpdbBaseResponseData]:
+        results = self.make_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        return LpdbResults(DATA_TYPE_WRAPPERS[lpdb_datatype], results)
+
+    @override
+    def fetch_many(
+        self,
+        lpdb_requests: Iterable[LpdbRequest],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[list[dict[str, Any]] | Exception]:
+        """
+        Makes LPDB query requests concurrently, each in a thread.
+
+        :param lpdb_requests: the requests to make
+        :param max_workers: the maximum number of threads making requests at once, `pool_maxsize` of the transport
+            if not supplied
+        :param return_exceptions: whether the errors of failed requests are returned in place of their results instead
+            of being raised
+
+        :return: the results of each request, in the order of `lpdb_requests`
+
+        :raises ValueError: if an invalid `lpdb_datatype` is supplied
+        :raises LpdbError: if something went wrong with any of the requests
+        """
+        lpdb_requests = list(lpdb_requests)
+        if len(lpdb_requests) == 0:
+            return []
+        max_workers = max_workers or self.__transport.pool_maxsize
+        if max_workers is not None:
+            max_workers = min(max_workers, len(lpdb_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    lambda lpdb_request: self.__run(
+                        self._get_steps(self._get_batch_request(lpdb_request))
+                    ),
+                    lpdb_request,
+                )
+                for lpdb_request in lpdb_requests
+            ]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as error:
+                    if not return_exceptions:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    results.append(error)
+        return results
+
+    @override
+    def make_fanout_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wikis: list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        lpdb_requests, order, added_fields = AbstractLpdbSession._get_fanout_requests(
+            lpdb_datatype,
+            wikis,
+            limit,
+            offset,
+            conditions,
+            query,
+            order,
+            groupby,
+            kwargs,
+        )
+        results = self.fetch_many(lpdb_requests, max_workers=concurrency or len(wikis))
+        return AbstractLpdbSession._remove_fields(
+            AbstractLpdbSession._merge_results(results, order, limit, offset),
+            added_fields,
+        )
+
+    @override
+    def iter_pages(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[list[dict[str, Any]]]:
+        cursor = _PageCursor(page_size, offset, conditions, query, order, keyset)
+        while not cursor.done:
+            page = self.make_request(
+                lpdb_datatype, wiki, groupby=groupby, **cursor.params, **kwargs
+            )
+            page = cursor.advance(page)
+            if len(page) != 0:
+                yield page
+
+    @override
+    def iter_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        keyset: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        for page in self.iter_pages(
+            lpdb_datatype,
+            wiki,
+            page_size=page_size,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            keyset=keyset,
+            **kwargs,
+        ):
+            yield from page
+
+    @override
+    def stream_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        request = self._get_query_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        with self.__run(self._stream_steps(request)) as response:
+            parser = ResultStreamParser()
+            for chunk in response.chunks:
+                yield from AbstractLpdbSession._parse_stream_chunk(
+                    parser, response.status, chunk
+                )
+            yield from AbstractLpdbSession._parse_results(
+                response.status, parser.close()
+            )
+
+    @override
+    def make_raw_request(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str | list[str],
+        limit: int = 20,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        groupby: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> bytes:
+        request = self._get_query_request(
+            lpdb_datatype,
+            wiki,
+            limit=limit,
+            offset=offset,
+            conditions=conditions,
+            query=query,
+            order=order,
+            groupby=groupby,
+            **kwargs,
+        )
+        return self.__run(self._raw_steps(request))
+
+    @override
+    def iter_raw_pages(
+        self,
+        lpdb_datatype: LpdbDataType,
+        wiki: str,
+        page_size: int = AbstractLpdbSession.MAX_LIMIT,
+        offset: int = 0,
+        conditions: Optional[str] = None,
+        query: Optional[str | list[str]] = None,
+        order: Optional[str | list[tuple[str, Literal["asc", "desc"]]]] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        page_size = min(page_size, AbstractLpdbSession.MAX_LIMIT)
+        count = self.make_count_request(lpdb_datatype, wiki, conditions=conditions)
+        for page_offset in range(offset, count, page_size):
+            yield self.make_raw_request(
+                lpdb_datatype,
+                wiki,
+                limit=page_size,
+                offset=page_offset,
                 conditions=conditions,
                 query=query,
                 order=order,
-                groupby=groupby,
                 **kwargs,
-            ),
-        )
-        return LpdbSession.__handle_response(lpdb_response)
+            )
 
     @override
     def make_count_request(
@@ -406,30 +1940,16 @@ class LpdbSession(AbstractLpdbSession, AbstractContextManager):
     def get_team_template(
         self, wiki: str, template: str, date: Optional[date] = None
     ) -> Optional[dict[str, Any]]:
-        params = {
-            "wiki": wiki,
-            "template": template,
-        }
-        if date is not None:
-            params["date"] = date.isoformat()
-        lpdb_response = self.__session.get(
-            self._base_url + "teamtemplate",
-            params=params,
-        )
-        return LpdbSession.__handle_response(lpdb_response)[0]
+        return self.__run(self._team_template_steps(wiki, template, date))
 
     @override
     def get_team_template_list(
         self, wiki: str, pagination: int = 1
     ) -> list[dict[str, Any]]:
-        lpdb_response = self.__session.get(
-            self._base_url + "teamtemplatelist",
-            params={"wiki": wiki, "pagination": pagination},
-        )
-        return LpdbSession.__handle_response(lpdb_response)
+        return self.__run(self._team_template_list_steps(wiki, pagination))
 
     def close(self):
         """
         Closes this LpdbSession.
         """
-        self.__session.close()
+        self.__transport.close()
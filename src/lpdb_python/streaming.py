@@ -0,0 +1,158 @@
+"""
+Incremental parsing of LPDB response bodies.
+"""
+
+import codecs
+import json
+
+from typing import Any, Final
+
+__all__ = ["ResultStreamParser"]
+
+_WHITESPACE: Final[str] = " \t\n\r"
+
+
+class ResultStreamParser:
+    """
+    Incremental parser of an LPDB response body.
+
+    Chunks of the body are fed as they are received, and each row of the `result` array is returned as soon as
+    it is complete, so that only the rows in progress are held in memory.
+    The other members of the response, namely `error` and `warning`, are collected as a whole.
+    """
+
+    def __init__(self):
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        self.__state = "start"
+        self.__key = None
+        self.members: dict[str, Any] = dict()
+        """
+        The members of the response other than `result` that have been parsed so far
+        """
+
+    @property
+    def errors(self) -> list[str]:
+        """
+        The errors in the response parsed so far
+        """
+        return self.members.get("error") or []
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """
+        Parses a chunk of the response body.
+
+        :param chunk: the next chunk of the response body
+
+        :return: the rows of the `result` array completed by this chunk
+
+        :raises ValueError: if the response body is not a JSON object
+        """
+        return self.__parse(self.__decoder.decode(chunk))
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finishes parsing the response body.
+
+        :return: the response with an empty `result`, to be checked for errors and warnings
+
+        :raises ValueError: if the response body was incomplete
+        """
+        self.__parse(self.__decoder.decode(b"", final=True))
+        if self.__state != "end" or self.__skip_whitespace():
+            raise ValueError("Incomplete LPDB response")
+        return {**self.members, "result": []}
+
+    def __parse(self, text: str) -> list[dict[str, Any]]:
+        self.__buffer = self.__buffer[self.__position :] + text
+        self.__position = 0
+        rows = []
+        while self.__step(rows):
+            pass
+        return rows
+
+    def __skip_whitespace(self) -> bool:
+        buffer = self.__buffer
+        position = self.__position
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        self.__position = position
+        return position < len(buffer)
+
+    def __expect(self, tokens: str) -> str:
+        token = self.__buffer[self.__position]
+        if token not in tokens:
+            raise ValueError(
+                f"Expected one of {tokens!r} at {self.__position}, found {token!r}"
+            )
+        self.__position += 1
+        return token
+
+    def __decode_value(self) -> tuple[bool, Any]:
+        try:
+            value, end = self.__json_decoder.raw_decode(self.__buffer, self.__position)
+        except json.JSONDecodeError:
+            # The value is most likely still incomplete; it is validated again once more data arrives
+            return False, None
+        if end == len(self.__buffer) and type(value) in (int, float):
+            # The number may continue in the next chunk
+            return False, None
+        self.__position = end
+        return True, value
+
+    def __step(self, rows: list[dict[str, Any]]) -> bool:
+        if self.__state == "end" or not self.__skip_whitespace():
+            return False
+        match self.__state:
+            case "start":
+                self.__expect("{")
+                self.__state = "key"
+            case "key":
+                if self.__buffer[self.__position] == "}":
+                    self.__position += 1
+                    self.__state = "end"
+                    return True
+                complete, key = self.__decode_value()
+                if not complete:
+                    return False
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected a key before {self.__position}")
+                self.__key = key
+                self.__state = "colon"
+            case "colon":
+                self.__expect(":")
+                self.__state = "result" if self.__key == "result" else "value"
+            case "value":
+                complete, value = self.__decode_value()
+                if not complete:
+                    return False
+                self.members[self.__key] = value
+                self.__state = "after_value"
+            case "after_value":
+                if self.__expect(",}") == ",":
+                    self.__state = "key"
+                else:
+                    self.__state = "end"
+            case "result":
+                self.__expect("[")
+                self.__state = "first_row"
+            case "first_row":
+                if self.__buffer[self.__position] == "]":
+                    self.__position += 1
+                    self.__state = "after_value"
+                else:
+                    self.__state = "row"
+            case "row":
+                complete, row = self.__decode_value()
+                if not complete:
+                    return False
+                rows.append(row)
+                self.__state = "after_row"
+            case "after_row":
+                if self.__expect(",]") == ",":
+                    self.__state = "row"
+                else:
+                    self.__state = "after_value"
+        return True
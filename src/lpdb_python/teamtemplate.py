@@ -0,0 +1,368 @@
+"""
+Bulk resolution of team templates.
+"""
+
+import json
+import os
+import threading
+
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from datetime import date, datetime, UTC
+from typing import Any, Iterable, Optional, override, TYPE_CHECKING
+
+from .defs import Match
+
+if TYPE_CHECKING:
+    from .session import LpdbSession
+
+__all__ = ["TeamTemplateIndex", "TeamTemplateResolver"]
+
+type TeamTemplateQuery = str | tuple[str, Optional[date]]
+"""
+A team template name, optionally paired with the contextual date for the team template
+"""
+
+
+def _normalize_template(template: str) -> str:
+    return template.strip().lower().replace("_", " ")
+
+
+def _resolves_to(team_template: Optional[dict[str, Any]]) -> Optional[str]:
+    if team_template is None:
+        return None
+    return team_template.get("template")
+
+
+class _TemplateTimeline:
+    """
+    Disjoint date intervals over which a team template is known to resolve to the same team template.
+    """
+
+    __slots__ = ("starts", "ends", "team_templates")
+
+    def __init__(self):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.team_templates: list[Optional[dict[str, Any]]] = []
+
+    def find(self, day: int) -> int:
+        i = bisect_right(self.starts, day) - 1
+        if i >= 0 and day <= self.ends[i]:
+            return i
+        return -1
+
+    def insert(self, day: int, team_template: Optional[dict[str, Any]]) -> bool:
+        i = self.find(day)
+        if i >= 0:
+            if _resolves_to(self.team_templates[i]) == _resolves_to(team_template):
+                return False
+            # The interval is split at the day, keeping the days on either side of it
+            start, end, previous = self.starts[i], self.ends[i], self.team_templates[i]
+            del self.starts[i], self.ends[i], self.team_templates[i]
+            if day < end:
+                self.starts.insert(i, day + 1)
+                self.ends.insert(i, end)
+                self.team_templates.insert(i, previous)
+            if start < day:
+                self.starts.insert(i, start)
+                self.ends.insert(i, day - 1)
+                self.team_templates.insert(i, previous)
+        i = bisect_right(self.starts, day)
+        self.starts.insert(i, day)
+        self.ends.insert(i, day)
+        self.team_templates.insert(i, team_template)
+        if i + 1 < len(self.starts) and _resolves_to(
+            self.team_templates[i + 1]
+        ) == _resolves_to(team_template):
+            self.ends[i] = self.ends[i + 1]
+            del self.starts[i + 1], self.ends[i + 1], self.team_templates[i + 1]
+        if i > 0 and _resolves_to(self.team_templates[i - 1]) == _resolves_to(
+            team_template
+        ):
+            self.ends[i - 1] = self.ends[i]
+            del self.starts[i], self.ends[i], self.team_templates[i]
+        return True
+
+
+class TeamTemplateIndex:
+    """
+    Date-aware index of team templates, optionally persisted to a file.
+
+    Each time a team template is resolved for a date, the result is recorded for that date.
+    Dates between two records that resolved to the same team template are assumed to resolve to it as well,
+    so the records of a team template form a sorted list of validity intervals, which is searched in `O(log n)`.
+    This assumption does not hold for a team template that changed and later changed back, e.g. from A to B and back
+    to A, until a record within the interval reveals the change and splits the interval at its date.
+    The index grows incrementally from requests made by sessions that use it, and from matches passed to
+    `observe_match`.
+    """
+
+    def __init__(self, path: Optional[str | os.PathLike[str]] = None):
+        """
+        Creates a new TeamTemplateIndex, loading the records stored at `path` if the file exists.
+
+        :param path: the file to persist the index to with `save`
+        """
+        self.path = path
+        self.__wikis: dict[str, dict[str, _TemplateTimeline]] = dict()
+        self.__lock = threading.Lock()
+        self.__dirty = False
+        if path is not None and os.path.exists(path):
+            self.__load(path)
+
+    def __load(self, path: str | os.PathLike[str]) -> None:
+        with open(path, encoding="utf-8") as index_file:
+            stored = json.load(index_file)
+        for wiki, templates in stored.items():
+            timelines = self.__wikis.setdefault(wiki, dict())
+            for template, intervals in templates.items():
+                timeline = _TemplateTimeline()
+                for start, end, team_template in intervals:
+                    timeline.starts.append(start)
+                    timeline.ends.append(end)
+                    timeline.team_templates.append(team_template)
+                timelines[template] = timeline
+
+    def lookup(
+        self, wiki: str, template: str, date: date
+    ) -> tuple[bool, Optional[dict[str, Any]]]:
+        """
+        Looks up a team template in this index.
+
+        :param wiki: the wiki of the team template
+        :param template: the name of team template
+        :param date: the contextual date for the requested team template
+
+        :return: whether the team template is known for the date, and the team template if it is,
+            which may be `None` if the team template is known not to exist
+        """
+        with self.__lock:
+            timeline = self.__wikis.get(wiki, {}).get(_normalize_template(template))
+            if timeline is None:
+                return False, None
+            i = timeline.find(date.toordinal())
+            if i < 0:
+                return False, None
+            return True, timeline.team_templates[i]
+
+    def observe(
+        self,
+        wiki: str,
+        template: str,
+        date: date,
+        team_template: Optional[dict[str, Any]],
+    ) -> None:
+        """
+        Records what a team template resolved to on a date.
+
+        :param wiki: the wiki of the team template
+        :param template: the name of team template
+        :param date: the contextual date of the team template
+        :param team_template: the resolved team template, `None` if the team template did not exist
+        """
+        if isinstance(date, datetime):
+            date = date.date()
+        with self.__lock:
+            timeline = self.__wikis.setdefault(wiki, dict()).setdefault(
+                _normalize_template(template), _TemplateTimeline()
+            )
+            if timeline.insert(date.toordinal(), team_template):
+                self.__dirty = True
+
+    def observe_match(self, match: Match) -> None:
+        """
+        Records the team templates of the opponents in a match, which LPDB resolved for the date of the match.
+
+        :param match: the match
+        """
+        if match.date is None or match.wiki is None:
+            return
+        for opponent in match.match2opponents:
+            team_template = opponent._rawGet("teamtemplate")
+            if opponent.template is not None and team_template is not None:
+                self.observe(
+                    match.wiki,
+                    opponent.template,
+                    match.date.astimezone(UTC),
+                    team_template,
+                )
+
+    def save(self) -> None:
+        """
+        Writes this index to its file, if anything has changed since it was loaded or last saved.
+
+        :raises ValueError: if this index has no file
+        """
+        if self.path is None:
+            raise ValueError("TeamTemplateIndex has no path to save to")
+        with self.__lock:
+            if not self.__dirty:
+                return
+            stored = {
+                wiki: {
+                    template: [
+                        [start, end, team_template]
+                        for start, end, team_template in zip(
+                            timeline.starts, timeline.ends, timeline.team_templates
+                        )
+                    ]
+                    for template, timeline in templates.items()
+                }
+                for wiki, templates in self.__wikis.items()
+            }
+            temporary_path = f"{os.fspath(self.path)}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as index_file:
+                json.dump(stored, index_file, separators=(",", ":"))
+            os.replace(temporary_path, self.path)
+            self.__dirty = False
+
+
+class AbstractTeamTemplateResolver(ABC):
+    """
+    An abstract resolver of team templates for a single wiki.
+
+    Team templates without a date are served from an index built by paging through the team template list of the
+    wiki, so that the number of requests depends on the number of pages rather than the number of lookups.
+    Team templates with a date are requested individually, once for each distinct `(template, date)` pair.
+    Both found and missing team templates are remembered.
+    """
+
+    def __init__(self, wiki: str):
+        self.wiki = wiki
+        self._index: Optional[dict[str, dict[str, Any]]] = None
+        self._dated: dict[tuple[str, date], Optional[dict[str, Any]]] = dict()
+
+    @staticmethod
+    def _split_query(query: TeamTemplateQuery) -> tuple[str, Optional[date]]:
+        if isinstance(query, str):
+            return _normalize_template(query), None
+        return _normalize_template(query[0]), query[1]
+
+    def _build_index(self, pages: Iterable[list[dict[str, Any]]]) -> None:
+        index = dict()
+        for page in pages:
+            for team_template in page:
+                index[_normalize_template(team_template["template"])] = team_template
+        self._index = index
+
+    def _collect(
+        self, queries: list[TeamTemplateQuery]
+    ) -> dict[TeamTemplateQuery, Optional[dict[str, Any]]]:
+        resolved = dict()
+        for query in queries:
+            template, template_date = AbstractTeamTemplateResolver._split_query(query)
+            if template_date is None:
+                resolved[query] = self._index.get(template)
+            else:
+                resolved[query] = self._dated[(template, template_date)]
+        return resolved
+
+    def _missing_dated(
+        self, queries: list[TeamTemplateQuery]
+    ) -> list[tuple[str, date]]:
+        missing = dict()
+        for query in queries:
+            template, template_date = AbstractTeamTemplateResolver._split_query(query)
+            if (
+                template_date is not None
+                and (template, template_date) not in self._dated
+            ):
+                missing[(template, template_date)] = None
+        return list(missing)
+
+    @staticmethod
+    def _needs_index(queries: list[TeamTemplateQuery]) -> bool:
+        return any(
+            AbstractTeamTemplateResolver._split_query(query)[1] is None
+            for query in queries
+        )
+
+    @abstractmethod
+    def resolve(
+        self, queries: Iterable[TeamTemplateQuery]
+    ) -> dict[TeamTemplateQuery, Optional[dict[str, Any]]]:
+        """
+        Resolves team templates in bulk.
+
+        :param queries: team template names, each optionally paired with a contextual date
+
+        :return: the resolved team template for each of the queries, `None` if the team template does not exist
+
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    @abstractmethod
+    def get(
+        self, template: str, date: Optional[date] = None
+    ) -> Optional[dict[str, Any]]:
+        """
+        Resolves a single team template.
+
+        :param template: the name of team template
+        :param date: the contextual date for the requested team template
+
+        :return: the resolved team template, `None` if the team template does not exist
+
+        :raises LpdbError: if something went wrong with the request
+        """
+        pass
+
+    def clear(self) -> None:
+        """
+        Forgets all resolved team templates, so that they are requested again.
+        """
+        self._index = None
+        self._dated.clear()
+
+
+class TeamTemplateResolver(AbstractTeamTemplateResolver):
+    """
+    Resolver of team templates for a single wiki.
+    """
+
+    def __init__(self, session: "LpdbSession", wiki: str):
+        """
+        Creates a new TeamTemplateResolver.
+
+        :param session: the session to make requests with
+        :param wiki: the wiki to resolve team templates for
+        """
+        super().__init__(wiki)
+        self.__session = session
+        self.__lock = threading.Lock()
+
+    def __iter_team_template_pages(self):
+        pagination = 1
+        while True:
+            page = self.__session.get_team_template_list(
+                self.wiki, pagination=pagination
+            )
+            if len(page) == 0:
+                return
+            yield page
+            pagination += 1
+
+    @override
+    def resolve(
+        self, queries: Iterable[TeamTemplateQuery]
+    ) -> dict[TeamTemplateQuery, Optional[dict[str, Any]]]:
+        queries = list(queries)
+        with self.__lock:
+            if self._index is None and AbstractTeamTemplateResolver._needs_index(
+                queries
+            ):
+                self._build_index(self.__iter_team_template_pages())
+            for template, template_date in self._missing_dated(queries):
+                self._dated[(template, template_date)] = (
+                    self.__session.get_team_template(self.wiki, template, template_date)
+                )
+            return self._collect(queries)
+
+    @override
+    def get(
+        self, template: str, date: Optional[date] = None
+    ) -> Optional[dict[str, Any]]:
+        query = template if date is None else (template, date)
+        return self.resolve([query])[query]
@@ -0,0 +1,467 @@
+"""
+In-memory fake of the LPDB API, for testing and benchmarking code using LPDB sessions without network access.
+
+`FakeLpdbBackend` serves queries, counts and team templates from fixtures added to it, and can be made to respond
+slowly or with errors. Sessions are connected to it with `FakeTransport` or `AsyncFakeTransport`:
+
+```python
+backend = FakeLpdbBackend(latency=0.05)
+backend.add_results("match", "leagueoflegends", matches)
+session = LpdbSession("", transport=FakeTransport(backend))
+```
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+
+from collections import deque
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Mapping, Optional, override
+from urllib.parse import urlsplit
+
+from .session import AbstractLpdbSession
+from .transport import AsyncTransport, Transport, TransportResponse
+
+__all__ = ["AsyncFakeTransport", "FakeLpdbBackend", "FakeTransport"]
+
+type _Predicate = Callable[[Mapping[str, Any]], bool]
+
+_CONDITION_TOKEN: re.Pattern[str] = re.compile(
+    r"\s*(?:\[\[(?P<field>[^:\]]+)::(?P<value>.*?)\]\]|(?P<paren>[()])|(?P<operator>AND|OR)\b)",
+    re.IGNORECASE,
+)
+
+
+def _compare(value: Any, other: str) -> int:
+    if isinstance(value, (int, float)):
+        try:
+            number = float(other)
+        except ValueError:
+            pass
+        else:
+            return (value > number) - (value < number)
+    if value is None:
+        value = ""
+    elif not isinstance(value, str):
+        value = str(value)
+    return (value > other) - (value < other)
+
+
+def _compile_condition(field: str, value: str) -> _Predicate:
+    field = field.strip()
+    if value.startswith("!"):
+        return lambda row: _compare(row.get(field), value[1:]) != 0
+    elif value.startswith(">"):
+        return lambda row: _compare(row.get(field), value[1:]) > 0
+    elif value.startswith("<"):
+        return lambda row: _compare(row.get(field), value[1:]) < 0
+    return lambda row: _compare(row.get(field), value) == 0
+
+
+def _compile_conditions(conditions: str) -> _Predicate:
+    tokens = []
+    position = 0
+    conditions = conditions.rstrip()
+    while position < len(conditions):
+        match = _CONDITION_TOKEN.match(conditions, position)
+        if match is None:
+            raise ValueError(f"Invalid conditions: {conditions}")
+        tokens.append(match)
+        position = match.end()
+
+    def parse(index: int, operator: str) -> tuple[_Predicate, int]:
+        # OR binds looser than AND
+        operand = "AND" if operator == "OR" else None
+        predicates = []
+        while True:
+            if operand is not None:
+                predicate, index = parse(index, operand)
+            elif index < len(tokens) and tokens[index]["paren"] == "(":
+                predicate, index = parse(index + 1, "OR")
+                if index >= len(tokens) or tokens[index]["paren"] != ")":
+                    raise ValueError(f"Unbalanced parentheses: {conditions}")
+                index += 1
+            elif index < len(tokens) and tokens[index]["field"] is not None:
+                predicate = _compile_condition(
+                    tokens[index]["field"], tokens[index]["value"]
+                )
+                index += 1
+            else:
+                raise ValueError(f"Invalid conditions: {conditions}")
+            predicates.append(predicate)
+            if (
+                index >= len(tokens)
+                or (tokens[index]["operator"] or "").upper() != operator
+            ):
+                break
+            index += 1
+        if len(predicates) == 1:
+            return predicates[0], index
+        elif operator == "OR":
+            return lambda row: any(predicate(row) for predicate in predicates), index
+        return lambda row: all(predicate(row) for predicate in predicates), index
+
+    predicate, index = parse(0, "OR")
+    if index != len(tokens):
+        raise ValueError(f"Invalid conditions: {conditions}")
+    return predicate
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, "" if value is None else str(value))
+
+
+def _parse_rules(rules: str) -> list[tuple[str, bool]]:
+    parsed = []
+    for rule in rules.split(","):
+        field, _, direction = rule.strip().partition(" ")
+        parsed.append((field, direction.strip().lower() == "desc"))
+    return parsed
+
+
+def _sort(rows: list[Mapping[str, Any]], rules: str) -> list[Mapping[str, Any]]:
+    for field, descending in reversed(_parse_rules(rules)):
+        rows = sorted(
+            rows, key=lambda row: _sort_key(row.get(field)), reverse=descending
+        )
+    return rows
+
+
+def _aggregate(function: str, values: list[Any]) -> Any:
+    if function == "count":
+        return len(values)
+    numbers = [float(value) for value in values if value not in (None, "")]
+    if function == "sum":
+        return sum(numbers)
+    elif len(numbers) == 0:
+        return None
+    elif function == "min":
+        return min(numbers)
+    elif function == "max":
+        return max(numbers)
+    elif function == "avg":
+        return sum(numbers) / len(numbers)
+    raise ValueError(f'Invalid aggregate function: "{function}"')
+
+
+class FakeLpdbBackend:
+    """
+    In-memory fake of the LPDB API.
+
+    Queries support the parameters of `make_request`: the `[[field::value]]`, `[[field::!value]]`,
+    `[[field::>value]]` and `[[field::<value]]` conditions joined with `AND`, `OR` and parentheses, the selection of
+    fields and of `count`, `sum`, `min`, `max` and `avg` aggregates in `query`, `order`, `groupby`, `limit` and
+    `offset`. Values are compared as numbers when the field is numeric, and as strings otherwise.
+
+    The backend is safe to share between threads, and between sessions.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: float = 1.0,
+        team_template_page_size: int = 500,
+    ):
+        """
+        Creates an empty backend.
+
+        :param latency: the time in seconds taken by each response
+        :param rate_limit: the maximum number of requests per wiki and table within `rate_limit_window`, requests
+            over it are answered with a rate limit error; not limited if `None`
+        :param rate_limit_window: the time in seconds over which `rate_limit` applies
+        :param team_template_page_size: the number of team templates per page of `get_team_template_list`
+        """
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.team_template_page_size = team_template_page_size
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+        """
+        The endpoint and parameters of each request received, the endpoint of `get_wikis` being `api.php`
+        """
+        self.__results: dict[str, list[dict[str, Any]]] = dict()
+        self.__team_templates: dict[str, dict[str, dict[str, Any]]] = dict()
+        self.__failures: deque[Optional[TransportResponse]] = deque()
+        self.__request_times: dict[tuple[str, str], deque[float]] = dict()
+        self.__lock = threading.Lock()
+
+    def add_results(
+        self,
+        lpdb_datatype: str,
+        wiki: str,
+        results: Iterable[Mapping[str, Any]],
+    ) -> None:
+        """
+        Adds results of a data type to a wiki.
+
+        :param lpdb_datatype: the data type of the results
+        :param wiki: the wiki of the results, which is set as their `wiki` field
+        :param results: the results to add
+        """
+        rows = [{**result, "wiki": wiki} for result in results]
+        with self.__lock:
+            self.__results.setdefault(lpdb_datatype, []).extend(rows)
+
+    def add_team_templates(
+        self, wiki: str, team_templates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """
+        Adds team templates to a wiki. The date of team template requests is ignored.
+
+        :param wiki: the wiki of the team templates
+        :param team_templates: the team templates by their names
+        """
+        with self.__lock:
+            self.__team_templates.setdefault(wiki, dict()).update(
+                (name, dict(team_template))
+                for name, team_template in team_templates.items()
+            )
+
+    def inject_rate_limit(
+        self, count: int = 1, retry_after: Optional[float] = None, after: int = 0
+    ) -> None:
+        """
+        Makes the next requests fail with a rate limit error.
+
+        :param count: the number of requests to fail
+        :param retry_after: the value of the `Retry-After` header of the failed responses, none if `None`
+        :param after: the number of requests to respond to normally before failing
+        """
+        headers = dict() if retry_after is None else {"retry-after": str(retry_after)}
+        self.__inject(
+            TransportResponse(HTTPStatus.TOO_MANY_REQUESTS, headers, b""), count, after
+        )
+
+    def inject_http_error(
+        self,
+        status: int,
+        count: int = 1,
+        retry_after: Optional[float] = None,
+        after: int = 0,
+    ) -> None:
+        """
+        Makes the next requests fail with an HTTP error.
+
+        :param status: the HTTP status of the failed responses
+        :param count: the number of requests to fail
+        :param retry_after: the value of the `Retry-After` header of the failed responses, none if `None`
+        :param after: the number of requests to respond to normally before failing
+        """
+        headers = dict() if retry_after is None else {"retry-after": str(retry_after)}
+        try:
+            phrase = HTTPStatus(status).phrase
+        except ValueError:
+            phrase = "Unknown Error"
+        body = f"<html><body>{phrase}</body></html>".encode()
+        self.__inject(TransportResponse(status, headers, body), count, after)
+
+    def __inject(self, response: TransportResponse, count: int, after: int) -> None:
+        with self.__lock:
+            # Requests answered normally are queued as None
+            self.__failures.extend([None] * after + [response] * count)
+
+    def handle(
+        self, url: str, params: Optional[Mapping[str, Any]] = None
+    ) -> TransportResponse:
+        """
+        Responds to a request. The latency of the backend is left to the transport.
+
+        :param url: the URL of the request
+        :param params: the query parameters of the request
+
+        :return: the response
+        """
+        params = dict(params or {})
+        endpoint = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+        if url.startswith(AbstractLpdbSession.WIKIS_URL):
+            with self.__lock:
+                self.requests.append((endpoint, params))
+                wikis = {
+                    result["wiki"]
+                    for results in self.__results.values()
+                    for result in results
+                } | set(self.__team_templates)
+            return FakeLpdbBackend.__respond({"allwikis": {wiki: {} for wiki in wikis}})
+        wiki = str(params.get("wiki", ""))
+        with self.__lock:
+            self.requests.append((endpoint, params))
+            failure = None if len(self.__failures) == 0 else self.__failures.popleft()
+            if failure is not None:
+                if failure.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    return self.__rate_limited(wiki, endpoint, failure.headers)
+                return failure
+            if self.__is_rate_limited(wiki, endpoint):
+                return self.__rate_limited(wiki, endpoint, dict())
+            if endpoint == "teamtemplate":
+                return self.__get_team_template(wiki, str(params.get("template")))
+            elif endpoint == "teamtemplatelist":
+                return self.__get_team_template_list(
+                    wiki, int(params.get("pagination", 1))
+                )
+            results = list(self.__results.get(endpoint, []))
+        try:
+            return FakeLpdbBackend.__respond(
+                {"result": FakeLpdbBackend.__query(results, params)}
+            )
+        except ValueError as error:
+            return FakeLpdbBackend.__respond(
+                {"result": [], "error": [f"Error: {error}"]}
+            )
+
+    def __is_rate_limited(self, wiki: str, endpoint: str) -> bool:
+        if self.rate_limit is None:
+            return False
+        now = time.monotonic()
+        request_times = self.__request_times.setdefault((wiki, endpoint), deque())
+        while (
+            len(request_times) != 0 and request_times[0] <= now - self.rate_limit_window
+        ):
+            request_times.popleft()
+        if len(request_times) >= self.rate_limit:
+            return True
+        request_times.append(now)
+        return False
+
+    @staticmethod
+    def __rate_limited(
+        wiki: str, endpoint: str, headers: Mapping[str, str]
+    ) -> TransportResponse:
+        wiki = wiki.split(",")[0].strip()
+        message = (
+            f'API key "fake" limits for wiki "{wiki}" and table "{endpoint}" exceeded.'
+        )
+        response = FakeLpdbBackend.__respond({"result": [], "error": [message]})
+        return TransportResponse(HTTPStatus.TOO_MANY_REQUESTS, headers, response.body)
+
+    def __get_team_template(self, wiki: str, template: str) -> TransportResponse:
+        team_template = self.__team_templates.get(wiki, dict()).get(template)
+        return FakeLpdbBackend.__respond({"result": [team_template]})
+
+    def __get_team_template_list(self, wiki: str, pagination: int) -> TransportResponse:
+        team_templates = list(self.__team_templates.get(wiki, dict()).values())
+        start = (pagination - 1) * self.team_template_page_size
+        return FakeLpdbBackend.__respond(
+            {"result": team_templates[start : start + self.team_template_page_size]}
+        )
+
+    @staticmethod
+    def __query(
+        results: list[dict[str, Any]], params: Mapping[str, Any]
+    ) -> list[dict[str, Any]]:
+        wikis = {wiki.strip() for wiki in str(params.get("wiki", "")).split(",")}
+        rows = [result for result in results if result.get("wiki") in wikis]
+        if "conditions" in params:
+            predicate = _compile_conditions(str(params["conditions"]))
+            rows = [row for row in rows if predicate(row)]
+
+        fields = None
+        aggregates = []
+        if "query" in params:
+            fields = []
+            for field in str(params["query"]).split(","):
+                function, _, aggregated = field.strip().partition("::")
+                if aggregated:
+                    aggregates.append((function, aggregated))
+                    fields.append(f"{function}_{aggregated}")
+                else:
+                    fields.append(function)
+
+        if "groupby" in params:
+            keys = [field for field, _ in _parse_rules(str(params["groupby"]))]
+            groups: dict[tuple, list[dict[str, Any]]] = dict()
+            for row in rows:
+                groups.setdefault(tuple(row.get(key) for key in keys), []).append(row)
+            by_first = {id(group[0]): group for group in groups.values()}
+            rows = [
+                FakeLpdbBackend.__aggregate(by_first[id(first)], aggregates)
+                for first in _sort(
+                    [group[0] for group in groups.values()], str(params["groupby"])
+                )
+            ]
+        elif len(aggregates) != 0:
+            rows = [FakeLpdbBackend.__aggregate(rows, aggregates)]
+        if "order" in params:
+            rows = _sort(rows, str(params["order"]))
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", 20)), AbstractLpdbSession.MAX_LIMIT)
+        rows = rows[offset : offset + limit]
+        if fields is not None:
+            rows = [{field: row.get(field) for field in fields} for row in rows]
+        return rows
+
+    @staticmethod
+    def __aggregate(
+        group: list[dict[str, Any]], aggregates: list[tuple[str, str]]
+    ) -> dict[str, Any]:
+        row = dict(group[0]) if len(group) != 0 else dict()
+        for function, aggregated in aggregates:
+            row[f"{function}_{aggregated}"] = _aggregate(
+                function, [member.get(aggregated) for member in group]
+            )
+        return row
+
+    @staticmethod
+    def __respond(response: dict[str, Any]) -> TransportResponse:
+        body = json.dumps(response, default=FakeLpdbBackend.__serialize).encode()
+        return TransportResponse(
+            HTTPStatus.OK, {"content-type": "application/json"}, body
+        )
+
+    @staticmethod
+    def __serialize(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class FakeTransport(Transport):
+    """
+    Transport of `LpdbSession` answering requests with a `FakeLpdbBackend`.
+    """
+
+    def __init__(self, backend: FakeLpdbBackend):
+        """
+        :param backend: the backend answering the requests
+        """
+        self.backend = backend
+
+    @override
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        if self.backend.latency > 0:
+            time.sleep(self.backend.latency)
+        return self.backend.handle(url, params)
+
+
+class AsyncFakeTransport(AsyncTransport):
+    """
+    Transport of `AsyncLpdbSession` answering requests with a `FakeLpdbBackend`.
+    """
+
+    def __init__(self, backend: FakeLpdbBackend):
+        """
+        :param backend: the backend answering the requests
+        """
+        self.backend = backend
+
+    @override
+    async def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        if self.backend.latency > 0:
+            await asyncio.sleep(self.backend.latency)
+        return self.backend.handle(url, params)
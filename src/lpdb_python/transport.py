@@ -0,0 +1,443 @@
+"""
+HTTP transports of LPDB sessions, and the configuration of their connections.
+
+A session builds the URL, parameters and headers of each request, hands them to its transport, and decodes the
+response it gets back. Transports can be replaced, e.g. by the in-memory backend of `lpdb_python.testing`.
+"""
+
+import threading
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Final,
+    Iterator,
+    Mapping,
+    Optional,
+    override,
+)
+
+import requests
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+__all__ = [
+    "AsyncStreamedResponse",
+    "AsyncTransport",
+    "RequestsTransport",
+    "StreamedResponse",
+    "Transport",
+    "TransportConfig",
+    "TransportResponse",
+]
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    Configuration of the connection pool of an LPDB session.
+
+    `LpdbSession` keeps a pool of connections per host, while `AsyncLpdbSession` keeps a single pool for all hosts.
+    Options that only one of them supports are ignored by the other.
+    """
+
+    pool_maxsize: Optional[int] = None
+    """
+    The maximum number of connections kept open, per host in `LpdbSession` and in total in `AsyncLpdbSession`;
+    10 and 100 respectively if `None`
+    """
+    pool_maxsize_per_host: Optional[int] = None
+    """
+    The maximum number of connections open to a single host, unlimited if `None`; only used by `AsyncLpdbSession`
+    """
+    pool_block: bool = False
+    """
+    Whether requests wait for a connection of the pool to be free when all are in use, instead of opening a
+    connection that is closed afterwards; only used by `LpdbSession`, as `AsyncLpdbSession` always waits
+    """
+    keepalive: bool = True
+    """
+    Whether connections are kept open to be reused by later requests
+    """
+    keepalive_timeout: Optional[float] = None
+    """
+    The time in seconds after which an idle connection is closed, 15 if `None`; only used by `AsyncLpdbSession`
+    """
+    dns_cache_ttl: Optional[float] = 10
+    """
+    The time in seconds for which resolved host names are cached, not cached if `None`; only used by
+    `AsyncLpdbSession`
+    """
+
+    def __post_init__(self):
+        for name in ("pool_maxsize", "pool_maxsize_per_host"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be positive")
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    """
+    A response received by a transport.
+    """
+
+    status: int
+    """
+    The HTTP status of the response
+    """
+    headers: Mapping[str, str]
+    """
+    The headers of the response, looked up by their lowercase names
+    """
+    body: bytes
+    """
+    The body of the response
+    """
+
+
+class StreamedResponse:
+    """
+    A response whose body is received in chunks, which holds on to its connection until it is closed.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        chunks: Iterator[bytes],
+        close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        :param status: the HTTP status of the response
+        :param headers: the headers of the response, looked up by their lowercase names
+        :param chunks: iterator over the chunks of the body
+        :param close: function releasing the connection of the response
+        """
+        self.status = status
+        self.headers = headers
+        self.chunks = chunks
+        self.__close = close
+
+    def read(self) -> bytes:
+        """
+        Reads the rest of the body.
+        """
+        return b"".join(self.chunks)
+
+    def close(self) -> None:
+        """
+        Releases the connection of this response.
+        """
+        if self.__close is not None:
+            self.__close()
+
+    def __enter__(self) -> "StreamedResponse":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class AsyncStreamedResponse:
+    """
+    A response whose body is received in chunks asynchronously, which holds on to its connection until it is closed.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        chunks: AsyncIterator[bytes],
+        close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        :param status: the HTTP status of the response
+        :param headers: the headers of the response, looked up by their lowercase names
+        :param chunks: asynchronous iterator over the chunks of the body
+        :param close: function releasing the connection of the response
+        """
+        self.status = status
+        self.headers = headers
+        self.chunks = chunks
+        self.__close = close
+
+    async def read(self) -> bytes:
+        """
+        Reads the rest of the body.
+        """
+        return b"".join([chunk async for chunk in self.chunks])
+
+    def close(self) -> None:
+        """
+        Releases the connection of this response.
+        """
+        if self.__close is not None:
+            self.__close()
+
+    async def __aenter__(self) -> "AsyncStreamedResponse":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _iter_chunks(body: bytes, chunk_size: int) -> Iterator[bytes]:
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
+async def _aiter_chunks(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for chunk in _iter_chunks(body, chunk_size):
+        yield chunk
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of an `LpdbSession`. A transport must be safe to use from multiple threads.
+    """
+
+    pool_maxsize: Optional[int] = None
+    """
+    The maximum number of connections kept open, `None` if not limited
+    """
+
+    @abstractmethod
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        """
+        Sends a GET request.
+
+        :param url: the URL to request
+        :param params: the query parameters of the request
+        :param headers: the headers of the request
+
+        :return: the response
+        """
+        pass
+
+    def stream(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> StreamedResponse:
+        """
+        Sends a GET request, returning as soon as the headers of the response are received.
+
+        By default, the whole response is received with `get` and then split into chunks.
+
+        :param url: the URL to request
+        :param params: the query parameters of the request
+        :param headers: the headers of the request
+        :param chunk_size: the size of the chunks of the body
+
+        :return: the response, which must be closed
+        """
+        response = self.get(url, params=params, headers=headers)
+        return StreamedResponse(
+            response.status,
+            response.headers,
+            _iter_chunks(response.body, chunk_size),
+        )
+
+    def warmup(
+        self,
+        url: str,
+        connections: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Opens connections to the host of a URL ahead of time. By default, nothing is done.
+
+        :param url: the URL whose host to connect to
+        :param connections: the number of connections to open, nothing is done if it is not positive
+        :param headers: the headers of the requests opening the connections
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Closes the connections of this transport.
+        """
+        pass
+
+
+class AsyncTransport(ABC):
+    """
+    Sends the HTTP requests of an `AsyncLpdbSession`.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        """
+        Sends a GET request.
+
+        :param url: the URL to request
+        :param params: the query parameters of the request
+        :param headers: the headers of the request
+
+        :return: the response
+        """
+        pass
+
+    async def stream(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncStreamedResponse:
+        """
+        Sends a GET request, returning as soon as the headers of the response are received.
+
+        By default, the whole response is received with `get` and then split into chunks.
+
+        :param url: the URL to request
+        :param params: the query parameters of the request
+        :param headers: the headers of the request
+        :param chunk_size: the size of the chunks of the body
+
+        :return: the response, which must be closed
+        """
+        response = await self.get(url, params=params, headers=headers)
+        return AsyncStreamedResponse(
+            response.status,
+            response.headers,
+            _aiter_chunks(response.body, chunk_size),
+        )
+
+    async def warmup(
+        self,
+        url: str,
+        connections: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Opens connections to the host of a URL ahead of time. By default, nothing is done.
+
+        :param url: the URL whose host to connect to
+        :param connections: the number of connections to open, nothing is done if it is not positive
+        :param headers: the headers of the requests opening the connections
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Closes the connections of this transport.
+        """
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    Transport sending requests with `requests`, the default transport of `LpdbSession`.
+    """
+
+    DEFAULT_POOL_MAXSIZE: Final[int] = DEFAULT_POOLSIZE
+
+    def __init__(self, transport_config: Optional[TransportConfig] = None):
+        """
+        :param transport_config: configuration of the connection pool, the default configuration is used if not
+            supplied
+        """
+        if transport_config is None:
+            transport_config = TransportConfig()
+        self.pool_maxsize = (
+            transport_config.pool_maxsize or RequestsTransport.DEFAULT_POOL_MAXSIZE
+        )
+        self.__adapter = HTTPAdapter(
+            pool_maxsize=self.pool_maxsize, pool_block=transport_config.pool_block
+        )
+        self.__keepalive = transport_config.keepalive
+        self.__local = threading.local()
+
+    @property
+    def __session(self) -> requests.Session:
+        # requests.Session is not thread-safe, so each thread has its own, all sharing the connection pool of the adapter
+        session = getattr(self.__local, "session", None)
+        if session is None:
+            session = requests.Session()
+            if not self.__keepalive:
+                session.headers["connection"] = "close"
+            session.mount("https://", self.__adapter)
+            session.mount("http://", self.__adapter)
+            self.__local.session = session
+        return session
+
+    @override
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        response = self.__session.get(url, params=params, headers=headers)
+        return TransportResponse(
+            response.status_code, response.headers, response.content
+        )
+
+    @override
+    def stream(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> StreamedResponse:
+        response = self.__session.get(url, params=params, headers=headers, stream=True)
+        return StreamedResponse(
+            response.status_code,
+            response.headers,
+            response.iter_content(chunk_size=chunk_size),
+            close=response.close,
+        )
+
+    @override
+    def warmup(
+        self,
+        url: str,
+        connections: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        if connections <= 0:
+            return
+
+        def connect() -> requests.Response:
+            # The response is not read, so that its connection stays in use until every connection is opened
+            return self.__session.head(url, headers=headers, stream=True)
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            responses = list(executor.map(lambda _: connect(), range(connections)))
+        for response in responses:
+            # Reading the response returns its connection to the pool
+            response.content
+
+    @override
+    def close(self) -> None:
+        self.__adapter.close()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import pytest
@@ -5,15 +6,44 @@ import pytest_asyncio
 
 import lpdb_python as lpdb
 from lpdb_python.async_session import AsyncLpdbSession
+from lpdb_python.testing import AsyncFakeTransport, FakeLpdbBackend
 
 KEY = os.getenv("API_KEY")
 
+CHAMPIONS = "[[parent::VCT/2025/Champions]]"
+
 
 @pytest_asyncio.fixture
 async def async_session() -> AsyncLpdbSession:
     return AsyncLpdbSession(KEY)
 
 
+@pytest.fixture
+def backend() -> FakeLpdbBackend:
+    backend = FakeLpdbBackend()
+    for wiki in ("leagueoflegends", "valorant", "dota2"):
+        backend.add_results(
+            "match",
+            wiki,
+            [
+                {
+                    "match2id": f"{i:04d}_R01-M001",
+                    "date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 12:00:00",
+                    "parent": "VCT/2025/Champions"
+                    if i % 3 != 0
+                    else "VCT/2025/Stage_2/Masters",
+                }
+                for i in range(300)
+            ],
+        )
+    return backend
+
+
+@pytest_asyncio.fixture
+async def fake_session(backend: FakeLpdbBackend) -> AsyncLpdbSession:
+    return AsyncLpdbSession("", transport=AsyncFakeTransport(backend))
+
+
 @pytest.mark.asyncio
 async def test_get_wikis(async_session: AsyncLpdbSession):
     wikis = await async_session.get_wikis()
@@ -28,6 +58,13 @@ async def test_get_wikis(async_session: AsyncLpdbSession):
     }.issubset(wikis)
 
 
+@pytest.mark.asyncio
+async def test_fetch_wikis():
+    assert {"dota2", "valorant", "leagueoflegends"}.issubset(
+        await AsyncLpdbSession.fetch_wikis()
+    )
+
+
 @pytest.mark.asyncio
 async def test_make_request_invalid_key():
     with pytest.raises(lpdb.LpdbError):
@@ -121,3 +158,227 @@ async def test_get_team_templates(async_session: AsyncLpdbSession):
     assert isinstance(templates, list)
     for template in templates:
         assert isinstance(template["page"], str)
+
+
+@pytest.mark.asyncio
+async def test_iter_request(backend: FakeLpdbBackend, fake_session: AsyncLpdbSession):
+    responses = await fake_session.make_request(
+        "match",
+        "valorant",
+        conditions=CHAMPIONS,
+        order=[("match2id", "asc")],
+        limit=1000,
+    )
+    backend.requests.clear()
+
+    iterated = [
+        response
+        async for response in fake_session.iter_request(
+            "match",
+            "valorant",
+            page_size=40,
+            conditions=CHAMPIONS,
+            order=[("match2id", "asc")],
+        )
+    ]
+
+    assert [r["match2id"] for r in iterated] == [r["match2id"] for r in responses]
+    # 200 results in 5 full pages, and an empty page ending the iteration
+    assert [params["offset"] for _, params in backend.requests] == [
+        0,
+        40,
+        80,
+        120,
+        160,
+        200,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_request_keyset(
+    backend: FakeLpdbBackend, fake_session: AsyncLpdbSession
+):
+    responses = await fake_session.make_request(
+        "match",
+        "valorant",
+        conditions=CHAMPIONS,
+        order=[("match2id", "asc")],
+        limit=1000,
+    )
+    backend.requests.clear()
+
+    iterated = [
+        response
+        async for response in fake_session.iter_request(
+            "match",
+            "valorant",
+            page_size=40,
+            conditions=CHAMPIONS,
+            keyset="match2id",
+        )
+    ]
+
+    assert [r["match2id"] for r in iterated] == [r["match2id"] for r in responses]
+    assert len(backend.requests) == 6
+    for i, (_, params) in enumerate(backend.requests):
+        assert params["offset"] == 0
+        if i != 0:
+            last = responses[i * 40 - 1]["match2id"]
+            assert params["conditions"] == f"({CHAMPIONS}) AND ([[match2id::>{last}]])"
+
+
+@pytest.mark.asyncio
+async def test_warmup(backend: FakeLpdbBackend):
+    async with AsyncLpdbSession("", transport=AsyncFakeTransport(backend)) as session:
+        await session.warmup(4)
+        assert len(backend.requests) == 0
+        assert len(await session.make_request("match", "valorant", limit=5)) == 5
+        assert len(backend.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_many(backend: FakeLpdbBackend, fake_session: AsyncLpdbSession):
+    results = await fake_session.fetch_many(
+        [
+            lpdb.LpdbRequest("match", "valorant", limit=5),
+            lpdb.LpdbRequest("invalid", "valorant"),
+            lpdb.LpdbRequest("match", "dota2", limit=3),
+        ],
+        return_exceptions=True,
+    )
+
+    assert len(results[0]) == 5
+    assert isinstance(results[1], ValueError)
+    assert len(results[2]) == 3
+    assert [params["wiki"] for _, params in backend.requests] == ["valorant", "dota2"]
+
+
+@pytest.mark.asyncio
+async def test_make_fanout_request(
+    backend: FakeLpdbBackend, fake_session: AsyncLpdbSession
+):
+    wikis = ["leagueoflegends", "valorant", "dota2"]
+    order = [("date", "desc"), ("match2id", "asc")]
+    responses = await fake_session.make_fanout_request(
+        "match", wikis, limit=50, query="match2id, date", order=order
+    )
+
+    assert len(responses) == 50
+    keys = [(r["date"], r["match2id"]) for r in responses]
+    assert keys == sorted(
+        sorted(keys, key=lambda k: k[1]), key=lambda k: k[0], reverse=True
+    )
+    assert sorted(params["wiki"] for _, params in backend.requests) == sorted(wikis)
+    for wiki in wikis:
+        latest = await fake_session.make_request(
+            "match", wiki, limit=1, query="match2id, date", order=order
+        )
+        assert latest[0]["date"] <= responses[0]["date"]
+
+
+@pytest.mark.asyncio
+async def test_make_fanout_request_query(
+    backend: FakeLpdbBackend, fake_session: AsyncLpdbSession
+):
+    responses = await fake_session.make_fanout_request(
+        "match",
+        ["leagueoflegends", "valorant", "dota2"],
+        limit=50,
+        query="match2id",
+        order="date desc",
+    )
+
+    assert len(responses) == 50
+    for response in responses:
+        assert set(response) == {"match2id"}
+    for _, params in backend.requests:
+        assert params["query"] == "match2id, date"
+
+
+@pytest.mark.asyncio
+async def test_stream_request(backend: FakeLpdbBackend, fake_session: AsyncLpdbSession):
+    responses = await fake_session.make_request(
+        "match",
+        "valorant",
+        conditions=CHAMPIONS,
+        order=[("match2id", "asc")],
+        limit=1000,
+    )
+    backend.requests.clear()
+
+    streamed = [
+        response
+        async for response in fake_session.stream_request(
+            "match",
+            "valorant",
+            conditions=CHAMPIONS,
+            order=[("match2id", "asc")],
+            limit=1000,
+        )
+    ]
+
+    assert streamed == responses
+    assert len(backend.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_make_bulk_request(
+    backend: FakeLpdbBackend, fake_session: AsyncLpdbSession
+):
+    responses = await fake_session.make_bulk_request(
+        "match",
+        "valorant",
+        conditions=CHAMPIONS,
+        order=[("match2id", "asc")],
+        page_size=30,
+        max_concurrency=2,
+    )
+
+    assert len(responses) == 200
+    for i in range(1, len(responses)):
+        assert responses[i - 1]["match2id"] < responses[i]["match2id"]
+    # A count request, and 7 pages covering the 200 results
+    assert len(backend.requests) == 8
+
+
+@pytest.mark.asyncio
+async def test_make_bulk_request_error(backend: FakeLpdbBackend):
+    backend.latency = 0.05
+    backend.inject_http_error(500, after=2)
+    async with AsyncLpdbSession("", transport=AsyncFakeTransport(backend)) as session:
+        with pytest.raises(lpdb.LpdbHttpError):
+            await session.make_bulk_request(
+                "match",
+                "valorant",
+                conditions=CHAMPIONS,
+                order=[("match2id", "asc")],
+                page_size=30,
+                max_concurrency=2,
+            )
+        await asyncio.sleep(0.2)
+    # The count request and the first 2 pages, the remaining pages being cancelled after the failure
+    assert len(backend.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_requests():
+    backend = FakeLpdbBackend(latency=0.05)
+    backend.add_results(
+        "match",
+        "valorant",
+        [{"match2id": "0001_R01-M001", "parent": "VCT/2025/Champions"}],
+    )
+    async with AsyncLpdbSession(
+        "", coalesce_requests=True, transport=AsyncFakeTransport(backend)
+    ) as async_session:
+        responses = await asyncio.gather(
+            *[
+                async_session.make_request("match", "valorant", conditions=CHAMPIONS)
+                for _ in range(5)
+            ]
+        )
+
+    assert len(backend.requests) == 1
+    assert [r["match2id"] for r in responses[0]] == ["0001_R01-M001"]
+    for response in responses:
+        assert response is responses[0]
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+
+import lpdb_python as lpdb
+
+
+@pytest.fixture
+def cache_path(tmp_path) -> str:
+    return str(tmp_path / "cache.db")
+
+
+def test_sqlite_cache_get_set(cache_path: str):
+    cache = lpdb.SqliteCache(cache_path)
+    assert cache.get("match", "wiki=leagueoflegends") is None
+
+    cache.set("match", "wiki=leagueoflegends", [{"match2id": "a"}])
+    assert cache.get("match", "wiki=leagueoflegends") == [{"match2id": "a"}]
+    assert cache.get("tournament", "wiki=leagueoflegends") is None
+
+
+def test_sqlite_cache_ttl(cache_path: str):
+    cache = lpdb.SqliteCache(cache_path, ttls={"match": 0.05})
+    cache.set("match", "wiki=leagueoflegends", [{"match2id": "a"}])
+    cache.set("company", "wiki=leagueoflegends", [{"name": "b"}])
+    time.sleep(0.1)
+    assert cache.get("match", "wiki=leagueoflegends") is None
+    assert cache.get("company", "wiki=leagueoflegends") == [{"name": "b"}]
+
+
+def test_sqlite_cache_eviction(cache_path: str):
+    cache = lpdb.SqliteCache(cache_path, max_size=100)
+    cache.set("match", "1", [{"value": "x" * 30}])
+    cache.set("match", "2", [{"value": "x" * 30}])
+    cache.get("match", "1")
+    cache.set("match", "3", [{"value": "x" * 30}])
+    assert cache.get("match", "1") is not None
+    assert cache.get("match", "2") is None
+    assert cache.get("match", "3") is not None
+
+
+def test_sqlite_cache_total_size(cache_path: str):
+    cache = lpdb.SqliteCache(cache_path, max_size=100)
+    for _ in range(5):
+        cache.set("match", "1", [{"value": "x" * 30}])
+    cache.set("match", "2", [{"value": "x" * 30}])
+    assert cache.get("match", "1") is not None
+    assert cache.get("match", "2") is not None
+
+    reopened = lpdb.SqliteCache(cache_path, max_size=100)
+    reopened.set("match", "3", [{"value": "x" * 30}])
+    assert reopened.get("match", "1") is None
+    assert reopened.get("match", "3") is not None
+
+
+def test_sqlite_cache_access_batch(cache_path: str):
+    cache = lpdb.SqliteCache(cache_path, max_size=100, access_batch_size=1)
+    other = lpdb.SqliteCache(cache_path, max_size=100)
+    cache.set("match", "1", [{"value": "x" * 30}])
+    cache.set("match", "2", [{"value": "x" * 30}])
+    cache.get("match", "1")
+    other.set("match", "3", [{"value": "x" * 30}])
+    assert other.get("match", "1") is not None
+    assert other.get("match", "2") is None
+
+
+def test_sqlite_cache_shared_file(cache_path: str):
+    writer = lpdb.SqliteCache(cache_path)
+    reader = lpdb.SqliteCache(cache_path)
+    writer.set("team", "wiki=valorant", [{"name": "T1"}])
+    assert reader.get("team", "wiki=valorant") == [{"name": "T1"}]
+
+
+def test_sqlite_cache_async(cache_path: str):
+    cache = lpdb.SqliteCache(cache_path)
+
+    async def roundtrip():
+        await cache.set_async("team", "wiki=valorant", [{"name": "T1"}])
+        return await cache.get_async("team", "wiki=valorant")
+
+    assert asyncio.run(roundtrip()) == [{"name": "T1"}]
+
+
+def test_memory_cache_get_set():
+    cache = lpdb.MemoryCache()
+    assert cache.get("match", "wiki=leagueoflegends") is None
+
+    cache.set("match", "wiki=leagueoflegends", [{"match2id": "a"}])
+    assert cache.get("match", "wiki=leagueoflegends") == [{"match2id": "a"}]
+    assert cache.get("tournament", "wiki=leagueoflegends") is None
+
+
+def test_memory_cache_entry_limit():
+    cache = lpdb.MemoryCache(max_entries=2)
+    cache.set("match", "1", [])
+    cache.set("match", "2", [])
+    cache.get("match", "1")
+    cache.set("match", "3", [])
+    assert len(cache) == 2
+    assert cache.get("match", "1") is not None
+    assert cache.get("match", "2") is None
+
+
+def test_memory_cache_byte_limit():
+    cache = lpdb.MemoryCache(max_bytes=100)
+    cache.set("match", "1", [{"value": "x" * 30}])
+    cache.set("match", "2", [{"value": "x" * 30}])
+    cache.set("match", "3", [{"value": "x" * 30}])
+    assert cache.get("match", "1") is None
+    assert cache.get("match", "3") is not None
+
+    cache.set("match", "4", [{"value": "x" * 200}])
+    assert cache.get("match", "4") is None
+
+
+def test_memory_cache_supplied_size():
+    cache = lpdb.MemoryCache(max_bytes=100)
+    cache.set("match", "1", [{"value": "x" * 200}], size=50)
+    assert cache.get("match", "1") is not None
+
+    cache.set("match", "2", [], size=60)
+    assert cache.get("match", "1") is None
+    assert cache.get("match", "2") is not None
+
+
+def test_memory_cache_stale_while_revalidate():
+    cache = lpdb.MemoryCache(ttls={"match": 0.05}, stale_while_revalidate=0.1)
+    cache.set("match", "1", [{"match2id": "a"}])
+    assert cache.lookup("match", "1") == ([{"match2id": "a"}], False)
+
+    time.sleep(0.07)
+    assert cache.get("match", "1") is None
+    assert cache.lookup("match", "1") == ([{"match2id": "a"}], True)
+
+    time.sleep(0.1)
+    assert cache.lookup("match", "1") is None
+    assert len(cache) == 0
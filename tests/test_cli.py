@@ -0,0 +1,143 @@
+import asyncio
+import csv
+import json
+import os
+
+import pytest
+
+import lpdb_python as lpdb
+from lpdb_python import cli
+from lpdb_python.testing import AsyncFakeTransport, FakeLpdbBackend
+
+
+def test_requires_api_key(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("LPDB_API_KEY", raising=False)
+    with pytest.raises(SystemExit):
+        cli.main(["dump", "match", "leagueoflegends", "-o", "matches.ndjson"])
+
+
+def test_invalid_datatype():
+    with pytest.raises(SystemExit):
+        cli.main(
+            ["dump", "matches", "leagueoflegends", "-o", "m.csv", "--api-key", "a"]
+        )
+
+
+def test_format_from_extension():
+    parser = cli._get_parser()
+    args = parser.parse_args(["dump", "match", "dota2", "-o", "matches.jsonl"])
+    assert cli._get_format(args) == "ndjson"
+    args = parser.parse_args(["dump", "match", "dota2", "-o", "matches.txt"])
+    with pytest.raises(ValueError):
+        cli._get_format(args)
+
+
+def test_resume_text_writer(tmp_path):
+    path = str(tmp_path / "matches.ndjson")
+    writer = cli._NdjsonWriter(path, ["match2id"])
+    writer.open(None)
+    writer.write([{"match2id": "a", "winner": "1"}])
+    state = writer.commit()
+    writer.write([{"match2id": "b"}])
+    writer.close()
+
+    resumed = cli._NdjsonWriter(path, None)
+    resumed.open(json.loads(json.dumps(state)))
+    resumed.write([{"match2id": "c"}])
+    resumed.close()
+
+    with open(path, encoding="utf-8") as output:
+        assert [json.loads(line) for line in output] == [
+            {"match2id": "a"},
+            {"match2id": "c"},
+        ]
+
+
+def test_checkpoint_of_other_dump(tmp_path):
+    path = str(tmp_path / "matches.checkpoint")
+    checkpoint = cli._Checkpoint(path, {"datatype": "match", "offset": 0})
+    checkpoint.save(1000, 1000, {"size": 10, "fields": None})
+
+    assert cli._Checkpoint(path, {"datatype": "match", "offset": 0}).load()
+    with pytest.raises(ValueError):
+        cli._Checkpoint(path, {"datatype": "team", "offset": 0}).load()
+
+
+def _read_dump(path: str, output_format: str) -> list[str]:
+    if output_format == "ndjson":
+        with open(path, encoding="utf-8") as output:
+            return [json.loads(line)["objectname"] for line in output]
+    elif output_format == "csv":
+        with open(path, encoding="utf-8", newline="") as output:
+            return [row["objectname"] for row in csv.DictReader(output)]
+    pq = pytest.importorskip("pyarrow.parquet")
+    return [
+        objectname
+        for name in sorted(os.listdir(path))
+        for objectname in pq.read_table(os.path.join(path, name))
+        .column("objectname")
+        .to_pylist()
+    ]
+
+
+@pytest.mark.parametrize(
+    "output_format, name",
+    [("ndjson", "matches.ndjson"), ("csv", "matches.csv"), ("parquet", "matches")],
+)
+def test_resume_dump(tmp_path, output_format: str, name: str):
+    if output_format == "parquet":
+        pytest.importorskip("pyarrow")
+    backend = FakeLpdbBackend()
+    backend.add_results(
+        "match",
+        "dota2",
+        [
+            {"pageid": i // 10, "objectname": f"{i:04d}_R01-M001", "winner": "1"}
+            for i in range(300)
+        ],
+    )
+    output = str(tmp_path / name)
+    args = cli._get_parser().parse_args(
+        [
+            "dump",
+            "match",
+            "dota2",
+            "-o",
+            output,
+            "--format",
+            output_format,
+            "--query",
+            "pageid, objectname, winner",
+            "--page-size",
+            "50",
+            "--rows-per-file",
+            "100",
+            "--max-attempts",
+            "1",
+            "--api-key",
+            "key",
+        ]
+    )
+    checkpoint_path = f"{output}.checkpoint"
+
+    # The count request and 3 pages succeed, and the 4th page fails
+    backend.inject_http_error(500, after=4)
+    with pytest.raises(lpdb.LpdbHttpError):
+        asyncio.run(cli._dump(args, AsyncFakeTransport(backend)))
+    with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+    assert checkpoint["offset"] == (100 if output_format == "parquet" else 150)
+
+    backend.requests.clear()
+    assert asyncio.run(cli._dump(args, AsyncFakeTransport(backend))) == 0
+    assert not os.path.exists(checkpoint_path)
+    # The resumed dump only requests the pages after the checkpoint
+    offsets = [
+        params["offset"]
+        for _, params in backend.requests
+        if not params["query"].startswith("count::")
+    ]
+    assert min(offsets) == checkpoint["offset"]
+    assert _read_dump(output, output_format) == [
+        f"{i:04d}_R01-M001" for i in range(300)
+    ]
@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lpdb_python.columnar import ColumnarResults  # noqa: E402
+
+
+def test_append_pages():
+    results = ColumnarResults("placement", ["placement", "prizemoney", "date"])
+    results.append(
+        [
+            {"placement": "1", "prizemoney": 1000, "date": "2025-01-02 00:00:00"},
+            {"placement": "3-4", "prizemoney": "", "date": "0000-01-01 00:00:00"},
+        ]
+    )
+    results.append([{"placement": 2, "prizemoney": 500.5, "date": ""}])
+
+    assert len(results) == 3
+    np.testing.assert_array_equal(results["placement"], [1, 3, 2])
+    np.testing.assert_array_equal(results["prizemoney"], [1000, np.nan, 500.5])
+    assert results["date"].dtype == np.dtype("datetime64[s]")
+    assert results["date"][0] == np.datetime64("2025-01-02T00:00:00")
+    assert np.isnat(results["date"][1:]).all()
+
+
+def test_fields_from_first_page():
+    results = ColumnarResults.from_pages(
+        "match",
+        [
+            [{"match2id": "a", "bestof": 3, "finished": 1, "extradata": {"a": 1}}],
+            [{"match2id": "b", "bestof": None, "finished": 0, "extradata": []}],
+        ],
+    )
+
+    assert results.fields == ["match2id", "bestof", "finished", "extradata"]
+    assert list(results["match2id"]) == ["a", "b"]
+    np.testing.assert_array_equal(results["bestof"], [3, np.nan])
+    np.testing.assert_array_equal(results["finished"], [True, False])
+    assert list(results["extradata"]) == [{"a": 1}, []]
+    with pytest.raises(KeyError):
+        results["winner"]
+
+
+def test_invalid_datatype():
+    with pytest.raises(ValueError):
+        ColumnarResults("matches")
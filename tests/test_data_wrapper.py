@@ -37,3 +37,54 @@ def test_read_match_data(match_data: lpdb.Match):
 
     for match2game in match_data.match2games:
         assert isinstance(match2game.opponents, list)
+
+
+def test_lazy_results(rootdir: str):
+    with open(os.path.join(rootdir, "data/sample_match_data.json")) as input_file:
+        raw_match = json.load(input_file)
+    results = lpdb.LpdbResults(lpdb.Match, [raw_match, {"match2id": "other"}])
+
+    assert len(results) == 2
+    assert results[0] is results[0]
+    assert results[0].match2id == "Wrd25KnOut_R03-M001"
+    assert [match.match2id for match in results] == [
+        "Wrd25KnOut_R03-M001",
+        "other",
+    ]
+    assert results[1:][0].match2id == "other"
+
+    raw_match["match2id"] = "changed"
+    assert results[0].match2id == "changed"
+
+
+def test_copy(rootdir: str):
+    with open(os.path.join(rootdir, "data/sample_match_data.json")) as input_file:
+        raw_match = json.load(input_file)
+    copied = lpdb.Match(raw_match)
+    borrowed = lpdb.Match(raw_match, copy=False)
+
+    raw_match["match2id"] = "changed"
+    assert copied.match2id == "Wrd25KnOut_R03-M001"
+    assert borrowed.match2id == "changed"
+
+    assert not hasattr(borrowed, "__dict__")
+    assert not hasattr(borrowed.match2games[0], "__dict__")
+
+
+def test_derived_properties_are_memoized(match_data: lpdb.Match):
+    assert match_data.match2games is match_data.match2games
+    assert match_data.match2opponents is match_data.match2opponents
+    assert match_data.date is match_data.date
+    assert match_data.match2games[0].date is match_data.match2games[0].date
+
+
+def test_timezones_are_interned(rootdir: str):
+    with open(os.path.join(rootdir, "data/sample_match_data.json")) as input_file:
+        raw_match = json.load(input_file)
+    assert lpdb.Match(raw_match).timezone is lpdb.Match(raw_match).timezone
+
+
+def test_tournament_sponsors():
+    tournament = lpdb.Tournament({"sponsors": '{"sponsor1": "Sponsor"}'})
+    assert tournament.sponsors == {"sponsor1": "Sponsor"}
+    assert tournament.sponsors is tournament.sponsors
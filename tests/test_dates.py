@@ -0,0 +1,47 @@
+import datetime
+
+import pytest
+
+from lpdb_python.dates import parse_date, parse_dates, parse_datetimes, to_datetime64
+
+VALUES = [
+    "2025-11-09 07:20:00",
+    "0000-01-01 00:00:00",
+    "0000-00-00",
+    "",
+    None,
+    "invalid",
+]
+
+
+def test_parse_datetimes():
+    assert parse_datetimes(VALUES) == [
+        datetime.datetime(2025, 11, 9, 7, 20, tzinfo=datetime.UTC),
+        None,
+        None,
+        None,
+        None,
+        None,
+    ]
+
+
+def test_parse_dates():
+    assert parse_dates(["2025-11-09", "2025-11-09 07:20:00", "0000-01-01"]) == [
+        datetime.date(2025, 11, 9),
+        datetime.date(2025, 11, 9),
+        None,
+    ]
+    assert parse_date("invalid") is None
+
+
+def test_to_datetime64():
+    np = pytest.importorskip("numpy")
+
+    parsed = to_datetime64(VALUES)
+    assert parsed.dtype == np.dtype("datetime64[s]")
+    assert parsed[0] == np.datetime64("2025-11-09T07:20:00")
+    assert np.isnat(parsed[1:]).all()
+
+    parsed_dates = to_datetime64(["2025-11-09", "0000-01-01"], "D")
+    assert parsed_dates[0] == np.datetime64("2025-11-09")
+    assert np.isnat(parsed_dates[1])
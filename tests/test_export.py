@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from lpdb_python.export import export_parquet, get_schema  # noqa: E402
+
+PAGES = [
+    [
+        {
+            "objectname": "a",
+            "date": "2025-01-02 03:04:05",
+            "bestof": 3,
+            "finished": 1,
+            "prizemoney": "",
+            "extradata": {"timezoneoffset": "+8:00"},
+        },
+    ],
+    [
+        {
+            "objectname": "b",
+            "date": "0000-01-01 00:00:00",
+            "bestof": "",
+            "finished": 0,
+            "prizemoney": 12.5,
+            "extradata": [],
+        },
+    ],
+]
+
+
+class PagedSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def iter_pages(self, lpdb_datatype, wiki, **kwargs):
+        self.requests.append((lpdb_datatype, wiki, kwargs))
+        yield from self.pages
+
+
+def test_schema():
+    schema = get_schema("tournament", ["startdate", "prizepool", "sponsors"])
+    assert schema.field("startdate").type == pa.date32()
+    assert schema.field("sponsors").type == pa.string()
+
+    with pytest.raises(ValueError):
+        get_schema("matches", [])
+
+
+def test_export_parquet(tmp_path):
+    path = tmp_path / "matches.parquet"
+    rows = export_parquet(PagedSession(PAGES), path, "match", "leagueoflegends")
+
+    table = pq.read_table(path)
+    assert rows == table.num_rows == 2
+    assert pq.ParquetFile(path).metadata.num_row_groups == 2
+    assert table.schema.field("bestof").type == pa.int64()
+    assert table.schema.field("prizemoney").type == pa.float64()
+    assert table.to_pylist() == [
+        {
+            "objectname": "a",
+            "date": datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+            "bestof": 3,
+            "finished": True,
+            "prizemoney": None,
+            "extradata": '{"timezoneoffset":"+8:00"}',
+        },
+        {
+            "objectname": "b",
+            "date": None,
+            "bestof": None,
+            "finished": False,
+            "prizemoney": 12.5,
+            "extradata": "[]",
+        },
+    ]
+
+
+def test_export_empty_query(tmp_path):
+    path = tmp_path / "matches.parquet"
+    rows = export_parquet(
+        PagedSession([]), path, "match", "leagueoflegends", query="match2id, date"
+    )
+
+    assert rows == 0
+    assert pq.read_table(path).schema.names == ["match2id", "date"]
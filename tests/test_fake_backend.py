@@ -0,0 +1,229 @@
+import time
+
+import pytest
+
+import lpdb_python as lpdb
+from lpdb_python.async_session import AsyncLpdbSession
+from lpdb_python.testing import AsyncFakeTransport, FakeLpdbBackend, FakeTransport
+
+WIKIS = ["leagueoflegends", "valorant"]
+
+
+def make_matches(wiki: str, count: int) -> list[dict]:
+    return [
+        {
+            "objectname": f"{wiki}_{i:04d}",
+            "match2id": f"M{i:04d}",
+            "date": f"2025-01-{i % 28 + 1:02d} 12:00:00",
+            "bestof": i % 5 + 1,
+            "liquipediatier": i % 3 + 1,
+            "parent": f"Tournament/{i // 10}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def backend() -> FakeLpdbBackend:
+    backend = FakeLpdbBackend()
+    for wiki in WIKIS:
+        backend.add_results("match", wiki, make_matches(wiki, 250))
+    backend.add_team_templates(
+        "leagueoflegends",
+        {f"team{i}": {"template": f"team{i}", "name": f"Team {i}"} for i in range(12)},
+    )
+    return backend
+
+
+@pytest.fixture
+def session(backend: FakeLpdbBackend) -> lpdb.LpdbSession:
+    return lpdb.LpdbSession(
+        "",
+        transport=FakeTransport(backend),
+        retry_policy=lpdb.RetryPolicy(base_delay=0, jitter=0),
+    )
+
+
+def test_conditions(session: lpdb.LpdbSession):
+    results = session.make_request(
+        "match",
+        "leagueoflegends",
+        conditions="[[bestof::>3]] AND ([[liquipediatier::1]] OR [[parent::Tournament/0]]) AND [[match2id::!M0003]]",
+        limit=1000,
+    )
+    assert len(results) != 0
+    for result in results:
+        assert result["bestof"] > 3
+        assert result["liquipediatier"] == 1 or result["parent"] == "Tournament/0"
+        assert result["match2id"] != "M0003"
+
+
+def test_query_order_and_pagination(session: lpdb.LpdbSession):
+    results = session.make_request(
+        "match",
+        WIKIS,
+        query=["objectname", "date"],
+        order=[("date", "desc"), ("objectname", "asc")],
+        limit=10,
+        offset=5,
+    )
+    assert [list(result.keys()) for result in results] == [["objectname", "date"]] * 10
+    everything = session.make_request(
+        "match", WIKIS, order=[("date", "desc"), ("objectname", "asc")], limit=1000
+    )
+    assert [r["objectname"] for r in results] == [
+        r["objectname"] for r in everything[5:15]
+    ]
+
+
+def test_count_and_groupby(session: lpdb.LpdbSession):
+    assert session.make_count_request("match", "valorant") == 250
+    assert (
+        session.make_count_request(
+            "match", "valorant", conditions="[[liquipediatier::1]]"
+        )
+        == 84
+    )
+    groups = session.make_request(
+        "match",
+        "valorant",
+        query="liquipediatier, count::objectname",
+        groupby=[("liquipediatier", "desc")],
+    )
+    assert groups == [
+        {"liquipediatier": 3, "count_objectname": 83},
+        {"liquipediatier": 2, "count_objectname": 83},
+        {"liquipediatier": 1, "count_objectname": 84},
+    ]
+
+
+def test_invalid_conditions(session: lpdb.LpdbSession):
+    with pytest.raises(lpdb.LpdbError):
+        session.make_request("match", "valorant", conditions="[[bestof::3]] AND (")
+
+
+def test_iteration(session: lpdb.LpdbSession):
+    expected = session.make_request(
+        "match", "valorant", order="objectname asc", limit=1000
+    )
+    assert len(list(session.iter_request("match", "valorant", page_size=40))) == 250
+    assert (
+        list(
+            session.iter_request("match", "valorant", page_size=40, keyset="objectname")
+        )
+        == expected
+    )
+    assert (
+        list(
+            session.stream_request(
+                "match", "valorant", order="objectname asc", limit=1000
+            )
+        )
+        == expected
+    )
+    assert b"".join(session.iter_raw_pages("match", "valorant", page_size=100)) != b""
+
+
+def test_team_templates(session: lpdb.LpdbSession):
+    assert session.get_team_template("leagueoflegends", "team3") == {
+        "template": "team3",
+        "name": "Team 3",
+    }
+    assert session.get_team_template("leagueoflegends", "missing") is None
+    assert session.get_wikis() == set(WIKIS)
+
+
+def test_team_template_list(backend: FakeLpdbBackend, session: lpdb.LpdbSession):
+    backend.team_template_page_size = 5
+    pages = [
+        session.get_team_template_list("leagueoflegends", pagination=pagination)
+        for pagination in range(1, 5)
+    ]
+    assert [len(page) for page in pages] == [5, 5, 2, 0]
+
+
+def test_injected_rate_limit(backend: FakeLpdbBackend, session: lpdb.LpdbSession):
+    backend.inject_rate_limit(2, retry_after=0)
+    assert len(session.make_request("match", "valorant")) == 20
+    assert session.rate_limit_count == 2
+    assert session.retry_count == 2
+    assert len(backend.requests) == 3
+
+    backend.inject_rate_limit(3)
+    with pytest.raises(lpdb.LpdbRateLimitError) as error:
+        session.make_request("match", "valorant", limit=5)
+    assert error.value.wiki == "valorant"
+    assert error.value.table == "match"
+
+
+def test_injected_rate_limit_threads(backend: FakeLpdbBackend):
+    # Any request may receive several of the injected failures in a row
+    session = lpdb.LpdbSession(
+        "",
+        transport=FakeTransport(backend),
+        retry_policy=lpdb.RetryPolicy(base_delay=0, jitter=0, max_attempts=100),
+    )
+    backend.inject_rate_limit(64, retry_after=0)
+    results = session.fetch_many(
+        [
+            lpdb.LpdbRequest("match", "valorant", limit=1, offset=offset)
+            for offset in range(64)
+        ],
+        max_workers=16,
+    )
+    assert len(results) == 64
+    assert session.rate_limit_count == 64
+    assert session.retry_count == 64
+    assert len(backend.requests) == 128
+
+
+def test_injected_http_error(backend: FakeLpdbBackend, session: lpdb.LpdbSession):
+    backend.inject_http_error(503)
+    assert len(session.make_request("match", "valorant")) == 20
+    backend.inject_http_error(404)
+    with pytest.raises(lpdb.LpdbHttpError) as error:
+        session.make_request("match", "valorant")
+    assert error.value.status_code == 404
+
+
+def test_rate_limit(backend: FakeLpdbBackend):
+    backend.rate_limit = 2
+    backend.rate_limit_window = 60
+    session = lpdb.LpdbSession("", transport=FakeTransport(backend))
+    session.make_request("match", "valorant")
+    session.make_request("match", "valorant")
+    session.make_request("match", "leagueoflegends")
+    with pytest.raises(lpdb.LpdbRateLimitError):
+        session.make_request("match", "valorant")
+
+
+def test_latency(backend: FakeLpdbBackend, session: lpdb.LpdbSession):
+    backend.latency = 0.05
+    start = time.perf_counter()
+    results = session.fetch_many(
+        [lpdb.LpdbRequest("match", "valorant", offset=offset) for offset in range(8)],
+        max_workers=8,
+    )
+    assert len(results) == 8
+    assert 0.05 <= time.perf_counter() - start < 0.05 * 8
+
+
+@pytest.mark.asyncio
+async def test_async_session(backend: FakeLpdbBackend):
+    backend.latency = 0.05
+    async with AsyncLpdbSession("", transport=AsyncFakeTransport(backend)) as session:
+        start = time.perf_counter()
+        results = await session.make_fanout_request(
+            "match", WIKIS, limit=30, order=[("date", "desc")]
+        )
+        assert time.perf_counter() - start < 0.05 * len(WIKIS)
+        streamed = [
+            result
+            async for result in session.stream_request("match", "valorant", limit=5)
+        ]
+
+    assert len(results) == 30
+    assert [r["date"] for r in results] == sorted(
+        [r["date"] for r in results], reverse=True
+    )
+    assert len(streamed) == 5
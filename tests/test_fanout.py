@@ -0,0 +1,45 @@
+from lpdb_python.session import AbstractLpdbSession
+
+
+def test_parse_order():
+    assert AbstractLpdbSession._parse_order("date desc, match2id") == [
+        ("date", "desc"),
+        ("match2id", "asc"),
+    ]
+    assert AbstractLpdbSession._parse_order([("date", "desc")]) == [("date", "desc")]
+
+
+def test_merge_results_ordered():
+    results = [
+        [
+            {"wiki": "dota2", "date": "2025-03-01", "match2id": "b"},
+            {"wiki": "dota2", "date": "2025-01-01", "match2id": "a"},
+        ],
+        [
+            {"wiki": "valorant", "date": "2025-02-01", "match2id": "c"},
+            {"wiki": "valorant", "date": "2025-01-01", "match2id": "b"},
+        ],
+        [],
+    ]
+    merged = AbstractLpdbSession._merge_results(
+        results, [("date", "desc"), ("match2id", "asc")], limit=3, offset=1
+    )
+    assert [(result["wiki"], result["match2id"]) for result in merged] == [
+        ("valorant", "c"),
+        ("dota2", "a"),
+        ("valorant", "b"),
+    ]
+
+
+def test_merge_results_unordered():
+    results = [[{"wiki": "dota2"}] * 3, [{"wiki": "valorant"}] * 3]
+    merged = AbstractLpdbSession._merge_results(results, None, limit=4, offset=0)
+    assert [result["wiki"] for result in merged] == ["dota2"] * 3 + ["valorant"]
+
+
+def test_merge_results_missing_values():
+    results = [[{"date": None}], [{"date": "2025-01-01"}]]
+    merged = AbstractLpdbSession._merge_results(
+        results, [("date", "asc")], limit=2, offset=0
+    )
+    assert merged == [{"date": None}, {"date": "2025-01-01"}]
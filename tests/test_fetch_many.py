@@ -0,0 +1,24 @@
+import pytest
+
+import lpdb_python as lpdb
+
+
+def test_fetch_many_empty():
+    assert lpdb.LpdbSession("").fetch_many([]) == []
+
+
+def test_fetch_many_raises():
+    session = lpdb.LpdbSession("")
+    with pytest.raises(ValueError):
+        session.fetch_many([lpdb.LpdbRequest("invalid", "leagueoflegends")])
+
+
+def test_fetch_many_return_exceptions():
+    session = lpdb.LpdbSession("")
+    results = session.fetch_many(
+        [lpdb.LpdbRequest("invalid", "leagueoflegends")] * 3,
+        return_exceptions=True,
+    )
+    assert len(results) == 3
+    for result in results:
+        assert isinstance(result, ValueError)
@@ -0,0 +1,63 @@
+import pytest
+
+import lpdb_python as lpdb
+
+from lpdb_python.session import AbstractLpdbSession
+
+
+def test_keyset_conditions_single_key():
+    assert (
+        AbstractLpdbSession._get_keyset_conditions(
+            None, [("match2id", "asc")], {"match2id": "0001_R01-M001"}
+        )
+        == "[[match2id::>0001_R01-M001]]"
+    )
+
+
+def test_keyset_conditions_multiple_keys():
+    conditions = AbstractLpdbSession._get_keyset_conditions(
+        "[[parent::World_Championship/2025]]",
+        [("date", "desc"), ("match2id", "asc")],
+        {"date": "2025-11-09 08:00:00", "match2id": "0001_R01-M001"},
+    )
+    assert conditions == (
+        "([[parent::World_Championship/2025]]) AND ([[date::<2025-11-09 08:00:00]] OR "
+        "([[date::2025-11-09 08:00:00]] AND [[match2id::>0001_R01-M001]]))"
+    )
+
+
+def test_keyset_conditions_missing_key():
+    with pytest.raises(ValueError):
+        AbstractLpdbSession._get_keyset_conditions(
+            None, [("match2id", "asc")], {"pagename": "World_Championship/2025"}
+        )
+
+
+def test_parse_keyset():
+    assert AbstractLpdbSession._parse_keyset("match2id", None, None) == (
+        [("match2id", "asc")],
+        None,
+        [],
+    )
+    assert AbstractLpdbSession._parse_keyset("date desc, match2id", None, None) == (
+        [("date", "desc"), ("match2id", "asc")],
+        None,
+        [],
+    )
+    assert AbstractLpdbSession._parse_keyset(
+        [("date", "desc"), ("match2id", "asc")], None, "match2id, pagename"
+    ) == (
+        [("date", "desc"), ("match2id", "asc")],
+        ["match2id", "pagename", "date"],
+        ["date"],
+    )
+
+
+def test_keyset_with_order():
+    session = lpdb.LpdbSession("")
+    with pytest.raises(ValueError):
+        next(
+            session.iter_pages(
+                "match", "leagueoflegends", keyset="match2id", order="date"
+            )
+        )
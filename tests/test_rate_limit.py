@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+
+import lpdb_python as lpdb
+
+
+def test_burst_is_not_delayed():
+    limiter = lpdb.LpdbRateLimiter(rate=1, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire("leagueoflegends", "match")
+    assert time.monotonic() - start < 0.5
+
+
+def test_acquire_waits_for_token():
+    limiter = lpdb.LpdbRateLimiter(rate=20)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire("leagueoflegends", "match")
+    assert time.monotonic() - start >= 0.15
+
+
+def test_buckets_are_per_wiki_and_table():
+    limiter = lpdb.LpdbRateLimiter(rate=0.1)
+    start = time.monotonic()
+    limiter.acquire("leagueoflegends", "match")
+    limiter.acquire("leagueoflegends", "tournament")
+    limiter.acquire("valorant", "match")
+    assert time.monotonic() - start < 0.5
+
+
+def test_table_rates():
+    limiter = lpdb.LpdbRateLimiter(rate=0.1, table_rates={"match": 20})
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire("leagueoflegends", "match")
+    assert time.monotonic() - start < 0.5
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        lpdb.LpdbRateLimiter(rate=0)
+
+
+def test_acquire_async():
+    limiter = lpdb.LpdbRateLimiter(rate=20)
+
+    async def acquire_all():
+        await asyncio.gather(
+            *[limiter.acquire_async("valorant", "match") for _ in range(5)]
+        )
+
+    start = time.monotonic()
+    asyncio.run(acquire_all())
+    assert time.monotonic() - start >= 0.15
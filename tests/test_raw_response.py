@@ -0,0 +1,36 @@
+import pytest
+
+import lpdb_python as lpdb
+
+
+@pytest.fixture
+def session():
+    with lpdb.LpdbSession("test") as session:
+        yield session
+
+
+def test_body_is_passed_through(session: lpdb.LpdbSession):
+    body = b'{"result":[{"objectname":"a","extradata":{"error":[]}}],"warning":[]}'
+    assert session._check_raw_response(200, body) is body
+
+
+def test_error_is_raised(session: lpdb.LpdbSession):
+    with pytest.raises(lpdb.LpdbError, match="Invalid wiki"):
+        session._check_raw_response(
+            200, b'{"result": [], "error": ["Error: Invalid wiki"]}'
+        )
+    with pytest.raises(lpdb.LpdbRateLimitError):
+        session._check_raw_response(
+            200,
+            b'{"result":[],"error":["API key \\"abc123\\" limits for wiki \\"leagueoflegends\\" and table \\"match\\" exceeded."]}',
+        )
+
+
+def test_warning_is_emitted(session: lpdb.LpdbSession):
+    with pytest.warns(lpdb.LpdbWarning):
+        session._check_raw_response(200, b'{"result":[],"warning":["Deprecated"]}')
+
+
+def test_http_error(session: lpdb.LpdbSession):
+    with pytest.raises(lpdb.LpdbHttpError):
+        session._check_raw_response(503, b"<html>busy</html>")
@@ -0,0 +1,84 @@
+import datetime
+from email.utils import format_datetime
+
+import pytest
+
+import lpdb_python as lpdb
+from lpdb_python.async_session import AsyncLpdbSession
+from lpdb_python.testing import AsyncFakeTransport, FakeLpdbBackend, FakeTransport
+
+
+def test_exponential_delay():
+    policy = lpdb.RetryPolicy(base_delay=0.5, max_delay=3, jitter=0)
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [0.5, 1, 2, 3]
+
+
+def test_jitter_stays_within_delay():
+    policy = lpdb.RetryPolicy(base_delay=1, jitter=1)
+    for _ in range(100):
+        assert 0 <= policy.get_delay(2) <= 2
+
+
+def test_retry_after():
+    policy = lpdb.RetryPolicy(base_delay=1, jitter=0)
+    assert policy.get_delay(1, "10") == 10
+    assert policy.get_delay(1, "0") == 1
+
+    retry_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=30)
+    assert 20 < policy.get_delay(1, format_datetime(retry_at, usegmt=True)) <= 30
+
+    ignoring_policy = lpdb.RetryPolicy(
+        base_delay=1, jitter=0, respect_retry_after=False
+    )
+    assert ignoring_policy.get_delay(1, "10") == 1
+
+
+def test_should_retry():
+    policy = lpdb.RetryPolicy()
+    assert policy.should_retry(lpdb.LpdbRateLimitError("leagueoflegends", "match"))
+    assert policy.should_retry(lpdb.LpdbHttpError(503))
+    assert not policy.should_retry(lpdb.LpdbHttpError(404))
+    assert not policy.should_retry(lpdb.LpdbError("Invalid query"))
+
+    connection_policy = lpdb.RetryPolicy(retry_on=(ConnectionError,))
+    assert connection_policy.should_retry(ConnectionResetError())
+    assert not connection_policy.should_retry(
+        lpdb.LpdbRateLimitError("leagueoflegends", "match")
+    )
+
+
+def test_http_error_non_standard_status():
+    error = lpdb.LpdbHttpError(520)
+    assert error.status_code == 520
+    assert "520" in str(error)
+
+
+@pytest.fixture
+def backend() -> FakeLpdbBackend:
+    backend = FakeLpdbBackend()
+    backend.add_results("match", "leagueoflegends", [{"match2id": "0001_R01-M001"}])
+    backend.inject_http_error(520)
+    return backend
+
+
+def test_retry_non_standard_status(backend: FakeLpdbBackend):
+    session = lpdb.LpdbSession(
+        "",
+        retry_policy=lpdb.RetryPolicy(base_delay=0, retry_statuses=frozenset({520})),
+        transport=FakeTransport(backend),
+    )
+    assert len(session.make_request("match", "leagueoflegends")) == 1
+    assert len(backend.requests) == 2
+    assert session.retry_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retry_non_standard_status(backend: FakeLpdbBackend):
+    async with AsyncLpdbSession(
+        "",
+        retry_policy=lpdb.RetryPolicy(base_delay=0, retry_statuses=frozenset({520})),
+        transport=AsyncFakeTransport(backend),
+    ) as session:
+        assert len(await session.make_request("match", "leagueoflegends")) == 1
+    assert len(backend.requests) == 2
+    assert session.retry_count == 1
@@ -1,17 +1,47 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 import lpdb_python as lpdb
+from lpdb_python.testing import FakeLpdbBackend, FakeTransport
 
 KEY = os.getenv("API_KEY")
 
+WORLDS = "[[parent::World_Championship/2025]]"
+
 
 @pytest.fixture
 def session() -> lpdb.LpdbSession:
     return lpdb.LpdbSession(KEY)
 
 
+@pytest.fixture
+def backend() -> FakeLpdbBackend:
+    backend = FakeLpdbBackend()
+    for wiki in ("leagueoflegends", "valorant", "dota2"):
+        backend.add_results(
+            "match",
+            wiki,
+            [
+                {
+                    "match2id": f"{i:04d}_R01-M001",
+                    "date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 12:00:00",
+                    "parent": "World_Championship/2025"
+                    if i % 3 != 0
+                    else "Mid-Season_Invitational/2025",
+                }
+                for i in range(300)
+            ],
+        )
+    return backend
+
+
+@pytest.fixture
+def fake_session(backend: FakeLpdbBackend) -> lpdb.LpdbSession:
+    return lpdb.LpdbSession("", transport=FakeTransport(backend))
+
+
 def test_get_wikis(session: lpdb.LpdbSession):
     wikis = session.get_wikis()
     assert isinstance(wikis, set)
@@ -25,6 +55,12 @@ def test_get_wikis(session: lpdb.LpdbSession):
     }.issubset(wikis)
 
 
+def test_fetch_wikis():
+    assert {"dota2", "valorant", "leagueoflegends"}.issubset(
+        lpdb.LpdbSession.fetch_wikis()
+    )
+
+
 def test_make_request_invalid_key():
     session = lpdb.LpdbSession("some_random_gibberish")
     with pytest.raises(lpdb.LpdbError):
@@ -98,3 +134,275 @@ def test_get_team_templates(session: lpdb.LpdbSession):
     assert isinstance(templates, list)
     for template in templates:
         assert isinstance(template["page"], str)
+
+
+def test_iter_request(backend: FakeLpdbBackend, fake_session: lpdb.LpdbSession):
+    responses = fake_session.make_request(
+        "match",
+        "leagueoflegends",
+        conditions=WORLDS,
+        order=[("match2id", "asc")],
+        limit=1000,
+    )
+    backend.requests.clear()
+
+    iterated = list(
+        fake_session.iter_request(
+            "match",
+            "leagueoflegends",
+            page_size=50,
+            conditions=WORLDS,
+            order=[("match2id", "asc")],
+        )
+    )
+
+    assert [r["match2id"] for r in iterated] == [r["match2id"] for r in responses]
+    # 200 results in 4 full pages, and an empty page ending the iteration
+    assert [params["offset"] for _, params in backend.requests] == [
+        0,
+        50,
+        100,
+        150,
+        200,
+    ]
+
+
+def test_stream_request(backend: FakeLpdbBackend, fake_session: lpdb.LpdbSession):
+    responses = fake_session.make_request(
+        "match",
+        "leagueoflegends",
+        conditions=WORLDS,
+        order=[("match2id", "asc")],
+        limit=1000,
+    )
+    backend.requests.clear()
+
+    streamed = list(
+        fake_session.stream_request(
+            "match",
+            "leagueoflegends",
+            conditions=WORLDS,
+            order=[("match2id", "asc")],
+            limit=1000,
+        )
+    )
+
+    assert streamed == responses
+    assert len(backend.requests) == 1
+
+
+def test_iter_pages(backend: FakeLpdbBackend, fake_session: lpdb.LpdbSession):
+    pages = list(
+        fake_session.iter_pages(
+            "match",
+            "leagueoflegends",
+            page_size=60,
+            conditions=WORLDS,
+            order=[("match2id", "asc")],
+        )
+    )
+
+    assert [len(page) for page in pages] == [60, 60, 60, 20]
+    assert len(backend.requests) == 4
+
+
+def test_iter_request_keyset(backend: FakeLpdbBackend, fake_session: lpdb.LpdbSession):
+    responses = fake_session.make_request(
+        "match",
+        "leagueoflegends",
+        conditions=WORLDS,
+        order=[("match2id", "asc")],
+        limit=1000,
+    )
+    backend.requests.clear()
+
+    iterated = list(
+        fake_session.iter_request(
+            "match",
+            "leagueoflegends",
+            page_size=50,
+            conditions=WORLDS,
+            keyset="match2id",
+        )
+    )
+
+    assert [r["match2id"] for r in iterated] == [r["match2id"] for r in responses]
+    assert len(backend.requests) == 5
+    for i, (_, params) in enumerate(backend.requests):
+        assert params["offset"] == 0
+        assert params["order"] == "match2id asc"
+        if i != 0:
+            last = responses[i * 50 - 1]["match2id"]
+            assert params["conditions"] == f"({WORLDS}) AND ([[match2id::>{last}]])"
+
+
+def test_iter_request_keyset_query(fake_session: lpdb.LpdbSession):
+    iterated = list(
+        fake_session.iter_request(
+            "match",
+            "leagueoflegends",
+            page_size=50,
+            conditions=WORLDS,
+            query="parent",
+            keyset="date desc, match2id",
+        )
+    )
+
+    assert len(iterated) == 200
+    for response in iterated:
+        assert set(response) == {"parent"}
+
+
+def test_fetch_many(backend: FakeLpdbBackend):
+    session = lpdb.LpdbSession("", transport=FakeTransport(backend))
+    session.warmup(16)
+    lpdb_requests = [
+        lpdb.LpdbRequest(
+            "match",
+            "leagueoflegends",
+            limit=10,
+            offset=offset,
+            conditions=WORLDS,
+            order=[("match2id", "asc")],
+        )
+        for offset in range(0, 50, 10)
+    ]
+    responses = session.make_request(
+        "match",
+        "leagueoflegends",
+        limit=50,
+        conditions=WORLDS,
+        order=[("match2id", "asc")],
+    )
+    backend.requests.clear()
+
+    results = session.fetch_many(lpdb_requests, max_workers=16)
+
+    assert [r["match2id"] for result in results for r in result] == [
+        r["match2id"] for r in responses
+    ]
+    assert sorted(params["offset"] for _, params in backend.requests) == [
+        0,
+        10,
+        20,
+        30,
+        40,
+    ]
+
+
+def test_make_fanout_request(backend: FakeLpdbBackend, fake_session: lpdb.LpdbSession):
+    wikis = ["leagueoflegends", "valorant", "dota2"]
+    order = [("date", "desc"), ("match2id", "asc")]
+    responses = fake_session.make_fanout_request(
+        "match", wikis, limit=50, query="match2id, date", order=order
+    )
+
+    assert len(responses) == 50
+    keys = [(r["date"], r["match2id"]) for r in responses]
+    assert keys == sorted(
+        sorted(keys, key=lambda k: k[1]), key=lambda k: k[0], reverse=True
+    )
+    assert sorted(params["wiki"] for _, params in backend.requests) == sorted(wikis)
+    for _, params in backend.requests:
+        assert params["limit"] == 50
+        assert params["query"] == "match2id, date"
+    for wiki in wikis:
+        latest = fake_session.make_request(
+            "match", wiki, limit=1, query="match2id, date", order=order
+        )
+        assert latest[0]["date"] <= responses[0]["date"]
+
+
+def test_make_fanout_request_query(
+    backend: FakeLpdbBackend, fake_session: lpdb.LpdbSession
+):
+    responses = fake_session.make_fanout_request(
+        "match",
+        ["leagueoflegends", "valorant", "dota2"],
+        limit=50,
+        query="match2id",
+        order="date desc",
+    )
+
+    assert len(responses) == 50
+    for response in responses:
+        assert set(response) == {"match2id"}
+    for _, params in backend.requests:
+        assert params["query"] == "match2id, date"
+
+
+def test_coalesce_requests():
+    backend = FakeLpdbBackend(latency=0.05)
+    backend.add_results(
+        "match",
+        "leagueoflegends",
+        [{"match2id": "0001_R01-M001", "parent": "World_Championship/2025"}],
+    )
+    session = lpdb.LpdbSession(
+        "", coalesce_requests=True, transport=FakeTransport(backend)
+    )
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses = list(
+            executor.map(
+                lambda _: session.make_request(
+                    "match", "leagueoflegends", conditions=WORLDS
+                ),
+                range(5),
+            )
+        )
+
+    assert len(backend.requests) == 1
+    assert [r["match2id"] for r in responses[0]] == ["0001_R01-M001"]
+    for response in responses:
+        assert response is responses[0]
+
+
+def test_cache_base_url(backend: FakeLpdbBackend):
+    cache = lpdb.MemoryCache()
+    session = lpdb.LpdbSession("", cache=cache, transport=FakeTransport(backend))
+    mirror = lpdb.LpdbSession(
+        "",
+        base_url="https://mirror.example.com/api/v3/",
+        cache=cache,
+        transport=FakeTransport(backend),
+    )
+    session.make_request("match", "leagueoflegends", limit=5)
+    session.make_request("match", "leagueoflegends", limit=5)
+    assert len(backend.requests) == 1
+    mirror.make_request("match", "leagueoflegends", limit=5)
+    assert len(backend.requests) == 2
+
+
+def test_get_wikis_cached(backend: FakeLpdbBackend, tmp_path):
+    wikis_cache_path = tmp_path / "wikis.json"
+    session = lpdb.LpdbSession(
+        "", wikis_cache_path=wikis_cache_path, transport=FakeTransport(backend)
+    )
+    wikis = session.get_wikis()
+    assert wikis == {"leagueoflegends", "valorant", "dota2"}
+    assert wikis_cache_path.exists()
+    assert session.get_wikis() == wikis
+
+    other_session = lpdb.LpdbSession(
+        "", wikis_cache_path=wikis_cache_path, transport=FakeTransport(backend)
+    )
+    assert other_session.get_wikis() == wikis
+    assert len(backend.requests) == 1
+
+
+def test_json_loads(backend: FakeLpdbBackend):
+    decoded = []
+
+    def json_loads(data: bytes):
+        decoded.append(data)
+        return {"result": [], "error": ["Error: Invalid API key"]}
+
+    session = lpdb.LpdbSession(
+        "some_random_gibberish",
+        json_loads=json_loads,
+        transport=FakeTransport(backend),
+    )
+    with pytest.raises(lpdb.LpdbError):
+        session.make_request("match", "leagueoflegends")
+    assert len(decoded) == 1
+    assert len(backend.requests) == 1
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from lpdb_python.streaming import ResultStreamParser
+
+RESPONSE = {
+    "result": [
+        {"objectname": "a", "prizemoney": 12345.5, "extradata": {"note": "ü,]}"}},
+        {"objectname": "b", "prizemoney": 0, "extradata": []},
+    ],
+    "error": [],
+    "warning": ["Warning: deprecated"],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_feed_chunks(chunk_size: int):
+    body = json.dumps(RESPONSE, ensure_ascii=False).encode()
+    parser = ResultStreamParser()
+    rows = []
+    for i in range(0, len(body), chunk_size):
+        rows.extend(parser.feed(body[i : i + chunk_size]))
+    assert rows == RESPONSE["result"]
+    assert parser.close() == {**RESPONSE, "result": []}
+
+
+def test_errors_before_result():
+    parser = ResultStreamParser()
+    parser.feed(b'{"error": ["Error: Invalid wiki"], "result": [{"a"')
+    assert parser.errors == ["Error: Invalid wiki"]
+
+
+def test_incomplete_body():
+    parser = ResultStreamParser()
+    assert parser.feed(b'{"result": [{"a": 1}, {"b"') == [{"a": 1}]
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_invalid_body():
+    parser = ResultStreamParser()
+    with pytest.raises(ValueError):
+        parser.feed(b"<html></html>")
@@ -0,0 +1,160 @@
+import datetime
+import json
+import os
+
+import pytest
+
+import lpdb_python as lpdb
+from lpdb_python.testing import FakeLpdbBackend, FakeTransport
+
+
+@pytest.fixture
+def match_data() -> lpdb.Match:
+    rootdir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(rootdir, "data/sample_match_data.json")) as input_file:
+        return lpdb.Match(json.load(input_file))
+
+
+@pytest.fixture
+def backend() -> FakeLpdbBackend:
+    backend = FakeLpdbBackend(team_template_page_size=2)
+    backend.add_team_templates(
+        "leagueoflegends",
+        {
+            template: {"template": template, "page": page}
+            for template, page in [
+                ("t1", "T1"),
+                ("gen.g", "Gen.G"),
+                ("hanwha life esports", "Hanwha Life Esports"),
+                ("bilibili gaming", "Bilibili Gaming"),
+                ("top esports", "Top Esports"),
+            ]
+        },
+    )
+    return backend
+
+
+@pytest.fixture
+def resolver(backend: FakeLpdbBackend) -> lpdb.TeamTemplateResolver:
+    return lpdb.TeamTemplateResolver(
+        lpdb.LpdbSession("", transport=FakeTransport(backend)), "leagueoflegends"
+    )
+
+
+def test_resolve(backend: FakeLpdbBackend, resolver: lpdb.TeamTemplateResolver):
+    resolved = resolver.resolve(["t1", "T1", "this template does not exist"])
+    assert resolved["t1"]["page"] == "T1"
+    assert resolved["T1"] is resolved["t1"]
+    assert resolved["this template does not exist"] is None
+    # 3 pages of team templates, and an empty page ending the list
+    assert [params["pagination"] for _, params in backend.requests] == [1, 2, 3, 4]
+
+    assert resolver.get("gen.g")["page"] == "Gen.G"
+    assert len(backend.requests) == 4
+
+
+def test_resolve_with_date(
+    backend: FakeLpdbBackend, resolver: lpdb.TeamTemplateResolver
+):
+    query = ("t1", datetime.date(2025, 11, 9))
+    resolved = resolver.resolve([query, query])
+    assert resolved[query]["page"] == "T1"
+    assert resolver.get("t1", datetime.date(2025, 11, 9)) is resolved[query]
+    assert backend.requests == [
+        (
+            "teamtemplate",
+            {"wiki": "leagueoflegends", "template": "t1", "date": "2025-11-09"},
+        )
+    ]
+
+
+def test_index_intervals():
+    index = lpdb.TeamTemplateIndex()
+    old = {"template": "t1 2013", "page": "T1"}
+    new = {"template": "t1 2019", "page": "T1"}
+    index.observe("leagueoflegends", "t1", datetime.date(2015, 1, 1), old)
+    index.observe("leagueoflegends", "t1", datetime.date(2018, 1, 1), old)
+    index.observe("leagueoflegends", "T1", datetime.date(2020, 1, 1), new)
+
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2016, 6, 1)) == (
+        True,
+        old,
+    )
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2020, 1, 1)) == (
+        True,
+        new,
+    )
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2019, 1, 1)) == (
+        False,
+        None,
+    )
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2014, 1, 1))[0] is False
+    assert index.lookup("valorant", "t1", datetime.date(2016, 6, 1))[0] is False
+
+
+def test_index_split_interval():
+    index = lpdb.TeamTemplateIndex()
+    old = {"template": "t1 2013", "page": "T1"}
+    new = {"template": "t1 2019", "page": "T1"}
+    index.observe("leagueoflegends", "t1", datetime.date(2015, 1, 1), old)
+    index.observe("leagueoflegends", "t1", datetime.date(2022, 1, 1), old)
+    index.observe("leagueoflegends", "t1", datetime.date(2020, 1, 1), new)
+
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2019, 12, 31)) == (
+        True,
+        old,
+    )
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2020, 1, 1)) == (
+        True,
+        new,
+    )
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2021, 6, 1)) == (
+        True,
+        old,
+    )
+
+    index.observe("leagueoflegends", "t1", datetime.date(2015, 1, 1), new)
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2015, 1, 1)) == (
+        True,
+        new,
+    )
+    assert index.lookup("leagueoflegends", "t1", datetime.date(2015, 1, 2)) == (
+        True,
+        old,
+    )
+
+
+def test_index_missing_template():
+    index = lpdb.TeamTemplateIndex()
+    index.observe("leagueoflegends", "nonexistent", datetime.date(2020, 1, 1), None)
+    assert index.lookup(
+        "leagueoflegends", "nonexistent", datetime.date(2020, 1, 1)
+    ) == (True, None)
+
+
+def test_index_persistence(tmp_path):
+    path = tmp_path / "index.json"
+    index = lpdb.TeamTemplateIndex(path)
+    index.observe(
+        "leagueoflegends", "t1", datetime.date(2020, 1, 1), {"template": "t1 2019"}
+    )
+    index.observe(
+        "leagueoflegends", "t1", datetime.date(2021, 1, 1), {"template": "t1 2019"}
+    )
+    index.save()
+
+    loaded = lpdb.TeamTemplateIndex(path)
+    assert loaded.lookup("leagueoflegends", "t1", datetime.date(2020, 6, 1)) == (
+        True,
+        {"template": "t1 2019"},
+    )
+
+
+def test_index_observe_match(match_data: lpdb.Match):
+    index = lpdb.TeamTemplateIndex()
+    index.observe_match(match_data)
+    found, team_template = index.lookup(
+        "leagueoflegends", "kt rolster 2021", datetime.date(2025, 11, 9)
+    )
+    assert found
+    assert team_template["template"] == "kt rolster 2021"
@@ -0,0 +1,50 @@
+import pytest
+
+import lpdb_python as lpdb
+from lpdb_python.async_session import AsyncLpdbSession
+
+
+def test_default_config():
+    config = lpdb.TransportConfig()
+    assert config.pool_maxsize is None
+    assert config.keepalive
+
+
+@pytest.mark.parametrize("name", ["pool_maxsize", "pool_maxsize_per_host"])
+def test_invalid_pool_size(name: str):
+    with pytest.raises(ValueError):
+        lpdb.TransportConfig(**{name: 0})
+
+
+@pytest.mark.asyncio
+async def test_async_session_accepts_config():
+    async with AsyncLpdbSession(
+        "",
+        transport_config=lpdb.TransportConfig(
+            pool_maxsize=8,
+            pool_maxsize_per_host=4,
+            keepalive_timeout=30,
+            dns_cache_ttl=None,
+        ),
+    ):
+        pass
+
+
+def test_session_accepts_config():
+    with lpdb.LpdbSession(
+        "", transport_config=lpdb.TransportConfig(pool_maxsize=8, pool_block=True)
+    ):
+        pass
+
+
+@pytest.mark.parametrize("connections", [0, -1])
+def test_session_warmup_no_connections(connections: int):
+    with lpdb.LpdbSession("") as session:
+        session.warmup(connections)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("connections", [0, -1])
+async def test_async_session_warmup_no_connections(connections: int):
+    async with AsyncLpdbSession("") as session:
+        await session.warmup(connections)